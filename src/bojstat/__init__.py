@@ -1,6 +1,7 @@
 """bojstat 公開API。"""
 
-from bojstat.client import AsyncBojClient, BojClient
+from typing import TYPE_CHECKING, Any
+
 from bojstat.db_catalog import get_db_info, list_dbs
 from bojstat.enums import (
     CacheMode,
@@ -29,6 +30,9 @@ from bojstat.errors import (
 )
 from bojstat.models import MetadataFrame, TimeSeriesFrame
 
+if TYPE_CHECKING:
+    from bojstat.client import AsyncBojClient, BojClient
+
 __all__ = [
     "AsyncBojClient",
     "BojApiError",
@@ -58,3 +62,12 @@ __all__ = [
     "get_db_info",
     "list_dbs",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # クライアントはhttpxを読み込むため、CLIの--help等で不要な起動コストを避けて遅延読み込みする。
+    if name in {"AsyncBojClient", "BojClient"}:
+        from bojstat import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module 'bojstat' has no attribute {name!r}")
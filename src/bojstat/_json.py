@@ -0,0 +1,64 @@
+"""JSON直列化の共通処理。
+
+orjson がインストールされていれば利用し、なければ標準ライブラリへフォールバックする。
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 任意依存
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """オブジェクトをUTF-8のJSONバイト列へ変換する。
+
+    Args:
+        obj: 直列化対象。
+        indent: 2スペースで整形するか。
+        sort_keys: キーを整列するか。
+        default: 直列化できない値の変換関数。
+
+    Returns:
+        JSONバイト列。
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    text = json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+    )
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """JSONバイト列または文字列を復元する。
+
+    Raises:
+        json.JSONDecodeError: JSONとして不正な場合。
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
-import json
 import os
-import tempfile
+import struct
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from threading import Lock
+from threading import Lock, get_ident
 from typing import Any
 
+from bojstat import _json
 from bojstat.enums import CacheMode
 
+_LOCK_STRIPES = 64
+_MEMO_MAX_ENTRIES = 256
+# メモ全体で保持する本文バイト数の上限。これを超える単一エントリはメモしない。
+_MEMO_MAX_BYTES = 32 * 1024 * 1024
+
+# エントリ先頭の固定長ヘッダ: マジック(4) + created_at(double) + complete(1) + 予約(3)。
+# stale/incomplete 判定に本文JSONの復元を要しないよう、本文とは分けて保持する。
+_HEADER = struct.Struct("<4sd?3x")
+_MAGIC = b"BJC1"
+
+
+@lru_cache(maxsize=1024)
+def _key_digest(key: str) -> str:
+    """キー文字列からファイル名用ダイジェストを求める。
+
+    SHA-256の先頭128bitをbase32化した26文字を用い、パス長を抑える。
+    get/put で同じキーが繰り返し渡されるため、計算結果を再利用する。
+    """
+
+    digest = hashlib.sha256(key.encode("utf-8"), usedforsecurity=False).digest()[:16]
+    return base64.b32encode(digest).rstrip(b"=").decode("ascii").lower()
+
 
 @dataclass(slots=True)
 class CacheHit:
@@ -28,20 +53,80 @@ class CacheHit:
     stale: bool
 
 
+def _stale_hit(created_at: float, complete: bool) -> CacheHit:
+    return CacheHit(payload={"created_at": created_at, "complete": complete}, stale=True)
+
+
 class FileCache:
-    """JSONファイルベースキャッシュ。"""
+    """ファイルベースキャッシュ。
+
+    各エントリは固定長ヘッダとJSON本文からなる。
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path | None,
+        ttl_seconds: int,
+        fast_write: bool = False,
+    ) -> None:
+        """キャッシュを初期化する。
+
+        Args:
+            cache_dir: キャッシュディレクトリ。Noneなら無効。
+            ttl_seconds: TTL秒。
+            fast_write: 一時ファイルを介さず直接書き込むか。
+                同時に複数プロセスが書き込む環境では安全でない。
+        """
 
-    def __init__(self, *, cache_dir: Path | None, ttl_seconds: int) -> None:
         self._cache_dir = cache_dir
         self._ttl_seconds = ttl_seconds
-        self._lock = Lock()
+        self._fast_write = fast_write
+        # 書き込みは一時ファイル→os.replaceで原子的なため、全体ロックは不要。
+        # 同一キーへの同時書き込みの順序だけをキー単位のストライプロックで保つ。
+        self._locks = tuple(Lock() for _ in range(_LOCK_STRIPES))
+        # 同一プロセス内の再読込でディスクI/Oを省くためのLRU。
+        # 値は (created_at, complete, 本文JSONバイト列)。不変のバイト列を保持し、
+        # ヒットの都度復元するため、返却した内容を呼び出し側が変更してもメモは汚れない。
+        self._memo: OrderedDict[str, tuple[float, bool, bytes]] = OrderedDict()
+        self._memo_bytes = 0
+        self._memo_lock = Lock()
         if self._cache_dir is not None:
             self._cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _path_for_key(self, key: str) -> Path:
-        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
-        assert self._cache_dir is not None
-        return self._cache_dir / f"{digest}.json"
+    @staticmethod
+    def _path_for_key(cache_dir: Path, key: str) -> Path:
+        return cache_dir / f"{_key_digest(key)}.cache"
+
+    def _lock_for_key(self, key: str) -> Lock:
+        return self._locks[hash(key) % _LOCK_STRIPES]
+
+    def _memo_get(self, key: str) -> tuple[float, bool, bytes] | None:
+        with self._memo_lock:
+            entry = self._memo.get(key)
+            if entry is not None:
+                self._memo.move_to_end(key)
+            return entry
+
+    def _memo_put(self, key: str, entry: tuple[float, bool, bytes]) -> None:
+        size = len(entry[2])
+        with self._memo_lock:
+            previous = self._memo.pop(key, None)
+            if previous is not None:
+                self._memo_bytes -= len(previous[2])
+            if size > _MEMO_MAX_BYTES:
+                return
+            self._memo[key] = entry
+            self._memo_bytes += size
+            while len(self._memo) > _MEMO_MAX_ENTRIES or self._memo_bytes > _MEMO_MAX_BYTES:
+                _, evicted = self._memo.popitem(last=False)
+                self._memo_bytes -= len(evicted[2])
+
+    def _memo_discard(self, key: str) -> None:
+        with self._memo_lock:
+            entry = self._memo.pop(key, None)
+            if entry is not None:
+                self._memo_bytes -= len(entry[2])
 
     def get(
         self,
@@ -49,6 +134,7 @@ class FileCache:
         key: str,
         mode: CacheMode,
         allow_incomplete: bool = False,
+        memoize: bool = True,
     ) -> CacheHit | None:
         """キャッシュを読み取る。
 
@@ -56,59 +142,116 @@ class FileCache:
             key: キー文字列。
             mode: キャッシュモード。
             allow_incomplete: incompleteエントリの許可。
+            memoize: ディスクから読んだエントリをメモリ上のLRUに保持するか。
 
         Returns:
-            ヒット時の情報。
+            ヒット時の情報。staleなヒットは本文を復元せず、
+            payload は created_at と complete のみを含む。
         """
 
-        if self._cache_dir is None or mode == CacheMode.OFF:
+        # CacheModeはシングルトンのため、StrEnumの__eq__を経由しない同一性比較で判定する。
+        cache_dir = self._cache_dir
+        if cache_dir is None or mode is CacheMode.OFF:
             return None
-        if mode == CacheMode.FORCE_REFRESH:
+        if mode is CacheMode.FORCE_REFRESH:
             return None
 
-        path = self._path_for_key(key)
-        if not path.exists():
-            return None
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            quarantine = path.with_suffix(path.suffix + ".broken")
+        now = time.time()
+        entry = self._memo_get(key)
+        if entry is not None:
+            created_at, complete, data = entry
+            if not allow_incomplete and not complete:
+                return None
+            if (now - created_at) > self._ttl_seconds:
+                self._memo_discard(key)
+                return _stale_hit(created_at, complete)
+            payload = _json.loads(data)
+        else:
+            path = self._path_for_key(cache_dir, key)
+            # exists()による事前statを省き、ファイル不在はopen失敗で判定する。
             try:
-                path.replace(quarantine)
-            except OSError:
-                pass
-            return None
+                if self._fast_write:
+                    # fast_writeの書き込みは原子的でないため、同一プロセス内の書き込み途中の
+                    # ファイルを読んで正常なエントリを隔離しないよう、書き込みと同じロックで読む。
+                    with self._lock_for_key(key):
+                        raw = path.read_bytes()
+                else:
+                    raw = path.read_bytes()
+                magic, created_at, complete = _HEADER.unpack_from(raw)
+                if magic != _MAGIC:
+                    raise ValueError("unknown cache header")
+                if not allow_incomplete and not complete:
+                    return None
+                # 呼び出し側はstaleなヒットを採用しないため、本文の復元もメモへの登録も行わない。
+                if (now - created_at) > self._ttl_seconds:
+                    return _stale_hit(created_at, complete)
+                data = raw[_HEADER.size :]
+                payload = _json.loads(data)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError, struct.error):
+                quarantine = path.with_suffix(path.suffix + ".broken")
+                try:
+                    path.replace(quarantine)
+                except OSError:
+                    pass
+                return None
+            if memoize:
+                self._memo_put(key, (created_at, complete, data))
 
-        if not allow_incomplete and not payload.get("complete", False):
-            return None
+        body = {"created_at": created_at, "complete": complete, "payload": payload}
+        return CacheHit(payload=body, stale=False)
 
-        created_at = float(payload.get("created_at", 0.0))
-        stale = (time.time() - created_at) > self._ttl_seconds
-        return CacheHit(payload=payload, stale=stale)
+    def put(
+        self,
+        *,
+        key: str,
+        payload: dict[str, Any],
+        complete: bool,
+        memoize: bool = True,
+    ) -> None:
+        """キャッシュを書き込む。
 
-    def put(self, *, key: str, payload: dict[str, Any], complete: bool) -> None:
-        """キャッシュを書き込む。"""
+        Args:
+            key: キー文字列。
+            payload: 保存内容。
+            complete: 完全なエントリか。
+            memoize: メモリ上のLRUにも保持するか。再利用の見込みが低い
+                一時的なエントリではFalseにする。
+        """
 
-        if self._cache_dir is None:
+        cache_dir = self._cache_dir
+        if cache_dir is None:
             return
-        path = self._path_for_key(key)
-        body = {
-            "created_at": time.time(),
-            "complete": complete,
-            "payload": payload,
-        }
-        data = json.dumps(body, ensure_ascii=False, separators=(",", ":"))
-
-        with self._lock:
-            fd, tmp_path = tempfile.mkstemp(
-                prefix=path.name,
-                suffix=".tmp",
-                dir=str(self._cache_dir),
-            )
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(data)
-                Path(tmp_path).replace(path)
-            finally:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
+        path = self._path_for_key(cache_dir, key)
+        created_at = time.time()
+        body = _json.dumps(payload)
+        data = _HEADER.pack(_MAGIC, created_at, complete) + body
+
+        with self._lock_for_key(key):
+            if self._fast_write:
+                # 単一書き込み前提の高速経路。途中で失敗した壊れたファイルはget側で隔離される。
+                path.write_bytes(data)
+            else:
+                # 一時ファイル名はプロセスIDとスレッドIDで一意になるため、mkstempの乱数名生成は不要。
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{get_ident()}.tmp")
+                try:
+                    tmp_path.write_bytes(data)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+            if memoize:
+                self._memo_put(key, (created_at, complete, body))
+            else:
+                self._memo_discard(key)
+
+    def delete(self, *, key: str) -> None:
+        """キャッシュエントリを削除する。存在しない場合は何もしない。"""
+
+        cache_dir = self._cache_dir
+        if cache_dir is None:
+            return
+        with self._lock_for_key(key):
+            self._path_for_key(cache_dir, key).unlink(missing_ok=True)
+            self._memo_discard(key)
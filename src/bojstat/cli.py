@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from bojstat import _json
+from bojstat.models import _meta_to_dict
+
+_NESTED_TYPES = (dict, list, tuple)
+
 
 def _require_typer() -> Any:
     try:
@@ -22,11 +26,16 @@ def _normalize_nested_columns_for_parquet(df: Any) -> Any:
 
     columns = list(getattr(df, "columns", []))
     for column in columns:
-        values = list(df[column])
-        if any(isinstance(value, (dict, list, tuple)) for value in values):
+        series = df[column]
+        dtype = getattr(series, "dtype", None)
+        # 数値列などobject以外のdtypeはネスト型セルを持たないため走査しない。
+        if dtype is not None and dtype != object:
+            continue
+        values = list(series)
+        if any(isinstance(value, _NESTED_TYPES) for value in values):
             df[column] = [
-                json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
-                if isinstance(value, (dict, list, tuple))
+                _json.dumps(value, sort_keys=True, default=str).decode("utf-8")
+                if isinstance(value, _NESTED_TYPES)
                 else value
                 for value in values
             ]
@@ -39,11 +48,13 @@ def _dump_frame(frame: Any, out: Path) -> None:
         if hasattr(frame, "to_cache_payload"):
             payload = frame.to_cache_payload()
         else:
+            meta = getattr(frame, "meta", None)
+            # dataclassのままではJSONバックエンドごとに出力形式が変わるため辞書化する。
             payload = {
-                "meta": getattr(frame, "meta", None),
+                "meta": _meta_to_dict(meta) if meta is not None else None,
                 "records": frame.to_long(numeric_mode="string") if hasattr(frame, "to_long") else [],
             }
-        out.write_text(json.dumps(payload, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+        out.write_bytes(_json.dumps(payload, indent=True, default=str))
         return
     if suffix == ".csv":
         df = frame.to_pandas()
@@ -67,8 +78,6 @@ def app_entry() -> None:
     """CLIアプリを起動する。"""
 
     typer = _require_typer()
-    from bojstat import BojClient
-
     app = typer.Typer(no_args_is_help=True)
 
     @app.command("metadata")
@@ -79,6 +88,9 @@ def app_entry() -> None:
     ) -> None:
         """メタデータを取得する。"""
 
+        # --help 表示時にhttpx等の読み込みを避けるため、実行時に読み込む。
+        from bojstat import BojClient
+
         with BojClient(lang=lang) as client:
             frame = client.metadata.get(db=db)
             _dump_frame(frame, out)
@@ -94,6 +106,8 @@ def app_entry() -> None:
     ) -> None:
         """コードAPIで時系列を取得する。"""
 
+        from bojstat import BojClient
+
         with BojClient(lang=lang) as client:
             frame = client.data.get_by_code(
                 db=db,
@@ -115,6 +129,8 @@ def app_entry() -> None:
     ) -> None:
         """階層APIで時系列を取得する。"""
 
+        from bojstat import BojClient
+
         with BojClient(lang=lang) as client:
             frame = client.data.get_by_layer(
                 db=db,
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from enum import StrEnum
+from functools import cache, cached_property
 from pathlib import Path
+from threading import Lock
 from typing import Any
+from weakref import WeakValueDictionary
 
 import httpx
 
@@ -17,6 +21,43 @@ from bojstat.services.metadata import AsyncMetadataService, MetadataService
 from bojstat.validation import normalize_format, normalize_lang, validate_strict_auto_split
 
 
+@cache
+def _coerce_enum[E: StrEnum](enum_cls: type[E], value: E | str) -> E:
+    """列挙型または値文字列を列挙型へ変換する。
+
+    取りうる値が少ないため、変換結果を (列挙型, 値) 単位で再利用する。
+    不正値は例外となりキャッシュされない。
+    """
+
+    return enum_cls(value)
+
+
+# 生存中のクライアントが参照するFileCacheだけを共有する。
+# 全クライアントが破棄されればエントリも消え、メモリ上のLRUを解放する。
+_SHARED_FILE_CACHES: WeakValueDictionary[tuple[str, int, bool], FileCache] = WeakValueDictionary()
+_SHARED_FILE_CACHES_LOCK = Lock()
+
+
+def _file_cache_for(cache_conf: CacheConfig) -> FileCache:
+    """キャッシュ設定に対応するFileCacheを返す。
+
+    同一プロセス内で同じディレクトリ・TTLを指す生存中のクライアント同士は、
+    メモリ上のLRUと書き込みロックを共有するため同じインスタンスを使う。
+    共有は弱参照で保持し、クライアントより長く生き残らない。
+    ディレクトリ未指定時は何も保存しないため共有しない。
+    """
+
+    if cache_conf.dir is None:
+        return FileCache(cache_dir=None, ttl_seconds=cache_conf.ttl_seconds)
+    key = (str(cache_conf.dir.resolve()), cache_conf.ttl_seconds, cache_conf.fast_write)
+    with _SHARED_FILE_CACHES_LOCK:
+        cache = _SHARED_FILE_CACHES.get(key)
+        if cache is None:
+            cache = FileCache(cache_dir=Path(key[0]), ttl_seconds=key[1], fast_write=key[2])
+            _SHARED_FILE_CACHES[key] = cache
+        return cache
+
+
 class BojClient:
     """日本銀行APIの同期クライアント。"""
 
@@ -32,6 +73,7 @@ class BojClient:
         cache_dir: str | Path | None = None,
         cache_mode: CacheMode | str = CacheMode.IF_STALE,
         cache_ttl: int = 24 * 60 * 60,
+        cache_fast_write: bool = False,
         strict_api: bool = True,
         auto_split_codes: bool = False,
         resolve_wildcard: bool = True,
@@ -65,6 +107,8 @@ class BojClient:
             cache_dir: キャッシュディレクトリ。
             cache_mode: キャッシュモード。
             cache_ttl: キャッシュTTL秒。
+            cache_fast_write: キャッシュを一時ファイル経由せず直接書き込むか。
+                単一プロセス利用時に高速だが、同時書き込みには安全でない。
             strict_api: 仕様準拠モード。
             auto_split_codes: コード自動分割有効化。
             resolve_wildcard: ワイルドカード階層の自動解決。
@@ -97,20 +141,10 @@ class BojClient:
 
         lang_norm = normalize_lang(lang)
         format_norm = normalize_format(format)
-        cache_mode_norm = cache_mode if isinstance(cache_mode, CacheMode) else CacheMode(cache_mode)
-        consistency_norm = (
-            consistency_mode
-            if isinstance(consistency_mode, ConsistencyMode)
-            else ConsistencyMode(consistency_mode)
-        )
-        conflict_norm = (
-            conflict_resolution
-            if isinstance(conflict_resolution, ConflictResolution)
-            else ConflictResolution(conflict_resolution)
-        )
-        output_order_norm = (
-            output_order if isinstance(output_order, OutputOrder) else OutputOrder(output_order)
-        )
+        cache_mode_norm = _coerce_enum(CacheMode, cache_mode)
+        consistency_norm = _coerce_enum(ConsistencyMode, consistency_mode)
+        conflict_norm = _coerce_enum(ConflictResolution, conflict_resolution)
+        output_order_norm = _coerce_enum(OutputOrder, output_order)
 
         self._owns_client = http_client is None
         if http_client is None:
@@ -133,6 +167,7 @@ class BojClient:
             mode=cache_mode_norm,
             dir=Path(cache_dir) if cache_dir is not None else None,
             ttl_seconds=cache_ttl,
+            fast_write=cache_fast_write,
         )
         self._config = ClientConfig(
             base_url=base_url,
@@ -161,17 +196,26 @@ class BojClient:
             retry_on_403=retry_on_403,
             retry_on_403_max_attempts=retry_on_403_max_attempts,
         )
-        self._cache = FileCache(cache_dir=cache_conf.dir, ttl_seconds=cache_conf.ttl_seconds)
+        self._cache = _file_cache_for(cache_conf)
         self._limiter = SyncRateLimiter(rate_limit_per_sec=rate_limit_per_sec)
 
-        self.metadata = MetadataService(
+    @cached_property
+    def metadata(self) -> MetadataService:
+        """メタデータAPIサービス（初回アクセス時に生成）。"""
+
+        return MetadataService(
             client=self._http_client,
             config=self._config,
             retry_config=self._retry,
             cache=self._cache,
             limiter=self._limiter,
         )
-        self.data = DataService(
+
+    @cached_property
+    def data(self) -> DataService:
+        """コードAPI・階層APIサービス（初回アクセス時に生成）。"""
+
+        return DataService(
             client=self._http_client,
             config=self._config,
             retry_config=self._retry,
@@ -179,7 +223,12 @@ class BojClient:
             limiter=self._limiter,
             metadata_service=self.metadata,
         )
-        self.errors = ErrorClassifier()
+
+    @cached_property
+    def errors(self) -> ErrorClassifier:
+        """MESSAGEID分類器（初回アクセス時に生成）。"""
+
+        return ErrorClassifier()
 
     def close(self) -> None:
         """内部Clientをクローズする。"""
@@ -210,9 +259,11 @@ class AsyncBojClient:
         format: Format | str = Format.JSON,
         user_agent: str = "bojstat/0.1.0",
         rate_limit_per_sec: float = 1.0,
+        chunk_fetch_concurrency: int = 4,
         cache_dir: str | Path | None = None,
         cache_mode: CacheMode | str = CacheMode.IF_STALE,
         cache_ttl: int = 24 * 60 * 60,
+        cache_fast_write: bool = False,
         strict_api: bool = True,
         auto_split_codes: bool = False,
         resolve_wildcard: bool = True,
@@ -234,9 +285,15 @@ class AsyncBojClient:
         proxy: str | None = None,
         limits: httpx.Limits | None = None,
     ) -> None:
-        """非同期クライアントを初期化する。"""
+        """非同期クライアントを初期化する。
+
+        引数は BojClient と同じ。加えて chunk_fetch_concurrency で、
+        コードAPIの分割チャンクを並行取得する上限を指定できる。
+        """
 
         validate_strict_auto_split(strict_api=strict_api, auto_split_codes=auto_split_codes)
+        if chunk_fetch_concurrency < 1:
+            raise ValueError("chunk_fetch_concurrency は1以上を指定してください。")
         if retry_max_attempts < 1:
             raise ValueError("retry_max_attempts は1以上を指定してください。")
         if retry_transport_max_attempts is not None and retry_transport_max_attempts < 1:
@@ -246,20 +303,10 @@ class AsyncBojClient:
 
         lang_norm = normalize_lang(lang)
         format_norm = normalize_format(format)
-        cache_mode_norm = cache_mode if isinstance(cache_mode, CacheMode) else CacheMode(cache_mode)
-        consistency_norm = (
-            consistency_mode
-            if isinstance(consistency_mode, ConsistencyMode)
-            else ConsistencyMode(consistency_mode)
-        )
-        conflict_norm = (
-            conflict_resolution
-            if isinstance(conflict_resolution, ConflictResolution)
-            else ConflictResolution(conflict_resolution)
-        )
-        output_order_norm = (
-            output_order if isinstance(output_order, OutputOrder) else OutputOrder(output_order)
-        )
+        cache_mode_norm = _coerce_enum(CacheMode, cache_mode)
+        consistency_norm = _coerce_enum(ConsistencyMode, consistency_mode)
+        conflict_norm = _coerce_enum(ConflictResolution, conflict_resolution)
+        output_order_norm = _coerce_enum(OutputOrder, output_order)
 
         self._owns_client = http_client is None
         if http_client is None:
@@ -282,6 +329,7 @@ class AsyncBojClient:
             mode=cache_mode_norm,
             dir=Path(cache_dir) if cache_dir is not None else None,
             ttl_seconds=cache_ttl,
+            fast_write=cache_fast_write,
         )
         self._config = ClientConfig(
             base_url=base_url,
@@ -290,6 +338,7 @@ class AsyncBojClient:
             format=format_norm,
             user_agent=user_agent,
             rate_limit_per_sec=rate_limit_per_sec,
+            chunk_fetch_concurrency=chunk_fetch_concurrency,
             strict_api=strict_api,
             auto_split_codes=auto_split_codes,
             resolve_wildcard=resolve_wildcard,
@@ -310,17 +359,26 @@ class AsyncBojClient:
             retry_on_403=retry_on_403,
             retry_on_403_max_attempts=retry_on_403_max_attempts,
         )
-        self._cache = FileCache(cache_dir=cache_conf.dir, ttl_seconds=cache_conf.ttl_seconds)
+        self._cache = _file_cache_for(cache_conf)
         self._limiter = AsyncRateLimiter(rate_limit_per_sec=rate_limit_per_sec)
 
-        self.metadata = AsyncMetadataService(
+    @cached_property
+    def metadata(self) -> AsyncMetadataService:
+        """メタデータAPIサービス（初回アクセス時に生成）。"""
+
+        return AsyncMetadataService(
             client=self._http_client,
             config=self._config,
             retry_config=self._retry,
             cache=self._cache,
             limiter=self._limiter,
         )
-        self.data = AsyncDataService(
+
+    @cached_property
+    def data(self) -> AsyncDataService:
+        """コードAPI・階層APIサービス（初回アクセス時に生成）。"""
+
+        return AsyncDataService(
             client=self._http_client,
             config=self._config,
             retry_config=self._retry,
@@ -328,7 +386,12 @@ class AsyncBojClient:
             limiter=self._limiter,
             metadata_service=self.metadata,
         )
-        self.errors = ErrorClassifier()
+
+    @cached_property
+    def errors(self) -> ErrorClassifier:
+        """MESSAGEID分類器（初回アクセス時に生成）。"""
+
+        return ErrorClassifier()
 
     async def aclose(self) -> None:
         """内部Clientをクローズする。"""
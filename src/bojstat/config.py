@@ -24,7 +24,7 @@ DEFAULT_BASE_URL = "https://www.stat-search.boj.or.jp/api/v1"
 DEFAULT_USER_AGENT = "bojstat/0.1.0"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """再試行設定。
 
@@ -47,7 +47,7 @@ class RetryConfig:
     retry_on_403_max_attempts: int = 2
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class CacheConfig:
     """キャッシュ設定。
 
@@ -55,6 +55,7 @@ class CacheConfig:
         mode: キャッシュモード。
         dir: キャッシュディレクトリ。
         ttl_seconds: TTL秒。
+        fast_write: 一時ファイルを介さず直接書き込むか。
         publish_window_start_hour: 更新窓開始時刻（JST時）。
         publish_window_start_minute: 更新窓開始時刻（JST分）。
         publish_window_grace_minutes: 更新窓許容分。
@@ -63,12 +64,13 @@ class CacheConfig:
     mode: CacheMode = CacheMode.IF_STALE
     dir: Path | None = None
     ttl_seconds: int = 24 * 60 * 60
+    fast_write: bool = False
     publish_window_start_hour: int = 8
     publish_window_start_minute: int = 50
     publish_window_grace_minutes: int = 90
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ClientConfig:
     """クライアント共通設定。
 
@@ -79,6 +81,7 @@ class ClientConfig:
         format: 出力形式。
         user_agent: User-Agent。
         rate_limit_per_sec: 1秒あたり上限回数。
+        chunk_fetch_concurrency: 非同期コードAPIで並行取得するチャンク数の上限。
         strict_api: 仕様準拠モード。
         auto_split_codes: 自動分割有効化。
         resolve_wildcard: ワイルドカード階層の自動解決。
@@ -97,6 +100,7 @@ class ClientConfig:
     format: Format = Format.JSON
     user_agent: str = DEFAULT_USER_AGENT
     rate_limit_per_sec: float = 1.0
+    chunk_fetch_concurrency: int = 4
     strict_api: bool = True
     auto_split_codes: bool = False
     resolve_wildcard: bool = True
@@ -17,6 +17,10 @@ class Lang(StrEnum):
     EN = "EN"
 
 
+# 値→メンバーの参照表。正規化時に列挙型の呼び出し機構を経由せず解決する。
+LANG_BY_VALUE: dict[str, Lang] = {member.value: member for member in Lang}
+
+
 class Format(StrEnum):
     """API出力形式を表す列挙型。
 
@@ -29,6 +33,9 @@ class Format(StrEnum):
     CSV = "CSV"
 
 
+FORMAT_BY_VALUE: dict[str, Format] = {member.value: member for member in Format}
+
+
 class Frequency(StrEnum):
     """期種を表す列挙型。
 
@@ -53,6 +60,9 @@ class Frequency(StrEnum):
     D = "D"
 
 
+FREQUENCY_BY_VALUE: dict[str, Frequency] = {member.value: member for member in Frequency}
+
+
 class DB(StrEnum):
     """日銀統計DBコードを表す列挙型。
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import random
 import threading
 import time
@@ -15,6 +16,14 @@ import httpx
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 503})
+_RETRYABLE_TRANSPORT_ERRORS = (
+    httpx.TimeoutException,
+    httpx.ConnectError,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
 
 @dataclass(slots=True)
 class WaitDecision:
@@ -46,14 +55,16 @@ class SyncRateLimiter:
 
         if self._min_interval <= 0:
             return 0.0
+        # ロック内では送信枠の予約だけを行い、待機はロック外で行う。
+        # 待機中に他の呼び出し元が後続の枠を予約できるため、待機が直列化しない。
         with self._lock:
             now = time.monotonic()
-            wait = max(0.0, self._next_allowed - now)
-            if wait > 0:
-                time.sleep(wait)
-                now = time.monotonic()
-            self._next_allowed = now + self._min_interval
-            return wait
+            wake_at = max(now, self._next_allowed)
+            self._next_allowed = wake_at + self._min_interval
+        wait = wake_at - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
 
 
 class AsyncRateLimiter:
@@ -71,12 +82,12 @@ class AsyncRateLimiter:
             return 0.0
         async with self._lock:
             now = time.monotonic()
-            wait = max(0.0, self._next_allowed - now)
-            if wait > 0:
-                await asyncio.sleep(wait)
-                now = time.monotonic()
-            self._next_allowed = now + self._min_interval
-            return wait
+            wake_at = max(now, self._next_allowed)
+            self._next_allowed = wake_at + self._min_interval
+        wait = wake_at - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
 
 
 def parse_retry_after(value: str | None) -> float | None:
@@ -85,8 +96,14 @@ def parse_retry_after(value: str | None) -> float | None:
     if not value:
         return None
     text = value.strip()
-    if text.isdigit():
-        return float(text)
+    # delta-seconds形式を先に試す。小数秒も受け付け、nan/infは日時形式の解析へ回して棄却する。
+    try:
+        seconds = float(text)
+    except ValueError:
+        pass
+    else:
+        if math.isfinite(seconds):
+            return max(0.0, seconds)
     try:
         dt = parsedate_to_datetime(text)
     except (TypeError, ValueError):
@@ -102,7 +119,7 @@ def should_retry_http_status(
 ) -> bool:
     """HTTPステータスから再試行可否を判定する。"""
 
-    if status_code in {429, 500, 503}:
+    if status_code in _RETRYABLE_STATUS_CODES:
         return True
     if status_code == 403 and retry_on_403 and has_retry_after:
         return True
@@ -112,20 +129,15 @@ def should_retry_http_status(
 def should_retry_transport_error(exc: Exception) -> bool:
     """通信例外の再試行可否を判定する。"""
 
-    retryable = (
-        httpx.TimeoutException,
-        httpx.ConnectError,
-        httpx.ReadError,
-        httpx.RemoteProtocolError,
-    )
-    return isinstance(exc, retryable)
+    return isinstance(exc, _RETRYABLE_TRANSPORT_ERRORS)
 
 
 def full_jitter_backoff(*, attempt: int, base: float, cap: float) -> float:
     """full jitter で待機秒を計算する。"""
 
     upper = min(cap, base * (2 ** attempt))
-    return random.uniform(0.0, upper)
+    # uniform(0.0, upper) と同値。下限0のため区間計算を省く。
+    return random.random() * upper
 
 
 def decide_wait_seconds(
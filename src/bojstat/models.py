@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import asdict
+from dataclasses import fields
 from decimal import Decimal
 from collections.abc import Callable
 from typing import Any, Literal
@@ -21,7 +20,11 @@ def _convert_value(value: Decimal | None, mode: NumericMode) -> Decimal | float
         return value
     if mode == "float64":
         return float(value)
-    return format(value, "f")
+    # 通常の値はstr()で固定小数点表記になる。指数表記になる値だけformatで展開する。
+    text = str(value)
+    if "E" in text:
+        return format(value, "f")
+    return text
 
 
 def _record_to_dict(record: TimeSeriesRecord, mode: NumericMode = "decimal") -> dict[str, Any]:
@@ -43,12 +46,29 @@ def _record_to_dict(record: TimeSeriesRecord, mode: NumericMode = "decimal") ->
     }
 
 
+_RECORD_FIELD_NAMES = tuple(f.name for f in fields(TimeSeriesRecord))
+
+# asdict()は呼び出しごとにフィールドを走査し値をdeepcopyするため、フィールド名を事前に確定しておく。
+_METADATA_FIELD_NAMES = tuple(f.name for f in fields(MetadataRecord))
+_META_FIELD_NAMES = tuple(f.name for f in fields(ResponseMeta))
+
+
+def _copy_container(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
 def _metadata_to_dict(record: MetadataRecord) -> dict[str, Any]:
-    return asdict(record)
+    payload = {name: getattr(record, name) for name in _METADATA_FIELD_NAMES}
+    payload["extras"] = dict(record.extras)
+    return payload
 
 
 def _meta_to_dict(meta: ResponseMeta) -> dict[str, Any]:
-    payload = asdict(meta)
+    payload = {name: _copy_container(getattr(meta, name)) for name in _META_FIELD_NAMES}
     date_parsed = payload.get("date_parsed")
     if date_parsed is not None:
         payload["date_parsed"] = date_parsed.isoformat()
@@ -70,10 +90,13 @@ class TimeSeriesFrame:
     def to_wide(self, *, numeric_mode: NumericMode = "float64") -> list[dict[str, Any]]:
         """wide形式へ変換する。"""
 
-        table: dict[str, dict[str, Any]] = defaultdict(dict)
+        # 時点ごとの行を初出時に一度だけ作り、以降は系列列の追加のみ行う。
+        table: dict[str, dict[str, Any]] = {}
         for record in self.records:
-            row = table[record.survey_date]
-            row["survey_date"] = record.survey_date
+            survey_date = record.survey_date
+            row = table.get(survey_date)
+            if row is None:
+                row = table[survey_date] = {"survey_date": survey_date}
             row[record.series_code] = _convert_value(record.value, numeric_mode)
         return [table[key] for key in sorted(table)]
 
@@ -81,10 +104,27 @@ class TimeSeriesFrame:
         """pandas.DataFrameへ変換する。"""
 
         try:
+            import numpy as np
             import pandas as pd
         except ImportError as exc:
             raise RuntimeError("pandas が必要です。pip install 'bojstat[pandas]' を実行してください。") from exc
-        return pd.DataFrame(self.to_long(numeric_mode=numeric_mode))
+        records = self.records
+        if not records:
+            # 従来の pd.DataFrame(to_long()) と同じく、列を持たない空のDataFrameを返す。
+            return pd.DataFrame()
+        # 行dictのリストではなく列ごとの配列から組み立て、pandas側の行→列変換を省く。
+        columns: dict[str, Any] = {
+            name: [getattr(record, name) for record in records] for name in _RECORD_FIELD_NAMES
+        }
+        if numeric_mode == "float64":
+            columns["value"] = np.fromiter(
+                (np.nan if record.value is None else float(record.value) for record in records),
+                dtype=np.float64,
+                count=len(records),
+            )
+        elif numeric_mode != "decimal":
+            columns["value"] = [_convert_value(record.value, numeric_mode) for record in records]
+        return pd.DataFrame(columns)
 
     def to_polars(self, *, numeric_mode: NumericMode = "float64") -> Any:
         """polars.DataFrameへ変換する。"""
@@ -2,45 +2,45 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterator
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any
 
 from bojstat.types import MetadataRecord, TimeSeriesRecord
 
+# キーは区切り（空白・アンダースコア）を除いた大文字表記で引く。
 _KEY_ALIASES = {
     "SERIESCODE": "SERIES_CODE",
-    "SERIES CODE": "SERIES_CODE",
     "NAMEOFTIMESERIESJ": "NAME_OF_TIME_SERIES_J",
-    "NAME OF TIME SERIES J": "NAME_OF_TIME_SERIES_J",
     "NAMEOFTIMESERIES": "NAME_OF_TIME_SERIES",
-    "NAME OF TIME SERIES": "NAME_OF_TIME_SERIES",
     "UNITJ": "UNIT_J",
-    "UNIT J": "UNIT_J",
     "CATEGORYJ": "CATEGORY_J",
-    "CATEGORY J": "CATEGORY_J",
     "LASTUPDATE": "LAST_UPDATE",
-    "LAST UPDATE": "LAST_UPDATE",
     "SURVEYDATES": "SURVEY_DATES",
-    "SURVEY DATES": "SURVEY_DATES",
     "STARTOFTHETIMESERIES": "START_OF_THE_TIME_SERIES",
     "ENDOFTHETIMESERIES": "END_OF_THE_TIME_SERIES",
     "NOTESJ": "NOTES_J",
 }
 
 
+@lru_cache(maxsize=4096)
 def normalize_key(key: str) -> str:
-    """キー名揺れを吸収して正規化する。"""
+    """キー名揺れを吸収して正規化する。
 
-    compact = key.strip().replace("_", " ").upper()
-    compact_no_space = compact.replace(" ", "")
-    if compact_no_space in _KEY_ALIASES:
-        return _KEY_ALIASES[compact_no_space]
-    if compact in _KEY_ALIASES:
-        return _KEY_ALIASES[compact]
-    return compact.replace(" ", "_")
+    同じキー名が全行で繰り返し現れるため、変換結果を原文キー単位で再利用する。
+    """
+
+    text = key.strip().upper()
+    alias = _KEY_ALIASES.get(text.replace("_", "").replace(" ", ""))
+    if alias is not None:
+        return alias
+    return text.replace(" ", "_")
 
 
+@lru_cache(maxsize=64)
 def parse_date_tolerant(raw: str | None) -> tuple[datetime | None, str | None]:
     """DATE文字列を寛容に解析する。
 
@@ -71,7 +71,8 @@ def _decimal_or_none(value: Any) -> Decimal | None:
     if value is None:
         return None
     text = str(value).strip()
-    if not text or text.lower() == "null":
+    # 数値表記は数字か小数点で終わる。空欄・"null"・記号などを例外を介さずに弾く。
+    if not text or not (text[-1].isdigit() or text[-1] == "."):
         return None
     try:
         return Decimal(text)
@@ -79,34 +80,81 @@ def _decimal_or_none(value: Any) -> Decimal | None:
         return None
 
 
+# 頻度ラベル（空白除去・大文字化済み）の部分一致規則。"SEMIANNUAL" は "ANNUAL" を含むため、
+# より限定的な規則を先に置く。
+_FREQUENCY_LABEL_RULES = (
+    ("SEMIANNUAL(SEP)", "FH"),
+    ("SEMIANNUAL", "CH"),
+    ("ANNUAL(MAR)", "FY"),
+    ("ANNUAL", "CY"),
+    ("QUARTERLY", "Q"),
+    ("MONTHLY", "M"),
+    ("DAILY", "D"),
+    ("WEEKLY", "W"),
+)
+
+
+@lru_cache(maxsize=64)
 def frequency_code_from_label(label: str | None) -> tuple[str | None, str | None]:
-    """頻度ラベルから頻度コードと週次アンカーを抽出する。"""
+    """頻度ラベルから頻度コードと週次アンカーを抽出する。
+
+    ラベルの種類は少なく全行で繰り返されるため、結果をラベル単位で再利用する。
+    """
 
     if not label:
         return None, None
     normalized = label.upper()
-    if "ANNUAL (MAR)" in normalized:
-        return "FY", None
-    if "ANNUAL" in normalized:
-        return "CY", None
-    if "SEMIANNUAL (SEP)" in normalized:
-        return "FH", None
-    if "SEMIANNUAL" in normalized:
-        return "CH", None
-    if "QUARTERLY" in normalized:
-        return "Q", None
-    if "MONTHLY" in normalized:
-        return "M", None
-    if "DAILY" in normalized:
-        return "D", None
-    if "WEEKLY" in normalized:
+    compact = normalized.replace(" ", "")
+    for needle, code in _FREQUENCY_LABEL_RULES:
+        if needle not in compact:
+            continue
         week_anchor = None
-        if "(" in normalized and ")" in normalized:
+        if code == "W" and "(" in normalized and ")" in normalized:
             week_anchor = normalized.split("(", 1)[1].split(")", 1)[0]
-        return "W", week_anchor
+        return code, week_anchor
     return None, None
 
 
+# 行から専用フィールドとして取り出すキー。これ以外はextrasへ回す。
+_TIMESERIES_FIELDS = frozenset(
+    {
+        "SERIES_CODE",
+        "NAME_OF_TIME_SERIES_J",
+        "NAME_OF_TIME_SERIES",
+        "UNIT_J",
+        "UNIT",
+        "FREQUENCY",
+        "CATEGORY_J",
+        "CATEGORY",
+        "LAST_UPDATE",
+        "SURVEY_DATES",
+        "VALUES",
+    }
+)
+_METADATA_FIELDS = frozenset(
+    {
+        "SERIES_CODE",
+        "NAME_OF_TIME_SERIES_J",
+        "NAME_OF_TIME_SERIES",
+        "UNIT_J",
+        "UNIT",
+        "FREQUENCY",
+        "CATEGORY_J",
+        "CATEGORY",
+        "LAYER1",
+        "LAYER2",
+        "LAYER3",
+        "LAYER4",
+        "LAYER5",
+        "START_OF_THE_TIME_SERIES",
+        "END_OF_THE_TIME_SERIES",
+        "LAST_UPDATE",
+        "NOTES_J",
+        "NOTES",
+    }
+)
+
+
 def _extract(row: dict[str, Any], *keys: str) -> Any:
     for key in keys:
         if key in row:
@@ -114,111 +162,145 @@ def _extract(row: dict[str, Any], *keys: str) -> Any:
     return None
 
 
-def expand_timeseries_rows(
+def _str_or_none(value: Any) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _interned_str_or_none(value: Any) -> str | None:
+    # 単位・期種・カテゴリのように種類が少なく全行で繰り返す値だけに用いる。
+    # 系列コード等の値域が広い項目は共有による節約がなく、インターン表への登録負荷だけが残るため使わない。
+    return sys.intern(str(value)) if value is not None else None
+
+
+def _split_row(
+    raw: dict[str, Any], field_keys: frozenset[str]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """行のキーを正規化しつつ、専用フィールドとextrasへ1パスで振り分ける。
+
+    Args:
+        raw: 正規化前の行。
+        field_keys: 専用フィールドとして取り出す正規化済みキー。
+
+    Returns:
+        (専用フィールド, extras)。
+    """
+
+    fields: dict[str, Any] = {}
+    extras: dict[str, Any] = {}
+    for key, value in raw.items():
+        normalized_key = normalize_key(key)
+        if normalized_key in field_keys:
+            fields[normalized_key] = value
+        else:
+            extras[normalized_key] = value
+    return fields, extras
+
+
+def iter_expand_timeseries_rows(
     rows: list[dict[str, Any]],
     *,
     source_page_index: int,
     code_order_map: dict[str, int],
-) -> list[TimeSeriesRecord]:
-    """正規化前行をTimeSeriesRecordへ展開する。"""
+) -> Iterator[TimeSeriesRecord]:
+    """正規化前行をTimeSeriesRecordへ逐次展開する。
+
+    レコードを一括でリスト化せず生成順に返すため、受け取り側で即座に
+    集約する場合に中間リストを持たずに済む。`code_order_map` はレコード生成時に
+    参照されるため、消費中の更新は以降のレコードへ反映される。
+
+    Args:
+        rows: 正規化前行。
+        source_page_index: 取得ページ番号。
+        code_order_map: 系列コードから入力順序への対応。
+
+    Yields:
+        展開済みレコード。
+    """
 
-    result: list[TimeSeriesRecord] = []
     for row_index, raw in enumerate(rows):
-        normalized = {normalize_key(k): v for k, v in raw.items()}
-        series_code = str(_extract(normalized, "SERIES_CODE") or "").strip()
+        fields, extras = _split_row(raw, _TIMESERIES_FIELDS)
+        series_code = str(fields.get("SERIES_CODE") or "").strip()
         if not series_code:
             continue
-        series_name = _extract(normalized, "NAME_OF_TIME_SERIES_J", "NAME_OF_TIME_SERIES")
-        unit = _extract(normalized, "UNIT_J", "UNIT")
-        frequency = _extract(normalized, "FREQUENCY")
-        category = _extract(normalized, "CATEGORY_J", "CATEGORY")
-        last_update = _extract(normalized, "LAST_UPDATE")
-        freq_code, week_anchor = frequency_code_from_label(str(frequency) if frequency else None)
-        values_field = _extract(normalized, "VALUES")
-        original_index = code_order_map.get(series_code)
+        series_name = _str_or_none(
+            _extract(fields, "NAME_OF_TIME_SERIES_J", "NAME_OF_TIME_SERIES")
+        )
+        unit = _interned_str_or_none(_extract(fields, "UNIT_J", "UNIT"))
+        frequency = _interned_str_or_none(fields.get("FREQUENCY"))
+        category = _interned_str_or_none(_extract(fields, "CATEGORY_J", "CATEGORY"))
+        last_update = _str_or_none(fields.get("LAST_UPDATE"))
+        freq_code, week_anchor = frequency_code_from_label(frequency or None)
+        values_field = fields.get("VALUES")
 
         if isinstance(values_field, dict):
+            # 入れ子形式では行直下のSURVEY_DATESを観測値に使わないため、元の位置でextrasに残す。
+            if "SURVEY_DATES" in fields:
+                extras = {
+                    normalized_key: value
+                    for key, value in raw.items()
+                    if (normalized_key := normalize_key(key)) not in _TIMESERIES_FIELDS
+                    or normalized_key == "SURVEY_DATES"
+                }
             nested = {normalize_key(k): v for k, v in values_field.items()}
             nested_dates = list(nested.get("SURVEY_DATES", []))
             nested_values = list(nested.get("VALUES", []))
             for idx, survey in enumerate(nested_dates):
                 value = nested_values[idx] if idx < len(nested_values) else None
-                result.append(
-                    TimeSeriesRecord(
-                        series_code=series_code,
-                        series_name=str(series_name) if series_name is not None else None,
-                        unit=str(unit) if unit is not None else None,
-                        frequency=str(frequency) if frequency is not None else None,
-                        frequency_code=freq_code,
-                        week_anchor=week_anchor,
-                        category=str(category) if category is not None else None,
-                        last_update=str(last_update) if last_update is not None else None,
-                        survey_date=str(survey),
-                        value=_decimal_or_none(value),
-                        original_code_index=original_index,
-                        source_page_index=source_page_index,
-                        source_row_index=row_index,
-                        extras={
-                            key: val
-                            for key, val in normalized.items()
-                            if key
-                            not in {
-                                "SERIES_CODE",
-                                "NAME_OF_TIME_SERIES_J",
-                                "NAME_OF_TIME_SERIES",
-                                "UNIT_J",
-                                "UNIT",
-                                "FREQUENCY",
-                                "CATEGORY_J",
-                                "CATEGORY",
-                                "LAST_UPDATE",
-                                "VALUES",
-                            }
-                        },
-                    )
+                yield TimeSeriesRecord(
+                    series_code=series_code,
+                    series_name=series_name,
+                    unit=unit,
+                    frequency=frequency,
+                    frequency_code=freq_code,
+                    week_anchor=week_anchor,
+                    category=category,
+                    last_update=last_update,
+                    survey_date=str(survey),
+                    value=_decimal_or_none(value),
+                    original_code_index=code_order_map.get(series_code),
+                    source_page_index=source_page_index,
+                    source_row_index=row_index,
+                    # 空の場合は複製せず新しい空dictを渡す（レコード間でdictを共有しない）。
+                    extras=dict(extras) if extras else {},
                 )
             continue
 
-        survey_value = _extract(normalized, "SURVEY_DATES")
-        value = _extract(normalized, "VALUES")
+        survey_value = fields.get("SURVEY_DATES")
         if survey_value is None:
             continue
-        result.append(
-            TimeSeriesRecord(
-                series_code=series_code,
-                series_name=str(series_name) if series_name is not None else None,
-                unit=str(unit) if unit is not None else None,
-                frequency=str(frequency) if frequency is not None else None,
-                frequency_code=freq_code,
-                week_anchor=week_anchor,
-                category=str(category) if category is not None else None,
-                last_update=str(last_update) if last_update is not None else None,
-                survey_date=str(survey_value),
-                value=_decimal_or_none(value),
-                original_code_index=original_index,
-                source_page_index=source_page_index,
-                source_row_index=row_index,
-                extras={
-                    key: val
-                    for key, val in normalized.items()
-                    if key
-                    not in {
-                        "SERIES_CODE",
-                        "NAME_OF_TIME_SERIES_J",
-                        "NAME_OF_TIME_SERIES",
-                        "UNIT_J",
-                        "UNIT",
-                        "FREQUENCY",
-                        "CATEGORY_J",
-                        "CATEGORY",
-                        "LAST_UPDATE",
-                        "SURVEY_DATES",
-                        "VALUES",
-                    }
-                },
-            )
+        yield TimeSeriesRecord(
+            series_code=series_code,
+            series_name=series_name,
+            unit=unit,
+            frequency=frequency,
+            frequency_code=freq_code,
+            week_anchor=week_anchor,
+            category=category,
+            last_update=last_update,
+            survey_date=str(survey_value),
+            value=_decimal_or_none(values_field),
+            original_code_index=code_order_map.get(series_code),
+            source_page_index=source_page_index,
+            source_row_index=row_index,
+            extras=extras,
         )
-    return result
+
+
+def expand_timeseries_rows(
+    rows: list[dict[str, Any]],
+    *,
+    source_page_index: int,
+    code_order_map: dict[str, int],
+) -> list[TimeSeriesRecord]:
+    """正規化前行をTimeSeriesRecordへ展開する。"""
+
+    return list(
+        iter_expand_timeseries_rows(
+            rows,
+            source_page_index=source_page_index,
+            code_order_map=code_order_map,
+        )
+    )
 
 
 def normalize_metadata_rows(rows: list[dict[str, Any]]) -> list[MetadataRecord]:
@@ -226,100 +308,26 @@ def normalize_metadata_rows(rows: list[dict[str, Any]]) -> list[MetadataRecord]:
 
     result: list[MetadataRecord] = []
     for raw in rows:
-        normalized = {normalize_key(k): v for k, v in raw.items()}
+        fields, extras = _split_row(raw, _METADATA_FIELDS)
+        get = fields.get
         record = MetadataRecord(
-            series_code=str(_extract(normalized, "SERIES_CODE") or "").strip(),
-            series_name=(
-                str(_extract(normalized, "NAME_OF_TIME_SERIES_J", "NAME_OF_TIME_SERIES"))
-                if _extract(normalized, "NAME_OF_TIME_SERIES_J", "NAME_OF_TIME_SERIES")
-                is not None
-                else None
-            ),
-            unit=(
-                str(_extract(normalized, "UNIT_J", "UNIT"))
-                if _extract(normalized, "UNIT_J", "UNIT") is not None
-                else None
-            ),
-            frequency=(
-                str(_extract(normalized, "FREQUENCY"))
-                if _extract(normalized, "FREQUENCY") is not None
-                else None
-            ),
-            category=(
-                str(_extract(normalized, "CATEGORY_J", "CATEGORY"))
-                if _extract(normalized, "CATEGORY_J", "CATEGORY") is not None
-                else None
-            ),
-            layer1=(
-                str(_extract(normalized, "LAYER1"))
-                if _extract(normalized, "LAYER1") is not None
-                else None
-            ),
-            layer2=(
-                str(_extract(normalized, "LAYER2"))
-                if _extract(normalized, "LAYER2") is not None
-                else None
-            ),
-            layer3=(
-                str(_extract(normalized, "LAYER3"))
-                if _extract(normalized, "LAYER3") is not None
-                else None
+            series_code=str(get("SERIES_CODE") or "").strip(),
+            series_name=_str_or_none(
+                _extract(fields, "NAME_OF_TIME_SERIES_J", "NAME_OF_TIME_SERIES")
             ),
-            layer4=(
-                str(_extract(normalized, "LAYER4"))
-                if _extract(normalized, "LAYER4") is not None
-                else None
-            ),
-            layer5=(
-                str(_extract(normalized, "LAYER5"))
-                if _extract(normalized, "LAYER5") is not None
-                else None
-            ),
-            start_of_time_series=(
-                str(_extract(normalized, "START_OF_THE_TIME_SERIES"))
-                if _extract(normalized, "START_OF_THE_TIME_SERIES") is not None
-                else None
-            ),
-            end_of_time_series=(
-                str(_extract(normalized, "END_OF_THE_TIME_SERIES"))
-                if _extract(normalized, "END_OF_THE_TIME_SERIES") is not None
-                else None
-            ),
-            last_update=(
-                str(_extract(normalized, "LAST_UPDATE"))
-                if _extract(normalized, "LAST_UPDATE") is not None
-                else None
-            ),
-            notes=(
-                str(_extract(normalized, "NOTES_J", "NOTES"))
-                if _extract(normalized, "NOTES_J", "NOTES") is not None
-                else None
-            ),
-            extras={
-                key: val
-                for key, val in normalized.items()
-                if key
-                not in {
-                    "SERIES_CODE",
-                    "NAME_OF_TIME_SERIES_J",
-                    "NAME_OF_TIME_SERIES",
-                    "UNIT_J",
-                    "UNIT",
-                    "FREQUENCY",
-                    "CATEGORY_J",
-                    "CATEGORY",
-                    "LAYER1",
-                    "LAYER2",
-                    "LAYER3",
-                    "LAYER4",
-                    "LAYER5",
-                    "START_OF_THE_TIME_SERIES",
-                    "END_OF_THE_TIME_SERIES",
-                    "LAST_UPDATE",
-                    "NOTES_J",
-                    "NOTES",
-                }
-            },
+            unit=_str_or_none(_extract(fields, "UNIT_J", "UNIT")),
+            frequency=_str_or_none(get("FREQUENCY")),
+            category=_str_or_none(_extract(fields, "CATEGORY_J", "CATEGORY")),
+            layer1=_str_or_none(get("LAYER1")),
+            layer2=_str_or_none(get("LAYER2")),
+            layer3=_str_or_none(get("LAYER3")),
+            layer4=_str_or_none(get("LAYER4")),
+            layer5=_str_or_none(get("LAYER5")),
+            start_of_time_series=_str_or_none(get("START_OF_THE_TIME_SERIES")),
+            end_of_time_series=_str_or_none(get("END_OF_THE_TIME_SERIES")),
+            last_update=_str_or_none(get("LAST_UPDATE")),
+            notes=_str_or_none(_extract(fields, "NOTES_J", "NOTES")),
+            extras=extras,
         )
         result.append(record)
     return result
@@ -31,11 +31,12 @@ def advance_code_position(*, state: CodePagerState, next_position: int | None) -
 
     if next_position is None:
         return False
-    if next_position <= state.start_position:
-        raise BojPaginationStalledError(
-            chunk_index=state.chunk_index,
-            start=state.start_position,
-            next_position=next_position,
-        )
-    state.start_position = next_position
-    return True
+    start = state.start_position
+    if next_position > start:
+        state.start_position = next_position
+        return True
+    raise BojPaginationStalledError(
+        chunk_index=state.chunk_index,
+        start=start,
+        next_position=next_position,
+    )
@@ -30,11 +30,12 @@ def advance_layer_position(*, state: LayerPagerState, next_position: int | None)
 
     if next_position is None:
         return False
-    if next_position <= state.start_position:
-        raise BojPaginationStalledError(
-            chunk_index=0,
-            start=state.start_position,
-            next_position=next_position,
-        )
-    state.start_position = next_position
-    return True
+    start = state.start_position
+    if next_position > start:
+        state.start_position = next_position
+        return True
+    raise BojPaginationStalledError(
+        chunk_index=0,
+        start=start,
+        next_position=next_position,
+    )
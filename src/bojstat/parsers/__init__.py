@@ -7,6 +7,9 @@ from bojstat.parsers.csv_parser import parse_csv_response
 from bojstat.parsers.json_parser import parse_json_response
 from bojstat.types import ParsedResponse
 
+_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+_JSON_OBJECT_START = ord("{")
+
 
 def decode_response_bytes(payload: bytes, *, lang: Lang) -> str:
     """バイト列を言語規約に従ってデコードする。
@@ -19,6 +22,9 @@ def decode_response_bytes(payload: bytes, *, lang: Lang) -> str:
         デコード済み文字列。
     """
 
+    # ASCIIのみの本文はShift_JIS/UTF-8のどちらでも同じ文字列になるため、判定を省く。
+    if payload.isascii():
+        return payload.decode("ascii")
     if lang == Lang.JP:
         try:
             return payload.decode("shift_jis")
@@ -44,13 +50,21 @@ def parse_response(
         解析結果。
     """
 
-    utf8_text = payload.decode("utf-8", errors="replace").strip()
-    if utf8_text.startswith("{"):
-        return parse_json_response(utf8_text)
-
-    if requested_format == Format.JSON:
-        return parse_json_response(utf8_text)
+    # 本文全体をデコードせず、先頭の非空白バイトだけでJSONかを判定する。
+    index = 0
+    length = len(payload)
+    while index < length and payload[index] in _ASCII_WHITESPACE:
+        index += 1
+    if (index < length and payload[index] == _JSON_OBJECT_START) or (
+        requested_format == Format.JSON
+    ):
+        try:
+            return parse_json_response(payload)
+        except ValueError:
+            # 不正なUTF-8を含む場合に備え、置換デコードした本文で再解析する。
+            return parse_json_response(payload.decode("utf-8", errors="replace").strip())
 
+    # CSVは言語規約に従って一度だけデコードする。
     decoded = decode_response_bytes(payload, lang=lang)
     return parse_csv_response(decoded)
 
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
 from io import StringIO
 from typing import Any
 
@@ -10,11 +13,73 @@ from bojstat.enums import Format
 from bojstat.normalize import normalize_key, parse_date_tolerant
 from bojstat.types import ParsedResponse
 
+# データ表のヘッダ行とみなす列名（正規化後）。
+_LOOKS_LIKE_HEADER = frozenset({"SERIES_CODE", "NAME_OF_TIME_SERIES_J", "NAME_OF_TIME_SERIES"})
+
 
 def _trim_row(row: list[str]) -> list[str]:
     return [cell.strip() for cell in row]
 
 
+@dataclass(slots=True)
+class _ParseState:
+    """ヘッダ部の解析途中状態。"""
+
+    status: int = 0
+    message_id: str = ""
+    message: str = ""
+    date_raw: str | None = None
+    date_parsed: datetime | None = None
+    date_parse_warning: str | None = None
+    parameters: dict[str, str | None] = field(default_factory=dict)
+    next_position: int | None = None
+    db: str | None = None
+
+
+def _handle_status(row: list[str], state: _ParseState) -> None:
+    state.status = int(row[1]) if len(row) > 1 and row[1] else 0
+
+
+def _handle_message_id(row: list[str], state: _ParseState) -> None:
+    state.message_id = row[1] if len(row) > 1 else ""
+
+
+def _handle_message(row: list[str], state: _ParseState) -> None:
+    state.message = row[1] if len(row) > 1 else ""
+
+
+def _handle_date(row: list[str], state: _ParseState) -> None:
+    state.date_raw = row[1] if len(row) > 1 and row[1] else None
+    state.date_parsed, state.date_parse_warning = parse_date_tolerant(state.date_raw)
+
+
+def _handle_parameter(row: list[str], state: _ParseState) -> None:
+    if len(row) > 1:
+        value = row[2] if len(row) > 2 and row[2] else None
+        state.parameters[normalize_key(row[1])] = value
+
+
+def _handle_next_position(row: list[str], state: _ParseState) -> None:
+    if len(row) > 1 and row[1]:
+        state.next_position = int(row[1])
+
+
+def _handle_db(row: list[str], state: _ParseState) -> None:
+    state.db = row[1] if len(row) > 1 and row[1] else None
+
+
+# 正規化済み先頭セル → ヘッダ行ハンドラ。データ行は1回の辞書参照で素通りする。
+_CSV_HEADER_HANDLERS: dict[str, Callable[[list[str], _ParseState], None]] = {
+    "STATUS": _handle_status,
+    "MESSAGEID": _handle_message_id,
+    "MESSAGE": _handle_message,
+    "DATE": _handle_date,
+    "PARAMETER": _handle_parameter,
+    "NEXTPOSITION": _handle_next_position,
+    "DB": _handle_db,
+}
+
+
 def parse_csv_response(text: str) -> ParsedResponse:
     """CSV本文を解析して共通形式へ変換する。
 
@@ -26,78 +91,50 @@ def parse_csv_response(text: str) -> ParsedResponse:
     """
 
     reader = csv.reader(StringIO(text))
-    rows = [_trim_row(row) for row in reader if any(cell.strip() for cell in row)]
-
-    status = 0
-    message_id = ""
-    message = ""
-    date_raw: str | None = None
-    date_parsed = None
-    date_parse_warning: str | None = None
-    parameters: dict[str, str | None] = {}
-    next_position: int | None = None
-    db: str | None = None
+    # 各セルのstripは1回だけ行い、その結果で空行を判定する。
+    # 引用符内の改行を壊さないよう、行単位の事前分割はせずcsv.readerに任せる。
+    rows = [row for row in map(_trim_row, reader) if any(row)]
 
+    state = _ParseState()
+    handlers = _CSV_HEADER_HANDLERS
     data_header: list[str] | None = None
+    header_width = 0
+    has_blank_header = False
     data_rows: list[dict[str, Any]] = []
 
     for row in rows:
-        key = normalize_key(row[0])
-        if key == "STATUS":
-            status = int(row[1]) if len(row) > 1 and row[1] else 0
-            continue
-        if key == "MESSAGEID":
-            message_id = row[1] if len(row) > 1 else ""
-            continue
-        if key == "MESSAGE":
-            message = row[1] if len(row) > 1 else ""
-            continue
-        if key == "DATE":
-            date_raw = row[1] if len(row) > 1 and row[1] else None
-            date_parsed, date_parse_warning = parse_date_tolerant(date_raw)
-            continue
-        if key == "PARAMETER":
-            if len(row) > 1:
-                value = row[2] if len(row) > 2 and row[2] else None
-                parameters[normalize_key(row[1])] = value
-            continue
-        if key == "NEXTPOSITION":
-            if len(row) > 1 and row[1]:
-                next_position = int(row[1])
-            continue
-        if key == "DB":
-            db = row[1] if len(row) > 1 and row[1] else None
+        handler = handlers.get(normalize_key(row[0]))
+        if handler is not None:
+            handler(row, state)
             continue
 
-        looks_like_header = {
-            "SERIES_CODE",
-            "NAME_OF_TIME_SERIES_J",
-            "NAME_OF_TIME_SERIES",
-        }
-        normalized_row = [normalize_key(cell) for cell in row]
-        if data_header is None and any(cell in looks_like_header for cell in normalized_row):
-            data_header = [normalize_key(cell) for cell in row]
+        if data_header is None:
+            normalized_row = [normalize_key(cell) for cell in row]
+            if not _LOOKS_LIKE_HEADER.isdisjoint(normalized_row):
+                data_header = normalized_row
+                header_width = len(data_header)
+                has_blank_header = "" in data_header
             continue
 
-        if data_header is not None:
-            mapped: dict[str, Any] = {}
-            for idx, header in enumerate(data_header):
-                if not header:
-                    continue
-                mapped[header] = row[idx] if idx < len(row) else ""
-            data_rows.append(mapped)
+        # 列数はヘッダ確定時に固定されるため、不足分だけ空文字で補ってzipで一括構築する。
+        if len(row) < header_width:
+            row = row + [""] * (header_width - len(row))
+        mapped: dict[str, Any] = dict(zip(data_header, row))
+        if has_blank_header:
+            mapped.pop("", None)
+        data_rows.append(mapped)
 
     return ParsedResponse(
-        status=status,
-        message_id=message_id,
-        message=message,
-        date_raw=date_raw,
-        date_parsed=date_parsed,
-        date_parse_warning=date_parse_warning,
-        parameters=parameters,
-        next_position=next_position,
+        status=state.status,
+        message_id=state.message_id,
+        message=state.message,
+        date_raw=state.date_raw,
+        date_parsed=state.date_parsed,
+        date_parse_warning=state.date_parse_warning,
+        parameters=state.parameters,
+        next_position=state.next_position,
         rows=data_rows,
-        db=db,
+        db=state.db,
         raw_response_excerpt=text[:2048],
         format=Format.CSV,
     )
@@ -2,25 +2,39 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from bojstat import _json
 from bojstat.enums import Format
 from bojstat.normalize import normalize_key, parse_date_tolerant
 from bojstat.types import ParsedResponse
 
+_EXCERPT_CHARS = 2048
 
-def parse_json_response(text: str) -> ParsedResponse:
+
+def _excerpt(text: str | bytes) -> str:
+    if isinstance(text, bytes):
+        # 1文字は最大4バイトのため、先頭から十分な長さだけをデコードする。
+        prefix = text[: _EXCERPT_CHARS * 4]
+        decoded = prefix.decode("utf-8", errors="replace")
+        text = decoded.strip() if len(prefix) == len(text) else decoded.lstrip()
+    return text[:_EXCERPT_CHARS]
+
+
+def parse_json_response(text: str | bytes) -> ParsedResponse:
     """JSON本文を解析して共通形式へ変換する。
 
+    STATUSが200以外でRESULTSETを含まないエラー応答では、DATEの解析と
+    PARAMETERの展開を省略する（date_parsedはNone、parametersは空）。
+
     Args:
-        text: レスポンステキスト。
+        text: レスポンステキスト。UTF-8のバイト列のままでもよい。
 
     Returns:
         解析結果。
     """
 
-    payload: dict[str, Any] = json.loads(text)
+    payload: dict[str, Any] = _json.loads(text)
     normalized_payload = {normalize_key(k): v for k, v in payload.items()}
 
     status = int(normalized_payload.get("STATUS", 0))
@@ -31,11 +45,16 @@ def parse_json_response(text: str) -> ParsedResponse:
         if normalized_payload.get("DATE") is not None
         else None
     )
-    date_parsed, date_parse_warning = parse_date_tolerant(date_raw)
+    # RESULTSETを伴わないエラー応答では DATE/PARAMETER は例外生成に使われないため解析しない。
+    is_error_body = status != 200 and "RESULTSET" not in normalized_payload
+    if is_error_body:
+        date_parsed, date_parse_warning = None, None
+    else:
+        date_parsed, date_parse_warning = parse_date_tolerant(date_raw)
 
     parameters: dict[str, str | None] = {}
     parameter_obj = normalized_payload.get("PARAMETER")
-    if isinstance(parameter_obj, dict):
+    if not is_error_body and isinstance(parameter_obj, dict):
         for key, value in parameter_obj.items():
             parameters[normalize_key(key)] = (
                 str(value) if value not in (None, "") else None
@@ -50,9 +69,8 @@ def parse_json_response(text: str) -> ParsedResponse:
     rows: list[dict[str, Any]] = []
     resultset = normalized_payload.get("RESULTSET")
     if isinstance(resultset, list):
-        for row in resultset:
-            if isinstance(row, dict):
-                rows.append(row)
+        # JSON復元結果に dict のサブクラスは現れないため、型の同一性比較で足りる。
+        rows = [row for row in resultset if type(row) is dict]
 
     db = normalized_payload.get("DB")
     db_value = str(db) if db is not None else None
@@ -68,6 +86,6 @@ def parse_json_response(text: str) -> ParsedResponse:
         next_position=next_position,
         rows=rows,
         db=db_value,
-        raw_response_excerpt=text[:2048],
+        raw_response_excerpt=_excerpt(text),
         format=Format.JSON,
     )
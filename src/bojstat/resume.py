@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
 import hashlib
-import json
 from typing import Any
 
+from bojstat import _json
 from bojstat.config import TOKEN_VERSION
 from bojstat.errors import BojResumeTokenMismatchError
 from bojstat.types import ResumeTokenState
 
 
+# URL-safe Base64 と標準 Base64 の置換表。base64モジュールのラッパーを経由せず
+# binascii を直接呼ぶため、import時に一度だけ作る。
+_B64_URL_TRANS = bytes.maketrans(b"+/", b"-_")
+_B64_URL_DETRANS = bytes.maketrans(b"-_", b"+/")
+
 _REASON_MAP = {
     "token_version": "token_version_mismatch",
     "request_fingerprint": "fingerprint_mismatch",
@@ -24,22 +29,23 @@ _REASON_MAP = {
 def build_request_fingerprint(components: dict[str, Any]) -> str:
     """要求構成要素から指紋を生成する。"""
 
-    serialized = json.dumps(components, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    # 同一要求の識別用で暗号用途ではないため、FIPS制約下でも拒否されないよう明示する。
+    serialized = _json.dumps(components, sort_keys=True)
+    return hashlib.sha256(serialized, usedforsecurity=False).hexdigest()
 
 
 def encode_resume_token(payload: dict[str, Any]) -> str:
     """再開トークンをエンコードする。"""
 
-    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-    return base64.urlsafe_b64encode(raw).decode("ascii")
+    encoded = binascii.b2a_base64(_json.dumps(payload), newline=False)
+    return encoded.translate(_B64_URL_TRANS).decode("ascii")
 
 
 def decode_resume_token(token: str) -> ResumeTokenState:
     """再開トークンを復元する。"""
 
-    decoded = base64.urlsafe_b64decode(token.encode("ascii"))
-    payload = json.loads(decoded.decode("utf-8"))
+    decoded = binascii.a2b_base64(token.encode("ascii").translate(_B64_URL_DETRANS))
+    payload = _json.loads(decoded)
     return ResumeTokenState(
         token_version=int(payload["token_version"]),
         api=str(payload["api"]),
@@ -32,6 +32,8 @@ from bojstat.http import (
 from bojstat.parsers import parse_response
 from bojstat.types import ParsedResponse
 
+_EXCERPT_CHARS = 2048
+
 
 def _effective_transport_max_attempts(retry_config: RetryConfig) -> int:
     """通信例外時の最大試行回数を返す。"""
@@ -77,7 +79,10 @@ def _parse_response_with_fallback(
             lang=lang,
         )
     except Exception as exc:  # noqa: BLE001
-        text = response.text
+        # 抜粋に要る先頭だけを応答のcharsetでデコードし、本文全体の文字列化を避ける。
+        # 1文字は最大4バイトのため、この長さで抜粋文字数を満たせる。
+        prefix = response.content[: _EXCERPT_CHARS * 4]
+        excerpt = prefix.decode(response.encoding or "utf-8", errors="replace")[:_EXCERPT_CHARS]
         status = int(response.status_code)
         return ParsedResponse(
             status=status,
@@ -93,7 +98,7 @@ def _parse_response_with_fallback(
             next_position=None,
             rows=[],
             db=None,
-            raw_response_excerpt=text[:2048],
+            raw_response_excerpt=excerpt,
             format=requested_format,
         )
 
@@ -103,7 +108,7 @@ def _make_api_error(
     *,
     request_url: str,
     capture_full_response: bool,
-    raw_text: str,
+    raw_text: str | None,
 ) -> BojApiError:
     if parsed.message_id == "UNPARSEABLE_RESPONSE":
         klass = BojGatewayError
@@ -179,10 +184,10 @@ def perform_sync_request(
     limiter: SyncRateLimiter,
     user_agent: str,
     capture_full_response: bool,
-) -> tuple[ParsedResponse, str, str]:
+) -> tuple[ParsedResponse, str]:
     """同期GET要求を再試行つきで実行する。"""
 
-    headers = dict(build_request_headers(user_agent))
+    headers = build_request_headers(user_agent)
     last_exception: Exception | None = None
     transport_max_attempts = _effective_transport_max_attempts(retry_config)
     total_attempts = max(retry_config.max_attempts, transport_max_attempts)
@@ -207,7 +212,6 @@ def perform_sync_request(
             lang=lang,
         )
         request_url = str(response.request.url)
-        raw_text = response.text
         if should_retry_response(
             parsed_status=parsed.status,
             http_status=response.status_code,
@@ -229,9 +233,10 @@ def perform_sync_request(
                 parsed,
                 request_url=request_url,
                 capture_full_response=capture_full_response,
-                raw_text=raw_text,
+                # 本文全体の復号は全文保持を要求された場合に限り、通常は抜粋のみを使う。
+                raw_text=response.text if capture_full_response else None,
             )
-        return parsed, request_url, raw_text
+        return parsed, request_url
 
     if last_exception is not None:
         raise BojTransportError(str(last_exception)) from last_exception
@@ -249,10 +254,10 @@ async def perform_async_request(
     limiter: AsyncRateLimiter,
     user_agent: str,
     capture_full_response: bool,
-) -> tuple[ParsedResponse, str, str]:
+) -> tuple[ParsedResponse, str]:
     """非同期GET要求を再試行つきで実行する。"""
 
-    headers = dict(build_request_headers(user_agent))
+    headers = build_request_headers(user_agent)
     last_exception: Exception | None = None
     transport_max_attempts = _effective_transport_max_attempts(retry_config)
     total_attempts = max(retry_config.max_attempts, transport_max_attempts)
@@ -277,7 +282,6 @@ async def perform_async_request(
             lang=lang,
         )
         request_url = str(response.request.url)
-        raw_text = response.text
         if should_retry_response(
             parsed_status=parsed.status,
             http_status=response.status_code,
@@ -299,9 +303,10 @@ async def perform_async_request(
                 parsed,
                 request_url=request_url,
                 capture_full_response=capture_full_response,
-                raw_text=raw_text,
+                # 本文全体の復号は全文保持を要求された場合に限り、通常は抜粋のみを使う。
+                raw_text=response.text if capture_full_response else None,
             )
-        return parsed, request_url, raw_text
+        return parsed, request_url
 
     if last_exception is not None:
         raise BojTransportError(str(last_exception)) from last_exception
@@ -2,26 +2,29 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import Any
 
 import httpx
 
 from bojstat.cache import FileCache
-import warnings
-
 from bojstat.config import NORMALIZER_VERSION, PARSER_VERSION, SCHEMA_VERSION, ClientConfig, RetryConfig
-from bojstat.enums import DB, ConsistencyMode, Frequency, Format, Lang, OutputOrder
+from bojstat.enums import DB, CacheMode, ConsistencyMode, Frequency, Format, Lang, OutputOrder
 from bojstat.errors import BojConsistencyError, BojDateParseError
 from bojstat.models import MetadataFrame, TimeSeriesFrame
-from bojstat.normalize import expand_timeseries_rows
+from bojstat.normalize import iter_expand_timeseries_rows
 from bojstat.pager.code_pager import CodePagerState, advance_code_position
 from bojstat.pager.layer_pager import LayerPagerState, advance_layer_position
 from bojstat.resume import build_request_fingerprint, create_resume_token, decode_resume_token, validate_resume_token
 from bojstat.services._transport import perform_async_request, perform_sync_request
-from bojstat.types import ResponseMeta, TimeSeriesRecord
+from bojstat.types import ParsedResponse, ResponseMeta, TimeSeriesRecord
 from bojstat.validation import (
     canonical_params,
     guess_frequency_from_code,
@@ -38,7 +41,11 @@ from bojstat.validation import (
     validate_strict_auto_split,
 )
 
+_logger = logging.getLogger(__name__)
 _JST = ZoneInfo("Asia/Tokyo")
+_JST_OFFSET_SECONDS = 9 * 60 * 60
+# ResponseMeta.conflicts_sample に保持する競合の件数（先頭から）。総数はconflicts_countで数える。
+_CONFLICTS_SAMPLE_LIMIT = 20
 
 
 def _frequency_code_from_metadata_label(label: str | None) -> str | None:
@@ -272,30 +279,46 @@ class DataService:
         conflicts_sample: list[dict[str, Any]] = []
         conflicts_count = 0
 
+        strict_consistency = self._config.consistency_mode == ConsistencyMode.STRICT
+        checkpoint = _chunk_checkpoint_enabled(self._config, len(chunks))
+        chunk_sources: list[dict[str, Any]] = []
         for chunk_index, chunk in enumerate(chunks):
             if chunk_index < start_chunk_index:
                 continue
-            pager = CodePagerState(
-                chunk_index=chunk_index,
-                start_position=chunk_start_position if chunk_index == start_chunk_index else 1,
-            )
+            chunk_start = chunk_start_position if chunk_index == start_chunk_index else 1
+            # 途中位置から再開するチャンクは全件が揃わないため、チェックポイントを使わない。
+            use_checkpoint = checkpoint and chunk_start == 1
+            chunk_key = _chunk_checkpoint_key(cache_key, chunk_index)
+            if use_checkpoint:
+                loaded = _load_chunk_checkpoint(self._cache, self._config, chunk_key)
+                if loaded is not None:
+                    cached_chunk, fetched_at = loaded
+                    chunk_sources.append(_chunk_source(chunk_index, "checkpoint", fetched_at))
+                    conflicts_count += _merge_records(
+                        cached_chunk.records,
+                        dedupe=dedupe,
+                        conflicts_sample=conflicts_sample,
+                        strict=strict_consistency,
+                    )
+                    last_meta = cached_chunk.meta
+                    last_meta.conflicts_count = conflicts_count
+                    last_meta.conflicts_sample = conflicts_sample.copy()
+                    continue
+
+            pager = CodePagerState(chunk_index=chunk_index, start_position=chunk_start)
             page_index = 0
+            chunk_records: list[TimeSeriesRecord] = []
+            head_params = {
+                "DB": db_norm,
+                "CODE": ",".join(chunk),
+                "LANG": lang_norm.value,
+                "FORMAT": format_norm.value,
+            }
+            tail_params = _tail_params(start=start_norm, end=end_norm, raw=raw)
             while True:
-                params = {
-                    "DB": db_norm,
-                    "CODE": ",".join(chunk),
-                    "LANG": lang_norm.value,
-                    "FORMAT": format_norm.value,
-                }
-                if pager.start_position > 1:
-                    params["STARTPOSITION"] = str(pager.start_position)
-                if start_norm:
-                    params["STARTDATE"] = start_norm
-                if end_norm:
-                    params["ENDDATE"] = end_norm
-                params.update(raw)
-
-                parsed, request_url, _ = perform_sync_request(
+                params = _page_params(head_params, tail_params, pager.start_position)
+
+                parsed, request_url = perform_sync_request(
                     client=self._client,
                     endpoint=endpoint,
                     params=params,
@@ -314,79 +337,60 @@ class DataService:
                     # strict modeでは公式エラーを透過させる。
                     pass
 
-                records = expand_timeseries_rows(
+                records = iter_expand_timeseries_rows(
                     parsed.rows,
                     source_page_index=page_index,
                     code_order_map=code_order_map,
                 )
-                for record in records:
-                    key = (record.series_code, record.survey_date)
-                    existing = dedupe.get(key)
-                    if existing is None:
-                        dedupe[key] = record
-                        continue
-                    if existing.last_update != record.last_update:
-                        conflicts_count += 1
-                        conflicts_sample.append(
-                            {
-                                "series_code": record.series_code,
-                                "survey_date": record.survey_date,
-                                "existing_last_update": existing.last_update,
-                                "incoming_last_update": record.last_update,
-                            }
-                        )
-                        if self._config.consistency_mode == ConsistencyMode.STRICT:
-                            raise BojConsistencyError(
-                                signal="last_update_conflict",
-                                details=conflicts_sample[-1],
-                            )
-                    dedupe[key] = _choose_record(existing, record)
-
-                next_position = parsed.next_position
-                current_resume = create_resume_token(
-                    api="code",
-                    api_origin=self._config.base_url,
-                    request_fingerprint=fingerprint,
-                    chunk_index=chunk_index,
-                    next_position=next_position or 1,
-                    lang=lang_norm.value,
-                    format=format_norm.value,
-                    parser_version=PARSER_VERSION,
-                    normalizer_version=NORMALIZER_VERSION,
-                    schema_version=SCHEMA_VERSION,
-                    code_order_map=code_order_map,
-                )
-                last_meta = ResponseMeta(
-                    status=parsed.status,
-                    message_id=parsed.message_id,
-                    message=parsed.message,
-                    date_raw=parsed.date_raw,
-                    date_parsed=parsed.date_parsed,
-                    date_parse_warning=parsed.date_parse_warning,
-                    date_semantics="output_file_created_at",
-                    next_position=parsed.next_position,
-                    parameters=parsed.parameters,
-                    request_url=request_url,
-                    schema_version=SCHEMA_VERSION,
-                    parser_version=PARSER_VERSION,
-                    normalizer_version=NORMALIZER_VERSION,
-                    resume_token=current_resume,
-                    conflicts_count=conflicts_count,
-                    conflicts_sample=conflicts_sample[:20],
+                conflicts_count += _merge_records(
+                    records,
+                    dedupe=dedupe,
+                    conflicts_sample=conflicts_sample,
+                    strict=strict_consistency,
+                    collect=chunk_records if use_checkpoint else None,
                 )
+
                 page_index += 1
-                if not advance_code_position(state=pager, next_position=next_position):
+                if not advance_code_position(state=pager, next_position=parsed.next_position):
                     break
 
+            current_resume = create_resume_token(
+                api="code",
+                api_origin=self._config.base_url,
+                request_fingerprint=fingerprint,
+                chunk_index=chunk_index,
+                next_position=parsed.next_position or 1,
+                lang=lang_norm.value,
+                format=format_norm.value,
+                parser_version=PARSER_VERSION,
+                normalizer_version=NORMALIZER_VERSION,
+                schema_version=SCHEMA_VERSION,
+                code_order_map=code_order_map,
+            )
+            last_meta = _meta_from_page(
+                parsed,
+                request_url,
+                resume_token=current_resume,
+                conflicts_count=conflicts_count,
+                conflicts_sample=conflicts_sample,
+            )
+            if checkpoint:
+                chunk_sources.append(_chunk_source(chunk_index, "fetched", time.time()))
+            if use_checkpoint:
+                _save_chunk_checkpoint(self._cache, chunk_key, chunk_records, last_meta)
+
         records_sorted = _sort_records(
-            list(dedupe.values()),
+            dedupe.values(),
             output_order=output_order_norm,
         )
         meta = last_meta or _empty_meta(request_url="")
         if meta.next_position is None:
             meta.resume_token = None
+        _record_chunk_sources(meta, chunk_sources)
         frame = TimeSeriesFrame(records=records_sorted, meta=meta)
         self._cache.put(key=cache_key, payload=frame.to_cache_payload(), complete=True)
+        if checkpoint:
+            _clear_chunk_checkpoints(self._cache, cache_key, len(chunks))
         return frame
 
     def get_by_layer(
@@ -465,6 +469,7 @@ class DataService:
         if cache_hit and not cache_hit.stale:
             return TimeSeriesFrame.from_cache_payload(cache_hit.payload["payload"])  # type: ignore[arg-type]
 
+        fallback_signal: str | None = None
         if needs_resolve:
             result = self._get_by_layer_via_codes(
                 db=db_norm, frequency=freq_norm,
@@ -474,6 +479,7 @@ class DataService:
             )
             if result is not None:
                 return result
+            fallback_signal = "metadata_unavailable"
 
         pager = LayerPagerState(start_position=start_position or 1)
         if resume_token:
@@ -490,29 +496,24 @@ class DataService:
         dedupe: dict[tuple[str, str], TimeSeriesRecord] = {}
         conflicts_count = 0
         conflicts_sample: list[dict[str, Any]] = []
+        strict_consistency = self._config.consistency_mode == ConsistencyMode.STRICT
         window_signal: str | None = None
-        first_fetch = datetime.now(tz=_JST)
+        first_fetch = time.time()
         page_index = 0
-        last_meta: ResponseMeta | None = None
         code_order_map: dict[str, int] = {}
 
+        head_params = {
+            "DB": db_norm,
+            "FREQUENCY": freq_norm.value,
+            "LANG": lang_norm.value,
+            "FORMAT": format_norm.value,
+            "LAYER": ",".join(layer_norm),
+        }
+        tail_params = _tail_params(start=start_norm, end=end_norm, raw=raw)
         while True:
-            params: dict[str, str] = {
-                "DB": db_norm,
-                "FREQUENCY": freq_norm.value,
-                "LANG": lang_norm.value,
-                "FORMAT": format_norm.value,
-                "LAYER": ",".join(layer_norm),
-            }
-            if pager.start_position > 1:
-                params["STARTPOSITION"] = str(pager.start_position)
-            if start_norm:
-                params["STARTDATE"] = start_norm
-            if end_norm:
-                params["ENDDATE"] = end_norm
-            params.update(raw)
-
-            parsed, request_url, _ = perform_sync_request(
+            params = _page_params(head_params, tail_params, pager.start_position)
+
+            parsed, request_url = perform_sync_request(
                 client=self._client,
                 endpoint=endpoint,
                 params=params,
@@ -524,24 +525,24 @@ class DataService:
                 capture_full_response=self._config.capture_full_response,
             )
 
-            now = datetime.now(tz=_JST)
+            now = time.time()
             if _window_crossed(first_fetch=first_fetch, current=now):
                 window_signal = "window_crossed"
-                if self._config.consistency_mode == ConsistencyMode.STRICT:
+                if strict_consistency:
                     raise BojConsistencyError(
                         signal="window_crossed",
-                        details={"first_fetch": first_fetch.isoformat(), "current": now.isoformat()},
+                        details={"first_fetch": _jst_isoformat(first_fetch), "current": _jst_isoformat(now)},
                     )
 
-            records = expand_timeseries_rows(
+            records = iter_expand_timeseries_rows(
                 parsed.rows,
                 source_page_index=page_index,
                 code_order_map=code_order_map,
             )
+            # 既出系列は展開時の順序と同じ値になるため、setdefaultで常に代入してよい。
+            register_code = code_order_map.setdefault
             for record in records:
-                if record.series_code not in code_order_map:
-                    code_order_map[record.series_code] = len(code_order_map)
-                    record.original_code_index = code_order_map[record.series_code]
+                record.original_code_index = register_code(record.series_code, len(code_order_map))
                 key = (record.series_code, record.survey_date)
                 existing = dedupe.get(key)
                 if existing is None:
@@ -555,58 +556,48 @@ class DataService:
                         "existing_last_update": existing.last_update,
                         "incoming_last_update": record.last_update,
                     }
-                    conflicts_sample.append(detail)
-                    if self._config.consistency_mode == ConsistencyMode.STRICT:
+                    if len(conflicts_sample) < _CONFLICTS_SAMPLE_LIMIT:
+                        conflicts_sample.append(detail)
+                    if strict_consistency:
                         raise BojConsistencyError(signal="last_update_conflict", details=detail)
                 dedupe[key] = _choose_record(existing, record)
 
-            current_resume = create_resume_token(
-                api="layer",
-                api_origin=self._config.base_url,
-                request_fingerprint=fingerprint,
-                chunk_index=0,
-                next_position=parsed.next_position or 1,
-                lang=lang_norm.value,
-                format=format_norm.value,
-                parser_version=PARSER_VERSION,
-                normalizer_version=NORMALIZER_VERSION,
-                schema_version=SCHEMA_VERSION,
-                code_order_map=code_order_map,
-            )
-
-            last_meta = ResponseMeta(
-                status=parsed.status,
-                message_id=parsed.message_id,
-                message=parsed.message,
-                date_raw=parsed.date_raw,
-                date_parsed=parsed.date_parsed,
-                date_parse_warning=parsed.date_parse_warning,
-                date_semantics="output_file_created_at",
-                next_position=parsed.next_position,
-                parameters=parsed.parameters,
-                request_url=request_url,
-                schema_version=SCHEMA_VERSION,
-                parser_version=PARSER_VERSION,
-                normalizer_version=NORMALIZER_VERSION,
-                resume_token=current_resume,
-                consistency_signal=window_signal,
-                conflicts_count=conflicts_count,
-                conflicts_sample=conflicts_sample[:20],
-            )
-
             page_index += 1
             if not auto_paginate:
                 break
             if not advance_layer_position(state=pager, next_position=parsed.next_position):
                 break
 
+        current_resume = create_resume_token(
+            api="layer",
+            api_origin=self._config.base_url,
+            request_fingerprint=fingerprint,
+            chunk_index=0,
+            next_position=parsed.next_position or 1,
+            lang=lang_norm.value,
+            format=format_norm.value,
+            parser_version=PARSER_VERSION,
+            normalizer_version=NORMALIZER_VERSION,
+            schema_version=SCHEMA_VERSION,
+            code_order_map=code_order_map,
+        )
+        meta = _meta_from_page(
+            parsed,
+            request_url,
+            resume_token=current_resume,
+            conflicts_count=conflicts_count,
+            conflicts_sample=conflicts_sample,
+            consistency_signal=window_signal,
+        )
+
         records_sorted = _sort_records(
-            list(dedupe.values()),
+            dedupe.values(),
             output_order=self._config.output_order,
         )
-        meta = last_meta or _empty_meta(request_url="")
         if meta.next_position is None:
             meta.resume_token = None
+        if meta.consistency_signal is None:
+            meta.consistency_signal = fallback_signal
 
         frame = TimeSeriesFrame(records=records_sorted, meta=meta)
         self._cache.put(key=cache_key, payload=frame.to_cache_payload(), complete=True)
@@ -643,15 +634,12 @@ class DataService:
             TimeSeriesFrame、またはメタデータ取得失敗時は None。
         """
         resolve_url = f"bojstat://resolve-wildcard/{db}?layer=*&frequency={frequency.value}"
-        first_fetch = datetime.now(tz=_JST)
+        first_fetch = time.time()
 
         try:
             meta_frame = self._metadata_service.get(db=db, lang=Lang.JP)
         except Exception:
-            warnings.warn(
-                f"メタデータ取得に失敗したため Layer API に直接アクセスします: db={db}",
-                stacklevel=2,
-            )
+            _logger.warning("メタデータ取得に失敗したため Layer API に直接アクセスします: db=%s", db)
             return None
 
         codes = _resolve_codes_from_metadata(meta_frame, frequency)
@@ -666,14 +654,14 @@ class DataService:
         # get_by_code は内部でチャンク単位のキャッシュを保存するため、
         # strict モードの window_crossed チェックを先に行い、
         # キャッシュ汚染を防ぐ。
-        pre_code = datetime.now(tz=_JST)
+        pre_code = time.time()
         if _window_crossed(first_fetch=first_fetch, current=pre_code):
             if self._config.consistency_mode == ConsistencyMode.STRICT:
                 raise BojConsistencyError(
                     signal="window_crossed",
                     details={
-                        "first_fetch": first_fetch.isoformat(),
-                        "current": pre_code.isoformat(),
+                        "first_fetch": _jst_isoformat(first_fetch),
+                        "current": _jst_isoformat(pre_code),
                     },
                 )
 
@@ -686,14 +674,14 @@ class DataService:
             raw_params=raw if raw else None,
         )
 
-        now = datetime.now(tz=_JST)
+        now = time.time()
         if _window_crossed(first_fetch=first_fetch, current=now):
             if self._config.consistency_mode == ConsistencyMode.STRICT:
                 raise BojConsistencyError(
                     signal="window_crossed",
                     details={
-                        "first_fetch": first_fetch.isoformat(),
-                        "current": now.isoformat(),
+                        "first_fetch": _jst_isoformat(first_fetch),
+                        "current": _jst_isoformat(now),
                     },
                 )
             if frame.meta:
@@ -714,18 +702,14 @@ class DataService:
         *,
         resolve_wildcard: bool | None = None,
     ) -> str:
-        base = (
-            f"api={api}|origin={self._config.base_url}|lang={lang.value}|format={format.value}|"
-            f"parser={PARSER_VERSION}|normalizer={NORMALIZER_VERSION}|schema={SCHEMA_VERSION}|"
-            f"strict_api={self._config.strict_api}|auto_split={self._config.auto_split_codes}|"
-            f"consistency={self._config.consistency_mode.value}|"
-            f"conflict={self._config.conflict_resolution.value}|"
-            f"output_order={self._config.output_order.value}"
+        return _build_cache_key(
+            self._config,
+            api,
+            fingerprint,
+            lang,
+            format,
+            resolve_wildcard=resolve_wildcard,
         )
-        if resolve_wildcard is not None:
-            base += f"|resolve_wildcard={resolve_wildcard}"
-        base += f"|fp={fingerprint}"
-        return base
 
 
 class AsyncDataService:
@@ -751,81 +735,6 @@ class AsyncDataService:
     async def get_by_code(self, **kwargs: Any) -> TimeSeriesFrame:
         """同期実装互換の非同期版。"""
 
-        return await _run_data_service_async(self._get_by_code_impl(**kwargs))
-
-    async def _get_by_code_impl(self, **kwargs: Any) -> TimeSeriesFrame:
-        sync = _AsyncBridge(self)
-        return await sync.get_by_code(**kwargs)
-
-    async def get_by_layer(self, **kwargs: Any) -> TimeSeriesFrame:
-        """同期実装互換の非同期版。"""
-
-        return await _run_data_service_async(self._get_by_layer_impl(**kwargs))
-
-    async def _get_by_layer_impl(self, **kwargs: Any) -> TimeSeriesFrame:
-        sync = _AsyncBridge(self)
-        return await sync.get_by_layer(**kwargs)
-
-
-class _AsyncBridge:
-    """同期ロジックを非同期トランスポートで再利用する橋渡し。"""
-
-    def __init__(self, owner: AsyncDataService) -> None:
-        self._owner = owner
-
-    async def get_by_code(self, **kwargs: Any) -> TimeSeriesFrame:
-        return await _get_by_code_async(owner=self._owner, **kwargs)
-
-    async def get_by_layer(self, **kwargs: Any) -> TimeSeriesFrame:
-        return await _get_by_layer_async(owner=self._owner, **kwargs)
-
-
-async def _run_data_service_async(awaitable: Any) -> TimeSeriesFrame:
-    return await awaitable
-
-
-async def _get_by_code_async(owner: AsyncDataService, **kwargs: Any) -> TimeSeriesFrame:
-    service = _AsyncDataWorker(owner)
-    return await service.get_by_code(**kwargs)
-
-
-async def _get_by_layer_async(owner: AsyncDataService, **kwargs: Any) -> TimeSeriesFrame:
-    service = _AsyncDataWorker(owner)
-    return await service.get_by_layer(**kwargs)
-
-
-class _AsyncDataWorker:
-    """AsyncDataService実処理。"""
-
-    def __init__(self, owner: AsyncDataService) -> None:
-        self._owner = owner
-
-    async def get_by_code(self, **kwargs: Any) -> TimeSeriesFrame:
-        # 実装の一貫性のため、同期版ロジックを非同期トランスポートで再構成する。
-        return await _get_by_code_async_impl(self._owner, **kwargs)
-
-    async def get_by_layer(self, **kwargs: Any) -> TimeSeriesFrame:
-        return await _get_by_layer_async_impl(self._owner, **kwargs)
-
-
-async def _get_by_code_async_impl(owner: AsyncDataService, **kwargs: Any) -> TimeSeriesFrame:
-    # 同期版の仕様を保つため、主要ロジックは共通関数に寄せる。
-    sync_like = _DataAsyncLogic(owner)
-    return await sync_like.get_by_code(**kwargs)
-
-
-async def _get_by_layer_async_impl(owner: AsyncDataService, **kwargs: Any) -> TimeSeriesFrame:
-    sync_like = _DataAsyncLogic(owner)
-    return await sync_like.get_by_layer(**kwargs)
-
-
-class _DataAsyncLogic:
-    """非同期版の本体ロジック。"""
-
-    def __init__(self, owner: AsyncDataService) -> None:
-        self._owner = owner
-
-    async def get_by_code(self, **kwargs: Any) -> TimeSeriesFrame:
         # 同期版DataServiceの処理を最小限で再実装。
         db = kwargs["db"]
         code = kwargs["code"]
@@ -840,19 +749,19 @@ class _DataAsyncLogic:
         resume_token = kwargs.get("resume_token")
         output_order = kwargs.get("output_order")
 
-        strict_mode = self._owner._config.strict_api if strict_api is None else strict_api
+        strict_mode = self._config.strict_api if strict_api is None else strict_api
         split_mode = (
-            self._owner._config.auto_split_codes if auto_split_codes is None else auto_split_codes
+            self._config.auto_split_codes if auto_split_codes is None else auto_split_codes
         )
         validate_strict_auto_split(strict_api=strict_mode, auto_split_codes=split_mode)
 
-        lang_norm = normalize_lang(lang or self._owner._config.lang)
-        format_norm = normalize_format(format or self._owner._config.format)
+        lang_norm = normalize_lang(lang or self._config.lang)
+        format_norm = normalize_format(format or self._config.format)
         db_norm = normalize_db(db)
         codes = normalize_codes(code)
         raw = normalize_raw_params(
             dict(raw_params) if raw_params is not None else None,
-            allow_raw_override=self._owner._config.allow_raw_override,
+            allow_raw_override=self._config.allow_raw_override,
         )
         start_norm, end_norm = normalize_code_periods(start=start, end=end)
 
@@ -862,12 +771,12 @@ class _DataAsyncLogic:
         output_order_norm = (
             output_order
             if isinstance(output_order, OutputOrder)
-            else OutputOrder(output_order or self._owner._config.output_order)
+            else OutputOrder(output_order or self._config.output_order)
         )
 
         fingerprint = build_request_fingerprint(
             {
-                "api_origin": self._owner._config.base_url,
+                "api_origin": self._config.base_url,
                 "endpoint": endpoint,
                 "db": db_norm,
                 "code": codes,
@@ -900,15 +809,8 @@ class _DataAsyncLogic:
             chunk_start_position = token_state.next_position
             code_order_map = token_state.code_order_map
 
-        cache_key = (
-            f"api=code|origin={self._owner._config.base_url}|lang={lang_norm.value}|format={format_norm.value}|"
-            f"parser={PARSER_VERSION}|normalizer={NORMALIZER_VERSION}|schema={SCHEMA_VERSION}|"
-            f"strict_api={self._owner._config.strict_api}|auto_split={self._owner._config.auto_split_codes}|"
-            f"consistency={self._owner._config.consistency_mode.value}|"
-            f"conflict={self._owner._config.conflict_resolution.value}|"
-            f"output_order={self._owner._config.output_order.value}|fp={fingerprint}"
-        )
-        cache_hit = self._owner._cache.get(key=cache_key, mode=self._owner._config.cache.mode)
+        cache_key = _build_cache_key(self._config, "code", fingerprint, lang_norm, format_norm)
+        cache_hit = self._cache.get(key=cache_key, mode=self._config.cache.mode)
         if cache_hit and not cache_hit.stale:
             return TimeSeriesFrame.from_cache_payload(cache_hit.payload["payload"])  # type: ignore[arg-type]
 
@@ -917,113 +819,208 @@ class _DataAsyncLogic:
         conflicts_sample: list[dict[str, Any]] = []
         conflicts_count = 0
 
+        # チャンクは互いに独立した要求のため並行して取得し、統合はチャンク順に行う。
+        # 重複排除・競合検出・resume_tokenの内容は逐次取得時と同じになる。
+        strict_consistency = self._config.consistency_mode == ConsistencyMode.STRICT
+        checkpoint = _chunk_checkpoint_enabled(self._config, len(chunks))
+        # 同時取得数の上限。送信間隔はレート制御側で別途守られる。
+        semaphore = asyncio.Semaphore(self._config.chunk_fetch_concurrency)
+        pending: list[int] = []
+        cached_chunks: dict[int, tuple[TimeSeriesFrame, float]] = {}
+        chunk_sources: list[dict[str, Any]] = []
+        tasks: dict[int, asyncio.Task[_ChunkPages]] = {}
         for chunk_index, chunk in enumerate(chunks):
             if chunk_index < start_chunk_index:
                 continue
-            pager = CodePagerState(
-                chunk_index=chunk_index,
-                start_position=chunk_start_position if chunk_index == start_chunk_index else 1,
-            )
-            page_index = 0
-            while True:
-                params = {
-                    "DB": db_norm,
-                    "CODE": ",".join(chunk),
-                    "LANG": lang_norm.value,
-                    "FORMAT": format_norm.value,
-                }
-                if pager.start_position > 1:
-                    params["STARTPOSITION"] = str(pager.start_position)
-                if start_norm:
-                    params["STARTDATE"] = start_norm
-                if end_norm:
-                    params["ENDDATE"] = end_norm
-                params.update(raw)
-
-                parsed, request_url, _ = await perform_async_request(
-                    client=self._owner._client,
+            chunk_start = chunk_start_position if chunk_index == start_chunk_index else 1
+            # 途中位置から再開するチャンクは全件が揃わないため、チェックポイントを使わない。
+            use_checkpoint = checkpoint and chunk_start == 1
+            chunk_key = _chunk_checkpoint_key(cache_key, chunk_index)
+            pending.append(chunk_index)
+            if use_checkpoint:
+                loaded = _load_chunk_checkpoint(self._cache, self._config, chunk_key)
+                if loaded is not None:
+                    cached_chunks[chunk_index] = loaded
+                    continue
+            tasks[chunk_index] = asyncio.create_task(
+                self._fetch_code_chunk_pages(
+                    semaphore=semaphore,
                     endpoint=endpoint,
-                    params=params,
+                    db=db_norm,
+                    chunk=chunk,
+                    chunk_index=chunk_index,
+                    start_position=chunk_start,
                     lang=lang_norm,
                     format=format_norm,
-                    retry_config=self._owner._retry_config,
-                    limiter=self._owner._limiter,
-                    user_agent=self._owner._config.user_agent,
-                    capture_full_response=self._owner._config.capture_full_response,
-                )
-                records = expand_timeseries_rows(
-                    parsed.rows,
-                    source_page_index=page_index,
+                    start=start_norm,
+                    end=end_norm,
+                    raw=raw,
+                    fingerprint=fingerprint,
                     code_order_map=code_order_map,
+                    checkpoint_key=chunk_key if use_checkpoint else None,
                 )
-                for record in records:
-                    key = (record.series_code, record.survey_date)
-                    existing = dedupe.get(key)
-                    if existing is None:
-                        dedupe[key] = record
-                        continue
-                    if existing.last_update != record.last_update:
-                        conflicts_count += 1
-                        conflicts_sample.append(
-                            {
-                                "series_code": record.series_code,
-                                "survey_date": record.survey_date,
-                                "existing_last_update": existing.last_update,
-                                "incoming_last_update": record.last_update,
-                            }
+            )
+        try:
+            for chunk_index in pending:
+                loaded = cached_chunks.get(chunk_index)
+                if loaded is not None:
+                    cached_chunk, fetched_at = loaded
+                    chunk_sources.append(_chunk_source(chunk_index, "checkpoint", fetched_at))
+                    conflicts_count += _merge_records(
+                        cached_chunk.records,
+                        dedupe=dedupe,
+                        conflicts_sample=conflicts_sample,
+                        strict=strict_consistency,
+                    )
+                    last_meta = cached_chunk.meta
+                    last_meta.conflicts_count = conflicts_count
+                    last_meta.conflicts_sample = conflicts_sample.copy()
+                    continue
+
+                fetched = await tasks[chunk_index]
+                if checkpoint:
+                    chunk_sources.append(_chunk_source(chunk_index, "fetched", fetched.fetched_at))
+                if fetched.records is not None:
+                    # チェックポイント保存のため展開済みのレコードをそのまま統合する。
+                    conflicts_count += _merge_records(
+                        fetched.records,
+                        dedupe=dedupe,
+                        conflicts_sample=conflicts_sample,
+                        strict=strict_consistency,
+                    )
+                else:
+                    for page_index, (parsed, _request_url) in enumerate(fetched.pages):
+                        conflicts_count += _merge_records(
+                            iter_expand_timeseries_rows(
+                                parsed.rows,
+                                source_page_index=page_index,
+                                code_order_map=code_order_map,
+                            ),
+                            dedupe=dedupe,
+                            conflicts_sample=conflicts_sample,
+                            strict=strict_consistency,
                         )
-                        if self._owner._config.consistency_mode == ConsistencyMode.STRICT:
-                            raise BojConsistencyError(
-                                signal="last_update_conflict",
-                                details=conflicts_sample[-1],
-                            )
-                    dedupe[key] = _choose_record(existing, record)
-
-                next_position = parsed.next_position
-                current_resume = create_resume_token(
-                    api="code",
-                    api_origin=self._owner._config.base_url,
-                    request_fingerprint=fingerprint,
-                    chunk_index=chunk_index,
-                    next_position=next_position or 1,
-                    lang=lang_norm.value,
-                    format=format_norm.value,
-                    parser_version=PARSER_VERSION,
-                    normalizer_version=NORMALIZER_VERSION,
-                    schema_version=SCHEMA_VERSION,
-                    code_order_map=code_order_map,
-                )
-                last_meta = ResponseMeta(
-                    status=parsed.status,
-                    message_id=parsed.message_id,
-                    message=parsed.message,
-                    date_raw=parsed.date_raw,
-                    date_parsed=parsed.date_parsed,
-                    date_parse_warning=parsed.date_parse_warning,
-                    date_semantics="output_file_created_at",
-                    next_position=parsed.next_position,
-                    parameters=parsed.parameters,
-                    request_url=request_url,
-                    schema_version=SCHEMA_VERSION,
-                    parser_version=PARSER_VERSION,
-                    normalizer_version=NORMALIZER_VERSION,
-                    resume_token=current_resume,
+
+                parsed, request_url = fetched.pages[-1]
+                last_meta = _meta_from_page(
+                    parsed,
+                    request_url,
+                    resume_token=_code_resume_token(
+                        self._config,
+                        fingerprint=fingerprint,
+                        chunk_index=chunk_index,
+                        next_position=parsed.next_position,
+                        lang=lang_norm,
+                        format=format_norm,
+                        code_order_map=code_order_map,
+                    ),
                     conflicts_count=conflicts_count,
-                    conflicts_sample=conflicts_sample[:20],
+                    conflicts_sample=conflicts_sample,
                 )
-                page_index += 1
-                if not advance_code_position(state=pager, next_position=next_position):
-                    break
+        finally:
+            # 例外で抜けた場合は未完了のチャンク取得を打ち切る。
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
 
-        records_sorted = _sort_records(list(dedupe.values()), output_order=output_order_norm)
+        records_sorted = _sort_records(dedupe.values(), output_order=output_order_norm)
         meta = last_meta or _empty_meta(request_url="")
         if meta.next_position is None:
             meta.resume_token = None
+        _record_chunk_sources(meta, chunk_sources)
         frame = TimeSeriesFrame(records=records_sorted, meta=meta)
-        self._owner._cache.put(key=cache_key, payload=frame.to_cache_payload(), complete=True)
+        self._cache.put(key=cache_key, payload=frame.to_cache_payload(), complete=True)
+        if checkpoint:
+            _clear_chunk_checkpoints(self._cache, cache_key, len(chunks))
         return frame
 
+    async def _fetch_code_chunk_pages(
+        self,
+        *,
+        semaphore: asyncio.Semaphore,
+        endpoint: str,
+        db: str,
+        chunk: Sequence[str],
+        chunk_index: int,
+        start_position: int,
+        lang: Lang,
+        format: Format,
+        start: str | None,
+        end: str | None,
+        raw: dict[str, str],
+        fingerprint: str,
+        code_order_map: dict[str, int],
+        checkpoint_key: str | None,
+    ) -> _ChunkPages:
+        """1チャンク分の全ページを取得する。
+
+        checkpoint_key 指定時は、取得を終えた時点でチャンクをチェックポイントへ書き込む。
+        前のチャンクの失敗で統合まで進まなくても、完了済みのチャンクは再実行時に再利用できる。
+        """
+
+        pager = CodePagerState(chunk_index=chunk_index, start_position=start_position)
+        pages: list[tuple[ParsedResponse, str]] = []
+        head_params = {
+            "DB": db,
+            "CODE": ",".join(chunk),
+            "LANG": lang.value,
+            "FORMAT": format.value,
+        }
+        tail_params = _tail_params(start=start, end=end, raw=raw)
+        async with semaphore:
+            while True:
+                params = _page_params(head_params, tail_params, pager.start_position)
+
+                parsed, request_url = await perform_async_request(
+                    client=self._client,
+                    endpoint=endpoint,
+                    params=params,
+                    lang=lang,
+                    format=format,
+                    retry_config=self._retry_config,
+                    limiter=self._limiter,
+                    user_agent=self._config.user_agent,
+                    capture_full_response=self._config.capture_full_response,
+                )
+                pages.append((parsed, request_url))
+                if not advance_code_position(state=pager, next_position=parsed.next_position):
+                    break
+        fetched_at = time.time()
+        if checkpoint_key is None:
+            return _ChunkPages(pages=pages, fetched_at=fetched_at)
+
+        records = [
+            record
+            for page_index, (page, _url) in enumerate(pages)
+            for record in iter_expand_timeseries_rows(
+                page.rows,
+                source_page_index=page_index,
+                code_order_map=code_order_map,
+            )
+        ]
+        parsed, request_url = pages[-1]
+        meta = _meta_from_page(
+            parsed,
+            request_url,
+            resume_token=_code_resume_token(
+                self._config,
+                fingerprint=fingerprint,
+                chunk_index=chunk_index,
+                next_position=parsed.next_position,
+                lang=lang,
+                format=format,
+                code_order_map=code_order_map,
+            ),
+            # 競合件数はチャンク統合時に数え直すため、チェックポイントには保存しない。
+            conflicts_count=0,
+            conflicts_sample=[],
+        )
+        _save_chunk_checkpoint(self._cache, checkpoint_key, records, meta)
+        return _ChunkPages(pages=pages, fetched_at=fetched_at, records=records)
+
     async def get_by_layer(self, **kwargs: Any) -> TimeSeriesFrame:
+        """同期実装互換の非同期版。"""
+
         db = kwargs["db"]
         frequency = kwargs["frequency"]
         layer = kwargs["layer"]
@@ -1037,8 +1034,8 @@ class _DataAsyncLogic:
         resume_token = kwargs.get("resume_token")
         resolve_wildcard = kwargs.get("resolve_wildcard")
 
-        lang_norm = normalize_lang(lang or self._owner._config.lang)
-        format_norm = normalize_format(format or self._owner._config.format)
+        lang_norm = normalize_lang(lang or self._config.lang)
+        format_norm = normalize_format(format or self._config.format)
         db_norm = normalize_db(db)
         freq_norm = normalize_frequency(frequency, required=True)
         assert freq_norm is not None
@@ -1046,13 +1043,13 @@ class _DataAsyncLogic:
         start_norm, end_norm = normalize_periods(start=start, end=end, frequency=freq_norm)
         raw = normalize_raw_params(
             dict(raw_params) if raw_params is not None else None,
-            allow_raw_override=self._owner._config.allow_raw_override,
+            allow_raw_override=self._config.allow_raw_override,
         )
 
         needs_resolve = (
-            self._owner._metadata_service is not None
+            self._metadata_service is not None
             and _should_resolve_wildcard(
-                config=self._owner._config,
+                config=self._config,
                 resolve_wildcard=resolve_wildcard,
                 layer_norm=layer_norm,
                 auto_paginate=auto_paginate,
@@ -1064,7 +1061,7 @@ class _DataAsyncLogic:
         endpoint = "/getDataLayer"
         fingerprint = build_request_fingerprint(
             {
-                "api_origin": self._owner._config.base_url,
+                "api_origin": self._config.base_url,
                 "endpoint": endpoint,
                 "db": db_norm,
                 "layer": layer_norm,
@@ -1073,8 +1070,8 @@ class _DataAsyncLogic:
                 "end": end_norm,
                 "lang": lang_norm.value,
                 "format": format_norm.value,
-                "consistency_mode": self._owner._config.consistency_mode.value,
-                "conflict_resolution": self._owner._config.conflict_resolution.value,
+                "consistency_mode": self._config.consistency_mode.value,
+                "conflict_resolution": self._config.conflict_resolution.value,
                 "parser_version": PARSER_VERSION,
                 "normalizer_version": NORMALIZER_VERSION,
                 "schema_version": SCHEMA_VERSION,
@@ -1083,22 +1080,17 @@ class _DataAsyncLogic:
         )
 
         resolve_mode = (
-            self._owner._config.resolve_wildcard if resolve_wildcard is None else resolve_wildcard
+            self._config.resolve_wildcard if resolve_wildcard is None else resolve_wildcard
         )
-        _rw_part = f"|resolve_wildcard={resolve_mode}" if resolve_mode is not None else ""
-        cache_key = (
-            f"api=layer|origin={self._owner._config.base_url}|lang={lang_norm.value}|format={format_norm.value}|"
-            f"parser={PARSER_VERSION}|normalizer={NORMALIZER_VERSION}|schema={SCHEMA_VERSION}|"
-            f"strict_api={self._owner._config.strict_api}|auto_split={self._owner._config.auto_split_codes}|"
-            f"consistency={self._owner._config.consistency_mode.value}|"
-            f"conflict={self._owner._config.conflict_resolution.value}|"
-            f"output_order={self._owner._config.output_order.value}"
-            f"{_rw_part}|fp={fingerprint}"
+        cache_key = _build_cache_key(
+            self._config, "layer", fingerprint, lang_norm, format_norm,
+            resolve_wildcard=resolve_mode,
         )
-        cache_hit = self._owner._cache.get(key=cache_key, mode=self._owner._config.cache.mode)
+        cache_hit = self._cache.get(key=cache_key, mode=self._config.cache.mode)
         if cache_hit and not cache_hit.stale:
             return TimeSeriesFrame.from_cache_payload(cache_hit.payload["payload"])  # type: ignore[arg-type]
 
+        fallback_signal: str | None = None
         if needs_resolve:
             result = await self._get_by_layer_via_codes(
                 db=db_norm, frequency=freq_norm,
@@ -1108,6 +1100,7 @@ class _DataAsyncLogic:
             )
             if result is not None:
                 return result
+            fallback_signal = "metadata_unavailable"
 
         pager = LayerPagerState(start_position=start_position or 1)
         if resume_token:
@@ -1124,58 +1117,53 @@ class _DataAsyncLogic:
         dedupe: dict[tuple[str, str], TimeSeriesRecord] = {}
         conflicts_count = 0
         conflicts_sample: list[dict[str, Any]] = []
+        strict_consistency = self._config.consistency_mode == ConsistencyMode.STRICT
         window_signal: str | None = None
-        first_fetch = datetime.now(tz=_JST)
+        first_fetch = time.time()
         page_index = 0
-        last_meta: ResponseMeta | None = None
         code_order_map: dict[str, int] = {}
 
+        head_params = {
+            "DB": db_norm,
+            "FREQUENCY": freq_norm.value,
+            "LANG": lang_norm.value,
+            "FORMAT": format_norm.value,
+            "LAYER": ",".join(layer_norm),
+        }
+        tail_params = _tail_params(start=start_norm, end=end_norm, raw=raw)
         while True:
-            params: dict[str, str] = {
-                "DB": db_norm,
-                "FREQUENCY": freq_norm.value,
-                "LANG": lang_norm.value,
-                "FORMAT": format_norm.value,
-                "LAYER": ",".join(layer_norm),
-            }
-            if pager.start_position > 1:
-                params["STARTPOSITION"] = str(pager.start_position)
-            if start_norm:
-                params["STARTDATE"] = start_norm
-            if end_norm:
-                params["ENDDATE"] = end_norm
-            params.update(raw)
-
-            parsed, request_url, _ = await perform_async_request(
-                client=self._owner._client,
+            params = _page_params(head_params, tail_params, pager.start_position)
+
+            parsed, request_url = await perform_async_request(
+                client=self._client,
                 endpoint=endpoint,
                 params=params,
                 lang=lang_norm,
                 format=format_norm,
-                retry_config=self._owner._retry_config,
-                limiter=self._owner._limiter,
-                user_agent=self._owner._config.user_agent,
-                capture_full_response=self._owner._config.capture_full_response,
+                retry_config=self._retry_config,
+                limiter=self._limiter,
+                user_agent=self._config.user_agent,
+                capture_full_response=self._config.capture_full_response,
             )
 
-            now = datetime.now(tz=_JST)
+            now = time.time()
             if _window_crossed(first_fetch=first_fetch, current=now):
                 window_signal = "window_crossed"
-                if self._owner._config.consistency_mode == ConsistencyMode.STRICT:
+                if strict_consistency:
                     raise BojConsistencyError(
                         signal="window_crossed",
-                        details={"first_fetch": first_fetch.isoformat(), "current": now.isoformat()},
+                        details={"first_fetch": _jst_isoformat(first_fetch), "current": _jst_isoformat(now)},
                     )
 
-            records = expand_timeseries_rows(
+            records = iter_expand_timeseries_rows(
                 parsed.rows,
                 source_page_index=page_index,
                 code_order_map=code_order_map,
             )
+            # 既出系列は展開時の順序と同じ値になるため、setdefaultで常に代入してよい。
+            register_code = code_order_map.setdefault
             for record in records:
-                if record.series_code not in code_order_map:
-                    code_order_map[record.series_code] = len(code_order_map)
-                    record.original_code_index = code_order_map[record.series_code]
+                record.original_code_index = register_code(record.series_code, len(code_order_map))
                 key = (record.series_code, record.survey_date)
                 existing = dedupe.get(key)
                 if existing is None:
@@ -1189,43 +1177,12 @@ class _DataAsyncLogic:
                         "existing_last_update": existing.last_update,
                         "incoming_last_update": record.last_update,
                     }
-                    conflicts_sample.append(detail)
-                    if self._owner._config.consistency_mode == ConsistencyMode.STRICT:
+                    if len(conflicts_sample) < _CONFLICTS_SAMPLE_LIMIT:
+                        conflicts_sample.append(detail)
+                    if strict_consistency:
                         raise BojConsistencyError(signal="last_update_conflict", details=detail)
                 dedupe[key] = _choose_record(existing, record)
 
-            current_resume = create_resume_token(
-                api="layer",
-                api_origin=self._owner._config.base_url,
-                request_fingerprint=fingerprint,
-                chunk_index=0,
-                next_position=parsed.next_position or 1,
-                lang=lang_norm.value,
-                format=format_norm.value,
-                parser_version=PARSER_VERSION,
-                normalizer_version=NORMALIZER_VERSION,
-                schema_version=SCHEMA_VERSION,
-                code_order_map=code_order_map,
-            )
-            last_meta = ResponseMeta(
-                status=parsed.status,
-                message_id=parsed.message_id,
-                message=parsed.message,
-                date_raw=parsed.date_raw,
-                date_parsed=parsed.date_parsed,
-                date_parse_warning=parsed.date_parse_warning,
-                date_semantics="output_file_created_at",
-                next_position=parsed.next_position,
-                parameters=parsed.parameters,
-                request_url=request_url,
-                schema_version=SCHEMA_VERSION,
-                parser_version=PARSER_VERSION,
-                normalizer_version=NORMALIZER_VERSION,
-                resume_token=current_resume,
-                consistency_signal=window_signal,
-                conflicts_count=conflicts_count,
-                conflicts_sample=conflicts_sample[:20],
-            )
             page_index += 1
 
             if not auto_paginate:
@@ -1233,12 +1190,35 @@ class _DataAsyncLogic:
             if not advance_layer_position(state=pager, next_position=parsed.next_position):
                 break
 
-        records_sorted = _sort_records(list(dedupe.values()), output_order=self._owner._config.output_order)
-        meta = last_meta or _empty_meta(request_url="")
+        current_resume = create_resume_token(
+            api="layer",
+            api_origin=self._config.base_url,
+            request_fingerprint=fingerprint,
+            chunk_index=0,
+            next_position=parsed.next_position or 1,
+            lang=lang_norm.value,
+            format=format_norm.value,
+            parser_version=PARSER_VERSION,
+            normalizer_version=NORMALIZER_VERSION,
+            schema_version=SCHEMA_VERSION,
+            code_order_map=code_order_map,
+        )
+        meta = _meta_from_page(
+            parsed,
+            request_url,
+            resume_token=current_resume,
+            conflicts_count=conflicts_count,
+            conflicts_sample=conflicts_sample,
+            consistency_signal=window_signal,
+        )
+
+        records_sorted = _sort_records(dedupe.values(), output_order=self._config.output_order)
         if meta.next_position is None:
             meta.resume_token = None
+        if meta.consistency_signal is None:
+            meta.consistency_signal = fallback_signal
         frame = TimeSeriesFrame(records=records_sorted, meta=meta)
-        self._owner._cache.put(key=cache_key, payload=frame.to_cache_payload(), complete=True)
+        self._cache.put(key=cache_key, payload=frame.to_cache_payload(), complete=True)
         return frame
 
     async def _get_by_layer_via_codes(
@@ -1255,15 +1235,12 @@ class _DataAsyncLogic:
     ) -> TimeSeriesFrame | None:
         """非同期版の階層ワイルドカード→コードAPI委譲。詳細は同期版docstring参照。"""
         resolve_url = f"bojstat://resolve-wildcard/{db}?layer=*&frequency={frequency.value}"
-        first_fetch = datetime.now(tz=_JST)
+        first_fetch = time.time()
 
         try:
-            meta_frame = await self._owner._metadata_service.get(db=db, lang=Lang.JP)
+            meta_frame = await self._metadata_service.get(db=db, lang=Lang.JP)
         except Exception:
-            warnings.warn(
-                f"メタデータ取得に失敗したため Layer API に直接アクセスします: db={db}",
-                stacklevel=2,
-            )
+            _logger.warning("メタデータ取得に失敗したため Layer API に直接アクセスします: db=%s", db)
             return None
 
         codes = _resolve_codes_from_metadata(meta_frame, frequency)
@@ -1272,17 +1249,17 @@ class _DataAsyncLogic:
                 records=[],
                 meta=_empty_meta(request_url=resolve_url),
             )
-            self._owner._cache.put(key=cache_key, payload=empty.to_cache_payload(), complete=True)
+            self._cache.put(key=cache_key, payload=empty.to_cache_payload(), complete=True)
             return empty
 
-        pre_code = datetime.now(tz=_JST)
+        pre_code = time.time()
         if _window_crossed(first_fetch=first_fetch, current=pre_code):
-            if self._owner._config.consistency_mode == ConsistencyMode.STRICT:
+            if self._config.consistency_mode == ConsistencyMode.STRICT:
                 raise BojConsistencyError(
                     signal="window_crossed",
                     details={
-                        "first_fetch": first_fetch.isoformat(),
-                        "current": pre_code.isoformat(),
+                        "first_fetch": _jst_isoformat(first_fetch),
+                        "current": _jst_isoformat(pre_code),
                     },
                 )
 
@@ -1295,14 +1272,14 @@ class _DataAsyncLogic:
             raw_params=raw if raw else None,
         )
 
-        now = datetime.now(tz=_JST)
+        now = time.time()
         if _window_crossed(first_fetch=first_fetch, current=now):
-            if self._owner._config.consistency_mode == ConsistencyMode.STRICT:
+            if self._config.consistency_mode == ConsistencyMode.STRICT:
                 raise BojConsistencyError(
                     signal="window_crossed",
                     details={
-                        "first_fetch": first_fetch.isoformat(),
-                        "current": now.isoformat(),
+                        "first_fetch": _jst_isoformat(first_fetch),
+                        "current": _jst_isoformat(now),
                     },
                 )
             if frame.meta:
@@ -1311,10 +1288,236 @@ class _DataAsyncLogic:
         if frame.meta:
             frame.meta.request_url = resolve_url
 
-        self._owner._cache.put(key=cache_key, payload=frame.to_cache_payload(), complete=True)
+        self._cache.put(key=cache_key, payload=frame.to_cache_payload(), complete=True)
         return frame
 
 
+def _tail_params(*, start: str | None, end: str | None, raw: dict[str, str]) -> dict[str, str]:
+    """STARTPOSITIONより後ろに置く、ページ間で不変な要求パラメータを組み立てる。"""
+
+    tail: dict[str, str] = {}
+    if start:
+        tail["STARTDATE"] = start
+    if end:
+        tail["ENDDATE"] = end
+    tail.update(raw)
+    return tail
+
+
+def _page_params(head: dict[str, str], tail: dict[str, str], start_position: int) -> dict[str, str]:
+    """ページ位置を差し込んで1ページ分の要求パラメータを返す。
+
+    rawによる上書きや並び順は、毎ページ組み立て直していた従来と同じになる。
+    """
+
+    if start_position > 1:
+        return {**head, "STARTPOSITION": str(start_position), **tail}
+    return {**head, **tail}
+
+
+@lru_cache(maxsize=16)
+def _base_cache_key(
+    api: str,
+    base_url: str,
+    lang: str,
+    format: str,
+    strict_api: bool,
+    auto_split_codes: bool,
+    consistency_mode: str,
+    conflict_resolution: str,
+    output_order: str,
+) -> str:
+    # 指紋以外の部分はクライアント設定ごとに不変のため、組み立て結果を再利用する。
+    return (
+        f"api={api}|origin={base_url}|lang={lang}|format={format}|"
+        f"parser={PARSER_VERSION}|normalizer={NORMALIZER_VERSION}|schema={SCHEMA_VERSION}|"
+        f"strict_api={strict_api}|auto_split={auto_split_codes}|"
+        f"consistency={consistency_mode}|"
+        f"conflict={conflict_resolution}|"
+        f"output_order={output_order}"
+    )
+
+
+def _build_cache_key(
+    config: ClientConfig,
+    api: str,
+    fingerprint: str,
+    lang: Lang,
+    format: Format,
+    *,
+    resolve_wildcard: bool | None = None,
+) -> str:
+    base = _base_cache_key(
+        api,
+        config.base_url,
+        lang.value,
+        format.value,
+        config.strict_api,
+        config.auto_split_codes,
+        config.consistency_mode.value,
+        config.conflict_resolution.value,
+        config.output_order.value,
+    )
+    if resolve_wildcard is not None:
+        return f"{base}|resolve_wildcard={resolve_wildcard}|fp={fingerprint}"
+    return f"{base}|fp={fingerprint}"
+
+
+def _merge_records(
+    records: Iterable[TimeSeriesRecord],
+    *,
+    dedupe: dict[tuple[str, str], TimeSeriesRecord],
+    conflicts_sample: list[dict[str, Any]],
+    strict: bool,
+    collect: list[TimeSeriesRecord] | None = None,
+) -> int:
+    """レコードを重複排除表へ統合し、検出した競合件数を返す。
+
+    Args:
+        records: 統合するレコード。反復は1回のみ行う。
+        dedupe: (系列コード, 時期) をキーとする重複排除表。
+        conflicts_sample: 競合サンプルの蓄積先。
+        strict: 競合を検出した時点で例外を送出するか。
+        collect: 指定時は統合したレコードを順に追記する。
+
+    Raises:
+        BojConsistencyError: strict時に last_update の競合を検出した場合。
+    """
+
+    conflicts = 0
+    for record in records:
+        if collect is not None:
+            collect.append(record)
+        key = (record.series_code, record.survey_date)
+        existing = dedupe.get(key)
+        if existing is None:
+            dedupe[key] = record
+            continue
+        if existing.last_update != record.last_update:
+            conflicts += 1
+            detail = {
+                "series_code": record.series_code,
+                "survey_date": record.survey_date,
+                "existing_last_update": existing.last_update,
+                "incoming_last_update": record.last_update,
+            }
+            if len(conflicts_sample) < _CONFLICTS_SAMPLE_LIMIT:
+                conflicts_sample.append(detail)
+            if strict:
+                raise BojConsistencyError(
+                    signal="last_update_conflict",
+                    details=detail,
+                )
+        dedupe[key] = _choose_record(existing, record)
+    return conflicts
+
+
+def _chunk_checkpoint_enabled(config: ClientConfig, chunk_count: int) -> bool:
+    """チャンク単位のチェックポイントを保存・利用するかを判定する。"""
+
+    return chunk_count > 1 and config.cache.dir is not None and config.cache.mode is not CacheMode.OFF
+
+
+@dataclass(slots=True)
+class _ChunkPages:
+    """非同期取得した1チャンク分の応答。"""
+
+    pages: list[tuple[ParsedResponse, str]]
+    fetched_at: float
+    records: list[TimeSeriesRecord] | None = None
+
+
+def _code_resume_token(
+    config: ClientConfig,
+    *,
+    fingerprint: str,
+    chunk_index: int,
+    next_position: int | None,
+    lang: Lang,
+    format: Format,
+    code_order_map: dict[str, int],
+) -> str:
+    """Code APIのチャンク位置を表す resume_token を生成する。"""
+
+    return create_resume_token(
+        api="code",
+        api_origin=config.base_url,
+        request_fingerprint=fingerprint,
+        chunk_index=chunk_index,
+        next_position=next_position or 1,
+        lang=lang.value,
+        format=format.value,
+        parser_version=PARSER_VERSION,
+        normalizer_version=NORMALIZER_VERSION,
+        schema_version=SCHEMA_VERSION,
+        code_order_map=code_order_map,
+    )
+
+
+def _chunk_checkpoint_key(cache_key: str, chunk_index: int) -> str:
+    """チャンク単位のチェックポイントのキャッシュキーを返す。"""
+
+    return f"{cache_key}|chunk={chunk_index}"
+
+
+def _chunk_source(chunk_index: int, source: str, fetched_at: float) -> dict[str, Any]:
+    """チャンクの取得元と取得時刻をメタ情報用の辞書にまとめる。"""
+
+    return {"chunk_index": chunk_index, "source": source, "fetched_at": _jst_isoformat(fetched_at)}
+
+
+def _load_chunk_checkpoint(
+    cache: FileCache,
+    config: ClientConfig,
+    key: str,
+) -> tuple[TimeSeriesFrame, float] | None:
+    """完了済みチャンクのチェックポイントを読み込み、保存時刻と組で返す。
+
+    一度しか読まないため、メモリ上のLRUには載せない。
+    """
+
+    hit = cache.get(key=key, mode=config.cache.mode, memoize=False)
+    if hit is None or hit.stale:
+        return None
+    frame = TimeSeriesFrame.from_cache_payload(hit.payload["payload"])  # type: ignore[arg-type]
+    return frame, float(hit.payload["created_at"])
+
+
+def _save_chunk_checkpoint(
+    cache: FileCache,
+    key: str,
+    records: list[TimeSeriesRecord],
+    meta: ResponseMeta,
+) -> None:
+    """取得を終えたチャンクをチェックポイントとして書き込む。
+
+    途中のチャンクで失敗しても、再実行時に完了済みチャンクの再取得を省ける。
+    """
+
+    frame = TimeSeriesFrame(records=records, meta=meta)
+    cache.put(key=key, payload=frame.to_cache_payload(), complete=True, memoize=False)
+
+
+def _clear_chunk_checkpoints(cache: FileCache, cache_key: str, chunk_count: int) -> None:
+    """結合結果の保存後、不要になったチャンク単位のチェックポイントを削除する。"""
+
+    for chunk_index in range(chunk_count):
+        cache.delete(key=_chunk_checkpoint_key(cache_key, chunk_index))
+
+
+def _record_chunk_sources(meta: ResponseMeta, chunk_sources: list[dict[str, Any]]) -> None:
+    """チェックポイントを再利用した場合、チャンクごとの取得時刻をメタ情報へ記録する。
+
+    チャンク間で取得時刻が離れていると、系列間で更新の反映有無が揃わない可能性がある。
+    """
+
+    if not any(source["source"] == "checkpoint" for source in chunk_sources):
+        return
+    if meta.consistency_signal is None:
+        meta.consistency_signal = "checkpoint_resumed"
+    meta.consistency_details["chunks"] = chunk_sources
+
+
 def _choose_record(a: TimeSeriesRecord, b: TimeSeriesRecord) -> TimeSeriesRecord:
     if a.last_update is None:
         return b
@@ -1330,12 +1533,13 @@ def _choose_record(a: TimeSeriesRecord, b: TimeSeriesRecord) -> TimeSeriesRecord
 
 
 def _sort_records(
-    records: list[TimeSeriesRecord],
+    records: Iterable[TimeSeriesRecord],
     *,
     output_order: OutputOrder,
 ) -> list[TimeSeriesRecord]:
+    # 重複排除表のvaluesビューを直接受け取り、sorted/list の一度のコピーで済ませる。
     if output_order != OutputOrder.CANONICAL:
-        return records
+        return list(records)
 
     def key_fn(record: TimeSeriesRecord) -> tuple[int, str, str, str]:
         order = record.original_code_index if record.original_code_index is not None else 10**9
@@ -1344,9 +1548,17 @@ def _sort_records(
     return sorted(records, key=key_fn)
 
 
-def _window_crossed(*, first_fetch: datetime, current: datetime) -> bool:
-    def in_window(value: datetime) -> bool:
-        minute = value.hour * 60 + value.minute
+def _window_crossed(*, first_fetch: float, current: float) -> bool:
+    """公表時間帯（JST 08:50〜10:20）外で始めた取得が時間帯内へ入ったかを判定する。
+
+    Args:
+        first_fetch: 取得開始時刻（UNIX秒）。
+        current: 判定時刻（UNIX秒）。
+    """
+
+    def in_window(value: float) -> bool:
+        # JSTは夏時間のない固定オフセットのため、datetimeを介さず時刻を求める。
+        minute = int(value + _JST_OFFSET_SECONDS) % 86400 // 60
         begin = 8 * 60 + 50
         end = begin + 90
         return begin <= minute <= end
@@ -1354,6 +1566,47 @@ def _window_crossed(*, first_fetch: datetime, current: datetime) -> bool:
     return (not in_window(first_fetch)) and in_window(current)
 
 
+def _jst_isoformat(timestamp: float) -> str:
+    """UNIX秒をJSTのISO 8601文字列へ変換する。"""
+
+    return datetime.fromtimestamp(timestamp, tz=_JST).isoformat()
+
+
+def _meta_from_page(
+    parsed: ParsedResponse,
+    request_url: str,
+    *,
+    resume_token: str | None,
+    conflicts_count: int,
+    conflicts_sample: list[dict[str, Any]],
+    consistency_signal: str | None = None,
+) -> ResponseMeta:
+    """最終ページの応答と統合結果から ResponseMeta を組み立てる。
+
+    ページ毎には組み立てず、ページ送りを終えた後に一度だけ呼び出す。
+    """
+
+    return ResponseMeta(
+        status=parsed.status,
+        message_id=parsed.message_id,
+        message=parsed.message,
+        date_raw=parsed.date_raw,
+        date_parsed=parsed.date_parsed,
+        date_parse_warning=parsed.date_parse_warning,
+        date_semantics="output_file_created_at",
+        next_position=parsed.next_position,
+        parameters=parsed.parameters,
+        request_url=request_url,
+        schema_version=SCHEMA_VERSION,
+        parser_version=PARSER_VERSION,
+        normalizer_version=NORMALIZER_VERSION,
+        resume_token=resume_token,
+        consistency_signal=consistency_signal,
+        conflicts_count=conflicts_count,
+        conflicts_sample=conflicts_sample.copy(),
+    )
+
+
 def _empty_meta(*, request_url: str) -> ResponseMeta:
     return ResponseMeta(
         status=200,
@@ -85,7 +85,7 @@ class MetadataService:
         }
         params.update(raw)
 
-        parsed, request_url, _ = perform_sync_request(
+        parsed, request_url = perform_sync_request(
             client=self._client,
             endpoint=endpoint,
             params=params,
@@ -190,7 +190,7 @@ class AsyncMetadataService:
         }
         params.update(raw)
 
-        parsed, request_url, _ = await perform_async_request(
+        parsed, request_url = await perform_async_request(
             client=self._client,
             endpoint=endpoint,
             params=params,
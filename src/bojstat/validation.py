@@ -6,10 +6,19 @@ import re
 import unicodedata
 import warnings
 from collections.abc import Iterable, Sequence
+from functools import lru_cache
 from typing import Any
 
 from bojstat.db_catalog import is_known_db
-from bojstat.enums import DB, Format, Frequency, Lang
+from bojstat.enums import (
+    DB,
+    FORMAT_BY_VALUE,
+    FREQUENCY_BY_VALUE,
+    LANG_BY_VALUE,
+    Format,
+    Frequency,
+    Lang,
+)
 from bojstat.errors import BojValidationError
 
 _FORBIDDEN_CHARS = {'<', '>', '"', '!', '|', '\\', '¥', ';', "'"}
@@ -27,6 +36,7 @@ _CORE_PARAM_KEYS = {
 _CODE_API_PERIOD_PATTERN = re.compile(r"^\d{4}(\d{2})?$")
 
 
+@lru_cache(maxsize=8)
 def normalize_lang(value: Lang | str | None) -> Lang:
     """言語入力を正規化する。
 
@@ -44,13 +54,13 @@ def normalize_lang(value: Lang | str | None) -> Lang:
         return Lang.JP
     if isinstance(value, Lang):
         return value
-    normalized = str(value).strip().upper()
-    try:
-        return Lang(normalized)
-    except ValueError as exc:
-        raise BojValidationError("LANG が不正です。", validation_code="invalid_lang") from exc
+    member = LANG_BY_VALUE.get(str(value).strip().upper())
+    if member is None:
+        raise BojValidationError("LANG が不正です。", validation_code="invalid_lang")
+    return member
 
 
+@lru_cache(maxsize=8)
 def normalize_format(value: Format | str | None) -> Format:
     """出力形式入力を正規化する。"""
 
@@ -58,13 +68,12 @@ def normalize_format(value: Format | str | None) -> Format:
         return Format.JSON
     if isinstance(value, Format):
         return value
-    normalized = str(value).strip().upper()
-    try:
-        return Format(normalized)
-    except ValueError as exc:
+    member = FORMAT_BY_VALUE.get(str(value).strip().upper())
+    if member is None:
         raise BojValidationError(
             "FORMAT が不正です。", validation_code="invalid_format"
-        ) from exc
+        )
+    return member
 
 
 def normalize_frequency(value: Frequency | str | None, *, required: bool) -> Frequency | None:
@@ -90,13 +99,12 @@ def normalize_frequency(value: Frequency | str | None, *, required: bool) -> Fre
         return None
     if isinstance(value, Frequency):
         return value
-    normalized = str(value).strip().upper()
-    try:
-        return Frequency(normalized)
-    except ValueError as exc:
+    member = FREQUENCY_BY_VALUE.get(str(value).strip().upper())
+    if member is None:
         raise BojValidationError(
             "FREQUENCY が不正です。", validation_code="invalid_frequency"
-        ) from exc
+        )
+    return member
 
 
 def normalize_db(value: DB | str) -> str:
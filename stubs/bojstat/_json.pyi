@@ -0,0 +1,21 @@
+from collections.abc import Callable
+from typing import Any
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+    """オブジェクトをUTF-8のJSONバイト列へ変換する。
+
+    Args:
+        obj: 直列化対象。
+        indent: 2スペースで整形するか。
+        sort_keys: キーを整列するか。
+        default: 直列化できない値の変換関数。
+
+    Returns:
+        JSONバイト列。
+    """
+def loads(data: bytes | str) -> Any:
+    """JSONバイト列または文字列を復元する。
+
+    Raises:
+        json.JSONDecodeError: JSONとして不正な場合。
+    """
@@ -15,18 +15,41 @@ class CacheHit:
     stale: bool
 
 class FileCache:
-    """JSONファイルベースキャッシュ。"""
-    def __init__(self, *, cache_dir: Path | None, ttl_seconds: int) -> None: ...
-    def get(self, *, key: str, mode: CacheMode, allow_incomplete: bool = False) -> CacheHit | None:
+    """ファイルベースキャッシュ。
+
+    各エントリは固定長ヘッダとJSON本文からなる。
+    """
+    def __init__(self, *, cache_dir: Path | None, ttl_seconds: int, fast_write: bool = False) -> None:
+        """キャッシュを初期化する。
+
+        Args:
+            cache_dir: キャッシュディレクトリ。Noneなら無効。
+            ttl_seconds: TTL秒。
+            fast_write: 一時ファイルを介さず直接書き込むか。
+                同時に複数プロセスが書き込む環境では安全でない。
+        """
+    def get(self, *, key: str, mode: CacheMode, allow_incomplete: bool = False, memoize: bool = True) -> CacheHit | None:
         """キャッシュを読み取る。
 
         Args:
             key: キー文字列。
             mode: キャッシュモード。
             allow_incomplete: incompleteエントリの許可。
+            memoize: ディスクから読んだエントリをメモリ上のLRUに保持するか。
 
         Returns:
-            ヒット時の情報。
+            ヒット時の情報。staleなヒットは本文を復元せず、
+            payload は created_at と complete のみを含む。
+        """
+    def put(self, *, key: str, payload: dict[str, Any], complete: bool, memoize: bool = True) -> None:
+        """キャッシュを書き込む。
+
+        Args:
+            key: キー文字列。
+            payload: 保存内容。
+            complete: 完全なエントリか。
+            memoize: メモリ上のLRUにも保持するか。再利用の見込みが低い
+                一時的なエントリではFalseにする。
         """
-    def put(self, *, key: str, payload: dict[str, Any], complete: bool) -> None:
-        """キャッシュを書き込む。"""
+    def delete(self, *, key: str) -> None:
+        """キャッシュエントリを削除する。存在しない場合は何もしない。"""
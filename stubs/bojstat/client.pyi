@@ -1,5 +1,4 @@
 import httpx
-from _typeshed import Incomplete
 from bojstat.cache import FileCache as FileCache
 from bojstat.config import CacheConfig as CacheConfig, ClientConfig as ClientConfig, RetryConfig as RetryConfig
 from bojstat.enums import CacheMode as CacheMode, ConflictResolution as ConflictResolution, ConsistencyMode as ConsistencyMode, Format as Format, Lang as Lang, OutputOrder as OutputOrder
@@ -8,15 +7,13 @@ from bojstat.http import AsyncRateLimiter as AsyncRateLimiter, SyncRateLimiter a
 from bojstat.services.data import AsyncDataService as AsyncDataService, DataService as DataService
 from bojstat.services.metadata import AsyncMetadataService as AsyncMetadataService, MetadataService as MetadataService
 from bojstat.validation import normalize_format as normalize_format, normalize_lang as normalize_lang, validate_strict_auto_split as validate_strict_auto_split
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 class BojClient:
     """日本銀行APIの同期クライアント。"""
-    metadata: Incomplete
-    data: Incomplete
-    errors: Incomplete
-    def __init__(self, *, timeout: float = 30.0, base_url: str = 'https://www.stat-search.boj.or.jp/api/v1', lang: Lang | str = ..., format: Format | str = ..., user_agent: str = 'bojstat/0.1.0', rate_limit_per_sec: float = 1.0, cache_dir: str | Path | None = None, cache_mode: CacheMode | str = ..., cache_ttl: int = ..., strict_api: bool = True, auto_split_codes: bool = False, resolve_wildcard: bool = True, consistency_mode: ConsistencyMode | str = ..., conflict_resolution: ConflictResolution | str = ..., output_order: OutputOrder | str = ..., allow_raw_override: bool = False, metadata_freshness_strict: bool = False, capture_full_response: bool = False, retry_max_attempts: int = 5, retry_transport_max_attempts: int | None = None, retry_base_delay: float = 0.5, retry_cap_delay: float = 8.0, retry_jitter_ratio: float = 1.0, retry_on_403: bool = False, retry_on_403_max_attempts: int = 2, http_client: httpx.Client | None = None, http2: bool = False, proxy: str | None = None, limits: httpx.Limits | None = None) -> None:
+    def __init__(self, *, timeout: float = 30.0, base_url: str = 'https://www.stat-search.boj.or.jp/api/v1', lang: Lang | str = ..., format: Format | str = ..., user_agent: str = 'bojstat/0.1.0', rate_limit_per_sec: float = 1.0, cache_dir: str | Path | None = None, cache_mode: CacheMode | str = ..., cache_ttl: int = ..., cache_fast_write: bool = False, strict_api: bool = True, auto_split_codes: bool = False, resolve_wildcard: bool = True, consistency_mode: ConsistencyMode | str = ..., conflict_resolution: ConflictResolution | str = ..., output_order: OutputOrder | str = ..., allow_raw_override: bool = False, metadata_freshness_strict: bool = False, capture_full_response: bool = False, retry_max_attempts: int = 5, retry_transport_max_attempts: int | None = None, retry_base_delay: float = 0.5, retry_cap_delay: float = 8.0, retry_jitter_ratio: float = 1.0, retry_on_403: bool = False, retry_on_403_max_attempts: int = 2, http_client: httpx.Client | None = None, http2: bool = False, proxy: str | None = None, limits: httpx.Limits | None = None) -> None:
         """クライアントを初期化する。
 
         Args:
@@ -29,6 +26,8 @@ class BojClient:
             cache_dir: キャッシュディレクトリ。
             cache_mode: キャッシュモード。
             cache_ttl: キャッシュTTL秒。
+            cache_fast_write: キャッシュを一時ファイル経由せず直接書き込むか。
+                単一プロセス利用時に高速だが、同時書き込みには安全でない。
             strict_api: 仕様準拠モード。
             auto_split_codes: コード自動分割有効化。
             resolve_wildcard: ワイルドカード階層の自動解決。
@@ -50,6 +49,15 @@ class BojClient:
             proxy: プロキシ。
             limits: httpx接続制御。
         """
+    @cached_property
+    def metadata(self) -> MetadataService:
+        """メタデータAPIサービス（初回アクセス時に生成）。"""
+    @cached_property
+    def data(self) -> DataService:
+        """コードAPI・階層APIサービス（初回アクセス時に生成）。"""
+    @cached_property
+    def errors(self) -> ErrorClassifier:
+        """MESSAGEID分類器（初回アクセス時に生成）。"""
     def close(self) -> None:
         """内部Clientをクローズする。"""
     def __enter__(self) -> BojClient:
@@ -59,11 +67,21 @@ class BojClient:
 
 class AsyncBojClient:
     """日本銀行APIの非同期クライアント。"""
-    metadata: Incomplete
-    data: Incomplete
-    errors: Incomplete
-    def __init__(self, *, timeout: float = 30.0, base_url: str = 'https://www.stat-search.boj.or.jp/api/v1', lang: Lang | str = ..., format: Format | str = ..., user_agent: str = 'bojstat/0.1.0', rate_limit_per_sec: float = 1.0, cache_dir: str | Path | None = None, cache_mode: CacheMode | str = ..., cache_ttl: int = ..., strict_api: bool = True, auto_split_codes: bool = False, resolve_wildcard: bool = True, consistency_mode: ConsistencyMode | str = ..., conflict_resolution: ConflictResolution | str = ..., output_order: OutputOrder | str = ..., allow_raw_override: bool = False, metadata_freshness_strict: bool = False, capture_full_response: bool = False, retry_max_attempts: int = 5, retry_transport_max_attempts: int | None = None, retry_base_delay: float = 0.5, retry_cap_delay: float = 8.0, retry_jitter_ratio: float = 1.0, retry_on_403: bool = False, retry_on_403_max_attempts: int = 2, http_client: httpx.AsyncClient | None = None, http2: bool = False, proxy: str | None = None, limits: httpx.Limits | None = None) -> None:
-        """非同期クライアントを初期化する。"""
+    def __init__(self, *, timeout: float = 30.0, base_url: str = 'https://www.stat-search.boj.or.jp/api/v1', lang: Lang | str = ..., format: Format | str = ..., user_agent: str = 'bojstat/0.1.0', rate_limit_per_sec: float = 1.0, chunk_fetch_concurrency: int = 4, cache_dir: str | Path | None = None, cache_mode: CacheMode | str = ..., cache_ttl: int = ..., cache_fast_write: bool = False, strict_api: bool = True, auto_split_codes: bool = False, resolve_wildcard: bool = True, consistency_mode: ConsistencyMode | str = ..., conflict_resolution: ConflictResolution | str = ..., output_order: OutputOrder | str = ..., allow_raw_override: bool = False, metadata_freshness_strict: bool = False, capture_full_response: bool = False, retry_max_attempts: int = 5, retry_transport_max_attempts: int | None = None, retry_base_delay: float = 0.5, retry_cap_delay: float = 8.0, retry_jitter_ratio: float = 1.0, retry_on_403: bool = False, retry_on_403_max_attempts: int = 2, http_client: httpx.AsyncClient | None = None, http2: bool = False, proxy: str | None = None, limits: httpx.Limits | None = None) -> None:
+        """非同期クライアントを初期化する。
+
+        引数は BojClient と同じ。加えて chunk_fetch_concurrency で、
+        コードAPIの分割チャンクを並行取得する上限を指定できる。
+        """
+    @cached_property
+    def metadata(self) -> AsyncMetadataService:
+        """メタデータAPIサービス（初回アクセス時に生成）。"""
+    @cached_property
+    def data(self) -> AsyncDataService:
+        """コードAPI・階層APIサービス（初回アクセス時に生成）。"""
+    @cached_property
+    def errors(self) -> ErrorClassifier:
+        """MESSAGEID分類器（初回アクセス時に生成）。"""
     async def aclose(self) -> None:
         """内部Clientをクローズする。"""
     async def __aenter__(self) -> AsyncBojClient:
@@ -10,7 +10,7 @@ ERROR_CATALOG_VERSION: str
 DEFAULT_BASE_URL: str
 DEFAULT_USER_AGENT: str
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """再試行設定。
 
@@ -31,7 +31,7 @@ class RetryConfig:
     retry_on_403: bool = ...
     retry_on_403_max_attempts: int = ...
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class CacheConfig:
     """キャッシュ設定。
 
@@ -39,6 +39,7 @@ class CacheConfig:
         mode: キャッシュモード。
         dir: キャッシュディレクトリ。
         ttl_seconds: TTL秒。
+        fast_write: 一時ファイルを介さず直接書き込むか。
         publish_window_start_hour: 更新窓開始時刻（JST時）。
         publish_window_start_minute: 更新窓開始時刻（JST分）。
         publish_window_grace_minutes: 更新窓許容分。
@@ -46,11 +47,12 @@ class CacheConfig:
     mode: CacheMode = ...
     dir: Path | None = ...
     ttl_seconds: int = ...
+    fast_write: bool = ...
     publish_window_start_hour: int = ...
     publish_window_start_minute: int = ...
     publish_window_grace_minutes: int = ...
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ClientConfig:
     """クライアント共通設定。
 
@@ -61,6 +63,7 @@ class ClientConfig:
         format: 出力形式。
         user_agent: User-Agent。
         rate_limit_per_sec: 1秒あたり上限回数。
+        chunk_fetch_concurrency: 非同期コードAPIで並行取得するチャンク数の上限。
         strict_api: 仕様準拠モード。
         auto_split_codes: 自動分割有効化。
         resolve_wildcard: ワイルドカード階層の自動解決。
@@ -78,6 +81,7 @@ class ClientConfig:
     format: Format = ...
     user_agent: str = ...
     rate_limit_per_sec: float = ...
+    chunk_fetch_concurrency: int = ...
     strict_api: bool = ...
     auto_split_codes: bool = ...
     resolve_wildcard: bool = ...
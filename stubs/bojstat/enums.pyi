@@ -10,6 +10,8 @@ class Lang(StrEnum):
     JP = 'JP'
     EN = 'EN'
 
+LANG_BY_VALUE: dict[str, Lang]
+
 class Format(StrEnum):
     """API出力形式を表す列挙型。
 
@@ -20,6 +22,8 @@ class Format(StrEnum):
     JSON = 'JSON'
     CSV = 'CSV'
 
+FORMAT_BY_VALUE: dict[str, Format]
+
 class Frequency(StrEnum):
     """期種を表す列挙型。
 
@@ -42,6 +46,8 @@ class Frequency(StrEnum):
     W = 'W'
     D = 'D'
 
+FREQUENCY_BY_VALUE: dict[str, Frequency]
+
 class DB(StrEnum):
     '''日銀統計DBコードを表す列挙型。
 
@@ -1,9 +1,13 @@
 from bojstat.types import MetadataRecord as MetadataRecord, TimeSeriesRecord as TimeSeriesRecord
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 def normalize_key(key: str) -> str:
-    """キー名揺れを吸収して正規化する。"""
+    """キー名揺れを吸収して正規化する。
+
+    同じキー名が全行で繰り返し現れるため、変換結果を原文キー単位で再利用する。
+    """
 def parse_date_tolerant(raw: str | None) -> tuple[datetime | None, str | None]:
     """DATE文字列を寛容に解析する。
 
@@ -14,7 +18,25 @@ def parse_date_tolerant(raw: str | None) -> tuple[datetime | None, str | None]:
         (解析結果, 警告)。解析成功時は警告None。
     """
 def frequency_code_from_label(label: str | None) -> tuple[str | None, str | None]:
-    """頻度ラベルから頻度コードと週次アンカーを抽出する。"""
+    """頻度ラベルから頻度コードと週次アンカーを抽出する。
+
+    ラベルの種類は少なく全行で繰り返されるため、結果をラベル単位で再利用する。
+    """
+def iter_expand_timeseries_rows(rows: list[dict[str, Any]], *, source_page_index: int, code_order_map: dict[str, int]) -> Iterator[TimeSeriesRecord]:
+    """正規化前行をTimeSeriesRecordへ逐次展開する。
+
+    レコードを一括でリスト化せず生成順に返すため、受け取り側で即座に
+    集約する場合に中間リストを持たずに済む。`code_order_map` はレコード生成時に
+    参照されるため、消費中の更新は以降のレコードへ反映される。
+
+    Args:
+        rows: 正規化前行。
+        source_page_index: 取得ページ番号。
+        code_order_map: 系列コードから入力順序への対応。
+
+    Yields:
+        展開済みレコード。
+    """
 def expand_timeseries_rows(rows: list[dict[str, Any]], *, source_page_index: int, code_order_map: dict[str, int]) -> list[TimeSeriesRecord]:
     """正規化前行をTimeSeriesRecordへ展開する。"""
 def normalize_metadata_rows(rows: list[dict[str, Any]]) -> list[MetadataRecord]:
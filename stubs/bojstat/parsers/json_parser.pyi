@@ -2,11 +2,14 @@ from bojstat.enums import Format as Format
 from bojstat.normalize import normalize_key as normalize_key, parse_date_tolerant as parse_date_tolerant
 from bojstat.types import ParsedResponse as ParsedResponse
 
-def parse_json_response(text: str) -> ParsedResponse:
+def parse_json_response(text: str | bytes) -> ParsedResponse:
     """JSON本文を解析して共通形式へ変換する。
 
+    STATUSが200以外でRESULTSETを含まないエラー応答では、DATEの解析と
+    PARAMETERの展開を省略する（date_parsedはNone、parametersは空）。
+
     Args:
-        text: レスポンステキスト。
+        text: レスポンステキスト。UTF-8のバイト列のままでもよい。
 
     Returns:
         解析結果。
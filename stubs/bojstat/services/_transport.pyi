@@ -12,7 +12,7 @@ def raise_for_api_error(parsed: ParsedResponse, *, request_url: str, capture_ful
     """エラーステータスのとき例外を送出する。"""
 def should_retry_response(*, parsed_status: int, http_status: int, headers: Mapping[str, str], retry_config: RetryConfig, attempt: int) -> bool:
     """レスポンスに対する再試行可否を判定する。"""
-def perform_sync_request(*, client: httpx.Client, endpoint: str, params: dict[str, Any], lang: Lang, format: Format, retry_config: RetryConfig, limiter: SyncRateLimiter, user_agent: str, capture_full_response: bool) -> tuple[ParsedResponse, str, str]:
+def perform_sync_request(*, client: httpx.Client, endpoint: str, params: dict[str, Any], lang: Lang, format: Format, retry_config: RetryConfig, limiter: SyncRateLimiter, user_agent: str, capture_full_response: bool) -> tuple[ParsedResponse, str]:
     """同期GET要求を再試行つきで実行する。"""
-async def perform_async_request(*, client: httpx.AsyncClient, endpoint: str, params: dict[str, Any], lang: Lang, format: Format, retry_config: RetryConfig, limiter: AsyncRateLimiter, user_agent: str, capture_full_response: bool) -> tuple[ParsedResponse, str, str]:
+async def perform_async_request(*, client: httpx.AsyncClient, endpoint: str, params: dict[str, Any], lang: Lang, format: Format, retry_config: RetryConfig, limiter: AsyncRateLimiter, user_agent: str, capture_full_response: bool) -> tuple[ParsedResponse, str]:
     """非同期GET要求を再試行つきで実行する。"""
@@ -4,7 +4,7 @@ from bojstat.config import ClientConfig as ClientConfig, NORMALIZER_VERSION as N
 from bojstat.enums import ConsistencyMode as ConsistencyMode, DB as DB, Format as Format, Frequency as Frequency, Lang as Lang, OutputOrder as OutputOrder
 from bojstat.errors import BojConsistencyError as BojConsistencyError, BojDateParseError as BojDateParseError
 from bojstat.models import MetadataFrame as MetadataFrame, TimeSeriesFrame as TimeSeriesFrame
-from bojstat.normalize import expand_timeseries_rows as expand_timeseries_rows
+from bojstat.normalize import iter_expand_timeseries_rows as iter_expand_timeseries_rows
 from bojstat.pager.code_pager import CodePagerState as CodePagerState, advance_code_position as advance_code_position
 from bojstat.pager.layer_pager import LayerPagerState as LayerPagerState, advance_layer_position as advance_layer_position
 from bojstat.resume import build_request_fingerprint as build_request_fingerprint, create_resume_token as create_resume_token, decode_resume_token as decode_resume_token, validate_resume_token as validate_resume_token
@@ -29,21 +29,3 @@ class AsyncDataService:
         """同期実装互換の非同期版。"""
     async def get_by_layer(self, **kwargs: Any) -> TimeSeriesFrame:
         """同期実装互換の非同期版。"""
-
-class _AsyncBridge:
-    """同期ロジックを非同期トランスポートで再利用する橋渡し。"""
-    def __init__(self, owner: AsyncDataService) -> None: ...
-    async def get_by_code(self, **kwargs: Any) -> TimeSeriesFrame: ...
-    async def get_by_layer(self, **kwargs: Any) -> TimeSeriesFrame: ...
-
-class _AsyncDataWorker:
-    """AsyncDataService実処理。"""
-    def __init__(self, owner: AsyncDataService) -> None: ...
-    async def get_by_code(self, **kwargs: Any) -> TimeSeriesFrame: ...
-    async def get_by_layer(self, **kwargs: Any) -> TimeSeriesFrame: ...
-
-class _DataAsyncLogic:
-    """非同期版の本体ロジック。"""
-    def __init__(self, owner: AsyncDataService) -> None: ...
-    async def get_by_code(self, **kwargs: Any) -> TimeSeriesFrame: ...
-    async def get_by_layer(self, **kwargs: Any) -> TimeSeriesFrame: ...
@@ -6,8 +6,10 @@ import asyncio
 import json
 
 import httpx
+import pytest
 
 from bojstat import AsyncBojClient
+from bojstat.errors import BojBadRequestError
 
 
 def test_async_get_by_layer_basic() -> None:
@@ -57,3 +59,139 @@ def test_async_get_by_layer_basic() -> None:
             assert len(frame.records) == 1
 
     asyncio.run(run())
+
+
+@pytest.mark.parametrize("concurrency", [4, 1])
+def test_async_get_by_code_fetches_chunks_concurrently_and_merges_in_order(concurrency: int) -> None:
+    codes = [f"C{i}@D" for i in range(600)]
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+
+        chunk_codes = request.url.params["CODE"].split(",")
+        start_pos = int(request.url.params.get("STARTPOSITION", "1"))
+        # 先頭チャンクだけ2ページに分ける。
+        paged = chunk_codes[0] == codes[0] and start_pos == 1
+        code = chunk_codes[0] if start_pos == 1 else chunk_codes[1]
+        payload = {
+            "STATUS": 200,
+            "MESSAGEID": "M181000I",
+            "MESSAGE": "ok",
+            "DATE": "2025-12-02T13:13:14.587+09:00",
+            "PARAMETER": {},
+            "NEXTPOSITION": 2 if paged else None,
+            "RESULTSET": [
+                {
+                    "SERIES CODE": code,
+                    "FREQUENCY": "DAILY",
+                    "LAST UPDATE": "20251001",
+                    "VALUES": {"SURVEY DATES": ["20250101"], "VALUES": ["1.0"]},
+                }
+            ],
+        }
+        return httpx.Response(
+            status_code=200,
+            content=json.dumps(payload).encode("utf-8"),
+            request=request,
+        )
+
+    async def run() -> None:
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            base_url="https://example.invalid/api/v1",
+        )
+        async with AsyncBojClient(
+            http_client=http_client,
+            base_url="https://example.invalid/api/v1",
+            strict_api=False,
+            auto_split_codes=True,
+            cache_mode="off",
+            rate_limit_per_sec=1000.0,
+            chunk_fetch_concurrency=concurrency,
+        ) as client:
+            frame = await client.data.get_by_code(db="FM08", code=codes)
+
+        if concurrency > 1:
+            assert in_flight["max"] > 1
+        else:
+            assert in_flight["max"] == 1
+        assert [record.series_code for record in frame.records] == ["C0@D", "C1@D", "C250@D", "C500@D"]
+        assert frame.meta.next_position is None
+        assert "C500%40D" in frame.meta.request_url
+
+    asyncio.run(run())
+
+
+def test_async_get_by_code_checkpoints_later_chunks_when_earlier_chunk_fails(tmp_path) -> None:
+    calls: list[str] = []
+    fail = {"A@M": True}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        code = request.url.params["CODE"]
+        calls.append(code)
+        if fail.get(code):
+            # 後続チャンクのチェックポイントが書かれてから先頭チャンクを失敗させる。
+            for _ in range(1000):
+                if list(tmp_path.rglob("*.cache")):
+                    break
+                await asyncio.sleep(0.001)
+            error = {"STATUS": 400, "MESSAGEID": "M181005E", "MESSAGE": "bad request"}
+            return httpx.Response(status_code=400, json=error, request=request)
+        payload = {
+            "STATUS": 200,
+            "MESSAGEID": "M181000I",
+            "MESSAGE": "ok",
+            "DATE": "2025-12-02T13:13:14.587+09:00",
+            "PARAMETER": {},
+            "NEXTPOSITION": None,
+            "RESULTSET": [
+                {
+                    "SERIES CODE": code,
+                    "FREQUENCY": "MONTHLY" if code == "A@M" else "DAILY",
+                    "LAST UPDATE": "20251001",
+                    "VALUES": {"SURVEY DATES": ["202501"], "VALUES": ["1.0"]},
+                }
+            ],
+        }
+        return httpx.Response(
+            status_code=200,
+            content=json.dumps(payload).encode("utf-8"),
+            request=request,
+        )
+
+    def make_client() -> AsyncBojClient:
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            base_url="https://example.invalid/api/v1",
+        )
+        return AsyncBojClient(
+            http_client=http_client,
+            base_url="https://example.invalid/api/v1",
+            strict_api=False,
+            auto_split_codes=True,
+            cache_dir=tmp_path,
+            rate_limit_per_sec=1000.0,
+        )
+
+    async def run() -> None:
+        async with make_client() as client:
+            with pytest.raises(BojBadRequestError):
+                await client.data.get_by_code(db="FM08", code=["A@M", "B@D"])
+        assert sorted(calls) == ["A@M", "B@D"]
+
+        calls.clear()
+        fail.clear()
+        async with make_client() as client:
+            frame = await client.data.get_by_code(db="FM08", code=["A@M", "B@D"])
+
+        assert calls == ["A@M"]
+        assert [record.series_code for record in frame.records] == ["A@M", "B@D"]
+        chunks = frame.meta.consistency_details["chunks"]
+        assert [(chunk["chunk_index"], chunk["source"]) for chunk in chunks] == [(0, "fetched"), (1, "checkpoint")]
+        assert len(list(tmp_path.rglob("*.cache"))) == 1
+
+    asyncio.run(run())
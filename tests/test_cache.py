@@ -0,0 +1,200 @@
+"""FileCache のテスト。"""
+
+from __future__ import annotations
+
+import gc
+import threading
+from pathlib import Path
+
+import pytest
+
+from bojstat import BojClient
+from bojstat import cache as cache_module
+from bojstat import client as client_module
+from bojstat.cache import FileCache
+from bojstat.enums import CacheMode
+
+
+def test_put_then_get_roundtrip(tmp_path: Path) -> None:
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+    cache.put(key="k", payload={"records": [{"value": "1.0", "名": "値"}]}, complete=True)
+
+    hit = cache.get(key="k", mode=CacheMode.IF_STALE)
+
+    assert hit is not None
+    assert hit.stale is False
+    assert hit.payload["payload"] == {"records": [{"value": "1.0", "名": "値"}]}
+
+
+def test_get_quarantines_broken_file(tmp_path: Path) -> None:
+    FileCache(cache_dir=tmp_path, ttl_seconds=3600).put(key="k", payload={}, complete=True)
+    (path,) = list(tmp_path.iterdir())
+    path.write_bytes(b"{broken")
+
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+    assert cache.get(key="k", mode=CacheMode.IF_STALE) is None
+    assert not path.exists()
+    assert path.with_suffix(path.suffix + ".broken").exists()
+
+
+def test_put_leaves_no_temporary_files(tmp_path: Path) -> None:
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+    cache.put(key="k", payload={"a": 1}, complete=True)
+    cache.put(key="k", payload={"a": 2}, complete=True)
+
+    files = list(tmp_path.iterdir())
+    assert len(files) == 1
+    assert files[0].suffix == ".cache"
+
+
+def test_get_serves_repeated_reads_from_memory(tmp_path: Path) -> None:
+    writer = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+    writer.put(key="k", payload={"a": 1}, complete=True)
+    reader = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+    assert reader.get(key="k", mode=CacheMode.IF_STALE) is not None
+
+    for path in tmp_path.iterdir():
+        path.unlink()
+
+    hit = reader.get(key="k", mode=CacheMode.IF_STALE)
+    assert hit is not None
+    assert hit.payload["payload"] == {"a": 1}
+    assert writer.get(key="k", mode=CacheMode.IF_STALE) is not None
+
+
+def test_clients_with_same_cache_dir_share_file_cache(tmp_path: Path) -> None:
+    with BojClient(cache_dir=tmp_path) as first, BojClient(cache_dir=str(tmp_path)) as second:
+        assert first._cache is second._cache
+    with BojClient(cache_dir=tmp_path, cache_ttl=60) as other_ttl:
+        assert other_ttl._cache is not first._cache
+
+
+def test_shared_file_cache_is_released_with_its_clients(tmp_path: Path) -> None:
+    with BojClient(cache_dir=tmp_path) as client:
+        key = (str(tmp_path.resolve()), client._config.cache.ttl_seconds, False)
+        assert client_module._SHARED_FILE_CACHES.get(key) is client._cache
+    del client
+    gc.collect()
+
+    assert client_module._SHARED_FILE_CACHES.get(key) is None
+
+
+def test_cache_file_name_is_short_base32_digest(tmp_path: Path) -> None:
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+    cache.put(key="api=code|fp=" + "0" * 64, payload={}, complete=True)
+
+    (path,) = list(tmp_path.iterdir())
+    assert len(path.stem) == 26
+    assert path.stem == path.stem.lower()
+
+
+def test_fast_write_roundtrip(tmp_path: Path) -> None:
+    FileCache(cache_dir=tmp_path, ttl_seconds=3600, fast_write=True).put(
+        key="k", payload={"a": 1}, complete=True
+    )
+
+    assert len(list(tmp_path.iterdir())) == 1
+    hit = FileCache(cache_dir=tmp_path, ttl_seconds=3600).get(key="k", mode=CacheMode.IF_STALE)
+    assert hit is not None
+    assert hit.payload["payload"] == {"a": 1}
+
+
+def test_get_marks_entries_older_than_ttl_stale(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=60)
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1_000.0)
+    cache.put(key="k", payload={}, complete=True)
+
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1_059.0)
+    fresh = cache.get(key="k", mode=CacheMode.IF_STALE)
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1_061.0)
+    stale = cache.get(key="k", mode=CacheMode.IF_STALE)
+
+    assert fresh is not None and fresh.stale is False
+    assert stale is not None and stale.stale is True
+
+
+def test_get_skips_incomplete_entry_and_rejects_unknown_header(tmp_path: Path) -> None:
+    FileCache(cache_dir=tmp_path, ttl_seconds=3600).put(key="k", payload={"a": 1}, complete=False)
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+
+    assert cache.get(key="k", mode=CacheMode.IF_STALE) is None
+    hit = cache.get(key="k", mode=CacheMode.IF_STALE, allow_incomplete=True)
+    assert hit is not None
+    assert hit.payload["complete"] is False
+    assert hit.payload["payload"] == {"a": 1}
+
+    (path,) = list(tmp_path.iterdir())
+    path.write_bytes(b'{"created_at":0,"complete":true,"payload":{}}')
+    assert FileCache(cache_dir=tmp_path, ttl_seconds=3600).get(key="k", mode=CacheMode.IF_STALE) is None
+    assert path.with_suffix(path.suffix + ".broken").exists()
+
+
+def test_memo_hits_do_not_share_objects_with_callers(tmp_path: Path) -> None:
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+    payload = {"records": [{"extras": {"OTHER": "x"}}], "meta": {"parameters": {"DB": "FM08"}}}
+    cache.put(key="k", payload=payload, complete=True)
+    payload["records"][0]["extras"]["OTHER"] = "MUTATED"
+
+    first = cache.get(key="k", mode=CacheMode.IF_STALE)
+    assert first is not None
+    first.payload["payload"]["meta"]["parameters"]["DB"] = "MUTATED"
+
+    second = cache.get(key="k", mode=CacheMode.IF_STALE)
+    from_disk = FileCache(cache_dir=tmp_path, ttl_seconds=3600).get(key="k", mode=CacheMode.IF_STALE)
+    assert second is not None and from_disk is not None
+    assert second.payload["payload"] == from_disk.payload["payload"]
+    assert second.payload["payload"]["records"][0]["extras"] == {"OTHER": "x"}
+    assert second.payload["payload"]["meta"]["parameters"] == {"DB": "FM08"}
+
+
+def test_memo_is_bounded_by_total_bytes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache_module, "_MEMO_MAX_BYTES", 64)
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=3600)
+    cache.put(key="a", payload={"v": "x" * 30}, complete=True)
+    cache.put(key="b", payload={"v": "y" * 30}, complete=True)
+    cache.put(key="big", payload={"v": "z" * 100}, complete=True)
+
+    assert list(cache._memo) == ["b"]
+    assert cache._memo_bytes <= 64
+
+
+
+def test_fast_write_get_waits_for_in_progress_write(tmp_path: Path) -> None:
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=3600, fast_write=True)
+    cache.put(key="k", payload={"a": 1}, complete=True)
+    cache._memo.clear()
+    (path,) = list(tmp_path.iterdir())
+    complete_bytes = path.read_bytes()
+    results: list[object] = []
+
+    with cache._lock_for_key("k"):
+        # 書き込み途中を模して本文を切り詰める。
+        path.write_bytes(complete_bytes[:5])
+        reader = threading.Thread(target=lambda: results.append(cache.get(key="k", mode=CacheMode.IF_STALE)))
+        reader.start()
+        reader.join(timeout=0.2)
+        assert reader.is_alive()
+        path.write_bytes(complete_bytes)
+    reader.join()
+
+    (hit,) = results
+    assert hit is not None
+    assert path.exists()
+    assert not path.with_suffix(path.suffix + ".broken").exists()
+
+
+def test_stale_hit_skips_body_decode_and_memo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1_000.0)
+    FileCache(cache_dir=tmp_path, ttl_seconds=60).put(key="k", payload={"a": 1}, complete=True)
+    cache = FileCache(cache_dir=tmp_path, ttl_seconds=60)
+    monkeypatch.setattr(cache_module.time, "time", lambda: 2_000.0)
+
+    def fail_loads(data: bytes | str) -> object:
+        raise AssertionError("stale body must not be decoded")
+
+    monkeypatch.setattr(cache_module._json, "loads", fail_loads)
+    hit = cache.get(key="k", mode=CacheMode.IF_STALE)
+
+    assert hit is not None and hit.stale is True
+    assert "payload" not in hit.payload
+    assert not cache._memo
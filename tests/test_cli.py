@@ -9,6 +9,9 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any
 
+import pytest
+
+from bojstat import _json
 from bojstat.cli import _dump_frame
 from bojstat.models import MetadataFrame
 from bojstat.types import MetadataRecord, ResponseMeta
@@ -66,6 +69,30 @@ def test_dump_frame_json_uses_cache_payload_for_slots_meta(tmp_path: Path) -> No
     assert payload["records"][0]["extras"] == {"note": "x"}
 
 
+class _LongOnlyFrame:
+    def __init__(self, meta: ResponseMeta) -> None:
+        self.meta = meta
+
+    def to_long(self, *, numeric_mode: str = "float64") -> list[dict[str, Any]]:
+        return [{"series_code": "S1", "survey_date": "202501", "value": "1.0"}]
+
+
+def test_dump_frame_json_is_identical_across_json_backends(tmp_path: Path, monkeypatch: Any) -> None:
+    pytest.importorskip("orjson")
+    frame = _LongOnlyFrame(_make_meta())
+    fast_out = tmp_path / "fast.json"
+    stdlib_out = tmp_path / "stdlib.json"
+
+    _dump_frame(frame, fast_out)
+    monkeypatch.setattr(_json, "orjson", None)
+    _dump_frame(frame, stdlib_out)
+
+    fast_payload = json.loads(fast_out.read_text(encoding="utf-8"))
+    stdlib_payload = json.loads(stdlib_out.read_text(encoding="utf-8"))
+    assert fast_payload == stdlib_payload
+    assert fast_payload["meta"]["date_parsed"] == "2025-02-26T10:20:30"
+
+
 class _FakeDataFrame:
     def __init__(self) -> None:
         self._data: dict[str, list[Any]] = {
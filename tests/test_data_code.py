@@ -8,7 +8,7 @@ import httpx
 import pytest
 
 from bojstat import BojClient
-from bojstat.errors import BojPaginationStalledError
+from bojstat.errors import BojBadRequestError, BojPaginationStalledError
 
 
 def _json_response(payload: dict[str, object], request: httpx.Request) -> httpx.Response:
@@ -153,3 +153,167 @@ def test_get_by_code_accepts_year_periods() -> None:
 
     assert frame.meta.status == 200
     assert captured == {"start": "2024", "end": "2025"}
+
+
+def test_page_params_keep_order_and_raw_override() -> None:
+    from bojstat.services.data import _page_params, _tail_params
+
+    head = {"DB": "CO", "CODE": "AAA", "LANG": "JP", "FORMAT": "JSON"}
+    tail = _tail_params(start="202401", end=None, raw={"DB": "FM08", "X": "1"})
+
+    first = _page_params(head, tail, 1)
+    assert list(first.items()) == [
+        ("DB", "FM08"),
+        ("CODE", "AAA"),
+        ("LANG", "JP"),
+        ("FORMAT", "JSON"),
+        ("STARTDATE", "202401"),
+        ("X", "1"),
+    ]
+    later = _page_params(head, tail, 251)
+    assert list(later)[4] == "STARTPOSITION"
+    assert later["STARTPOSITION"] == "251"
+    assert "STARTPOSITION" not in head
+
+
+def test_get_by_code_conflicts_sample_is_bounded() -> None:
+    dates = [f"2024{m:02d}" for m in range(1, 13)] + [f"2025{m:02d}" for m in range(1, 13)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start_pos = int(request.url.params.get("STARTPOSITION", "1"))
+        payload = {
+            "STATUS": 200,
+            "MESSAGEID": "M181000I",
+            "MESSAGE": "ok",
+            "DATE": "2025-12-02T13:13:14.587+09:00",
+            "PARAMETER": {},
+            "NEXTPOSITION": 2 if start_pos == 1 else None,
+            "RESULTSET": [
+                {
+                    "SERIES CODE": "CODE_A",
+                    "FREQUENCY": "MONTHLY",
+                    "LAST UPDATE": "20251001" if start_pos == 1 else "20251101",
+                    "VALUES": {"SURVEY DATES": dates, "VALUES": ["1.0"] * len(dates)},
+                }
+            ],
+        }
+        return _json_response(payload, request)
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://example.invalid/api/v1")
+
+    with BojClient(
+        http_client=http_client,
+        base_url="https://example.invalid/api/v1",
+        cache_mode="off",
+        consistency_mode="best_effort",
+        rate_limit_per_sec=1000.0,
+    ) as client:
+        frame = client.data.get_by_code(db="CO", code=["CODE_A"])
+
+    assert frame.meta.conflicts_count == 24
+    assert len(frame.meta.conflicts_sample) == 20
+    assert frame.meta.conflicts_sample[0]["survey_date"] == "202401"
+
+
+def test_get_by_code_reuses_completed_chunk_checkpoints(tmp_path) -> None:
+    calls: list[str] = []
+    fail = {"B@D": True}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        code = request.url.params["CODE"]
+        calls.append(code)
+        if fail.get(code):
+            error = {"STATUS": 400, "MESSAGEID": "M181005E", "MESSAGE": "bad request"}
+            return httpx.Response(status_code=400, json=error, request=request)
+        payload = {
+            "STATUS": 200,
+            "MESSAGEID": "M181000I",
+            "MESSAGE": "ok",
+            "DATE": "2025-12-02T13:13:14.587+09:00",
+            "PARAMETER": {},
+            "NEXTPOSITION": None,
+            "RESULTSET": [
+                {
+                    "SERIES CODE": code,
+                    "FREQUENCY": "MONTHLY",
+                    "LAST UPDATE": "20251001",
+                    "VALUES": {"SURVEY DATES": ["202501"], "VALUES": ["1.0"]},
+                }
+            ],
+        }
+        return _json_response(payload, request)
+
+    def make_client() -> BojClient:
+        http_client = httpx.Client(
+            transport=httpx.MockTransport(handler),
+            base_url="https://example.invalid/api/v1",
+        )
+        return BojClient(
+            http_client=http_client,
+            base_url="https://example.invalid/api/v1",
+            strict_api=False,
+            auto_split_codes=True,
+            cache_dir=tmp_path,
+            rate_limit_per_sec=1000.0,
+        )
+
+    with make_client() as client, pytest.raises(BojBadRequestError):
+        client.data.get_by_code(db="FM08", code=["A@M", "B@D"])
+    assert calls[0] == "A@M"
+
+    calls.clear()
+    fail.clear()
+    with make_client() as client:
+        frame = client.data.get_by_code(db="FM08", code=["A@M", "B@D"])
+
+    assert calls == ["B@D"]
+    assert [record.series_code for record in frame.records] == ["A@M", "B@D"]
+    assert frame.meta.consistency_signal == "checkpoint_resumed"
+    chunks = frame.meta.consistency_details["chunks"]
+    assert [(chunk["chunk_index"], chunk["source"]) for chunk in chunks] == [(0, "checkpoint"), (1, "fetched")]
+    assert all(chunk["fetched_at"].endswith("+09:00") for chunk in chunks)
+    # 結合結果を保存した後はチャンク単位のチェックポイントが残らない。
+    assert len(list(tmp_path.rglob("*.cache"))) == 1
+
+
+def test_get_by_code_cache_hits_return_independent_frames(tmp_path) -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["CODE"])
+        payload = {
+            "STATUS": 200,
+            "MESSAGEID": "M181000I",
+            "MESSAGE": "ok",
+            "DATE": "2025-12-02T13:13:14.587+09:00",
+            "PARAMETER": {"DB": "FM08"},
+            "NEXTPOSITION": None,
+            "RESULTSET": [
+                {
+                    "SERIES CODE": "A@M",
+                    "FREQUENCY": "MONTHLY",
+                    "LAST UPDATE": "20251001",
+                    "VALUES": {"SURVEY DATES": ["202501"], "VALUES": ["1.0"]},
+                }
+            ],
+        }
+        return _json_response(payload, request)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler), base_url="https://example.invalid/api/v1")
+    with BojClient(
+        http_client=http_client,
+        base_url="https://example.invalid/api/v1",
+        cache_dir=tmp_path,
+        rate_limit_per_sec=1000.0,
+    ) as client:
+        client.data.get_by_code(db="FM08", code="A@M")
+        first = client.data.get_by_code(db="FM08", code="A@M")
+        first.records[0].extras["OTHER"] = "MUTATED"
+        first.meta.parameters["DB"] = "MUTATED"
+        second = client.data.get_by_code(db="FM08", code="A@M")
+
+    assert calls == ["A@M"]
+    assert second is not first
+    assert "OTHER" not in second.records[0].extras
+    assert second.meta.parameters["DB"] == "FM08"
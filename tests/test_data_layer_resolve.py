@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+from datetime import datetime
 from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
 import httpx
 import pytest
@@ -14,7 +17,7 @@ from bojstat.config import ClientConfig
 from bojstat.enums import ConsistencyMode, Frequency, Lang
 from bojstat.errors import BojConsistencyError
 from bojstat.models import MetadataFrame
-from bojstat.services.data import _resolve_codes_from_metadata, _should_resolve_wildcard
+from bojstat.services.data import _resolve_codes_from_metadata, _should_resolve_wildcard, _window_crossed
 from bojstat.types import MetadataRecord, ResponseMeta
 
 
@@ -472,6 +475,34 @@ def test_non_wildcard_uses_layer_api() -> None:
     assert "metadata" not in call_log
 
 
+def test_layer_api_assigns_code_order_to_every_observation() -> None:
+    """初出系列の全観測にコード順序が付与され、系列単位で並ぶこと。"""
+    handler, _ = _make_handler(
+        meta_series=[],
+        code_result=[
+            _make_series("CODE_B", ["202401", "202402"], ["1.0", "2.0"]),
+            _make_series("CODE_A", ["202401", "202402"], ["3.0", "4.0"]),
+        ],
+    )
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://example.invalid/api/v1")
+
+    with BojClient(
+        http_client=http_client,
+        base_url="https://example.invalid/api/v1",
+        cache_mode="off",
+        rate_limit_per_sec=1000.0,
+    ) as client:
+        frame = client.data.get_by_layer(db="BP01", frequency="Q", layer=[1])
+
+    assert [(r.series_code, r.survey_date, r.original_code_index) for r in frame.records] == [
+        ("CODE_B", "202401", 0),
+        ("CODE_B", "202402", 0),
+        ("CODE_A", "202401", 1),
+        ("CODE_A", "202402", 1),
+    ]
+
+
 def test_auto_paginate_false_uses_layer_api() -> None:
     """auto_paginate=False + layer="*" で Layer API が直接使われること。"""
     handler, call_log = _make_handler(
@@ -498,7 +529,7 @@ def test_auto_paginate_false_uses_layer_api() -> None:
     assert "metadata" not in call_log
 
 
-def test_metadata_failure_falls_back_to_layer_api() -> None:
+def test_metadata_failure_falls_back_to_layer_api(caplog: pytest.LogCaptureFixture) -> None:
     """メタデータ取得失敗時に Layer API にフォールバックすること。"""
     call_log: list[str] = []
 
@@ -525,16 +556,18 @@ def test_metadata_failure_falls_back_to_layer_api() -> None:
         rate_limit_per_sec=1000.0,
         retry_max_attempts=1,
     ) as client:
-        with pytest.warns(UserWarning, match="メタデータ取得に失敗"):
+        with caplog.at_level(logging.WARNING, logger="bojstat.services.data"):
             frame = client.data.get_by_layer(
                 db="FF",
                 frequency="Q",
                 layer="*",
             )
 
+    assert "メタデータ取得に失敗" in caplog.text
     assert "metadata" in call_log
     assert "layer" in call_log
     assert len(frame.records) == 1
+    assert frame.meta.consistency_signal == "metadata_unavailable"
 
 
 def test_no_matching_codes_returns_empty_frame() -> None:
@@ -765,6 +798,8 @@ def test_cache_key_separation() -> None:
     assert "resolve_wildcard=True" in key_true
     assert "resolve_wildcard=False" in key_false
     assert "resolve_wildcard" not in key_none
+    assert key_true.endswith("|output_order=canonical|resolve_wildcard=True|fp=fp123")
+    assert key_none.endswith("|output_order=canonical|fp=fp123")
 
 
 def test_cache_put_called_with_layer_key() -> None:
@@ -802,6 +837,17 @@ def test_cache_put_called_with_layer_key() -> None:
     assert len(layer_keys) >= 1
 
 
+def test_window_crossed_uses_jst_wall_clock() -> None:
+    """UNIX秒をJSTの時刻として公表時間帯の跨ぎを判定すること。"""
+    before = datetime(2025, 12, 2, 8, 49, tzinfo=ZoneInfo("Asia/Tokyo")).timestamp()
+    inside = datetime(2025, 12, 2, 8, 50, tzinfo=ZoneInfo("Asia/Tokyo")).timestamp()
+    after = datetime(2025, 12, 2, 10, 21, tzinfo=ZoneInfo("Asia/Tokyo")).timestamp()
+
+    assert _window_crossed(first_fetch=before, current=inside)
+    assert not _window_crossed(first_fetch=inside, current=inside + 60)
+    assert not _window_crossed(first_fetch=before, current=after)
+
+
 def test_window_crossed_strict_raises_before_code_api() -> None:
     """consistency_mode=STRICT + window crossing で Code API 呼出前に例外が送出されること。"""
     handler, call_log = _make_handler(
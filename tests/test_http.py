@@ -0,0 +1,48 @@
+"""HTTP実行補助のテスト。"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bojstat import http
+
+
+def test_sync_rate_limiter_reserves_slots_without_sleeping_under_lock(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(http.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(http.time, "sleep", sleeps.append)
+    limiter = http.SyncRateLimiter(rate_limit_per_sec=10)
+
+    waits = [limiter.acquire() for _ in range(3)]
+
+    assert waits == pytest.approx([0.0, 0.1, 0.2])
+    assert sleeps == pytest.approx([0.1, 0.2])
+
+
+def test_async_rate_limiter_reserves_slots(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(http.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(http.asyncio, "sleep", fake_sleep)
+    limiter = http.AsyncRateLimiter(rate_limit_per_sec=10)
+
+    async def run() -> list[float]:
+        return [await limiter.acquire() for _ in range(3)]
+
+    assert asyncio.run(run()) == pytest.approx([0.0, 0.1, 0.2])
+    assert sleeps == pytest.approx([0.1, 0.2])
+
+
+def test_parse_retry_after_accepts_fractional_seconds_and_http_date() -> None:
+    assert http.parse_retry_after("5") == 5.0
+    assert http.parse_retry_after(" 1.5 ") == 1.5
+    assert http.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    for value in (None, "", "soon", "nan", "inf"):
+        assert http.parse_retry_after(value) is None
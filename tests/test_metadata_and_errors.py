@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 
 import httpx
+import pytest
 
 from bojstat import BojClient
+from bojstat.errors import BojBadRequestError
 
 
 def test_metadata_get_and_find() -> None:
@@ -140,3 +142,67 @@ def test_json_error_raised_on_bad_request() -> None:
             assert "DB名" in str(exc)
 
     assert raised
+
+
+def test_capture_full_response_keeps_body_on_error() -> None:
+    payload = {
+        "STATUS": 400,
+        "MESSAGEID": "M181005E",
+        "MESSAGE": "DB名が正しくありません。",
+        "DATE": "2025-12-02T14:00:36.836+09:00",
+    }
+    body = json.dumps(payload, ensure_ascii=False)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code=200,
+            content=body.encode("utf-8"),
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://example.invalid/api/v1")
+
+    with BojClient(
+        http_client=http_client,
+        base_url="https://example.invalid/api/v1",
+        cache_mode="off",
+        rate_limit_per_sec=1000.0,
+        capture_full_response=True,
+    ) as client, pytest.raises(BojBadRequestError) as exc_info:
+        client.metadata.get(db="FM08")
+
+    assert exc_info.value.context.raw_response == body
+
+
+def test_error_without_capture_keeps_only_excerpt() -> None:
+    payload = {
+        "STATUS": 400,
+        "MESSAGEID": "M181005E",
+        "MESSAGE": "DB名が正しくありません。",
+        "DATE": "2025-12-02T14:00:36.836+09:00",
+    }
+    body = json.dumps(payload, ensure_ascii=False)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code=200,
+            content=body.encode("utf-8"),
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://example.invalid/api/v1")
+
+    with BojClient(
+        http_client=http_client,
+        base_url="https://example.invalid/api/v1",
+        cache_mode="off",
+        rate_limit_per_sec=1000.0,
+    ) as client, pytest.raises(BojBadRequestError) as exc_info:
+        client.metadata.get(db="FM08")
+
+    assert exc_info.value.context.raw_response is None
+    assert exc_info.value.context.raw_response_excerpt == body
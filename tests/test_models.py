@@ -0,0 +1,105 @@
+"""返却モデルのテスト。"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from bojstat.models import MetadataFrame, TimeSeriesFrame
+from bojstat.normalize import normalize_metadata_rows
+from bojstat.types import ResponseMeta, TimeSeriesRecord
+
+
+def _meta() -> ResponseMeta:
+    return ResponseMeta(
+        status=200,
+        message_id="M181000I",
+        message="ok",
+        date_raw=None,
+        date_parsed=None,
+        date_parse_warning=None,
+        date_semantics="output_time",
+        next_position=None,
+        parameters={},
+        request_url="https://example.test",
+        schema_version="1",
+        parser_version="1",
+        normalizer_version="1",
+    )
+
+
+def _record(code: str, survey_date: str, value: str | None) -> TimeSeriesRecord:
+    return TimeSeriesRecord(
+        series_code=code,
+        series_name=None,
+        unit=None,
+        frequency=None,
+        frequency_code=None,
+        week_anchor=None,
+        category=None,
+        last_update=None,
+        survey_date=survey_date,
+        value=Decimal(value) if value is not None else None,
+        original_code_index=None,
+        source_page_index=0,
+        source_row_index=0,
+    )
+
+
+def test_to_wide_groups_by_survey_date_in_order() -> None:
+    frame = TimeSeriesFrame(
+        records=[
+            _record("A", "202402", "2"),
+            _record("A", "202401", "1"),
+            _record("B", "202401", None),
+        ],
+        meta=_meta(),
+    )
+
+    assert frame.to_wide() == [
+        {"survey_date": "202401", "A": 1.0, "B": None},
+        {"survey_date": "202402", "A": 2.0},
+    ]
+
+
+def test_metadata_cache_payload_roundtrip_copies_extras() -> None:
+    records = normalize_metadata_rows([{"SERIES_CODE": "A", "LAYER1": "1", "OTHER": "x"}])
+    frame = MetadataFrame(records=records, meta=_meta())
+
+    payload = frame.to_cache_payload()
+    payload["records"][0]["extras"]["OTHER"] = "changed"
+
+    assert records[0].extras == {"OTHER": "x"}
+    restored = MetadataFrame.from_cache_payload(frame.to_cache_payload())
+    assert restored.records == records
+    assert restored.meta == frame.meta
+
+
+def test_to_long_string_mode_uses_fixed_point() -> None:
+    frame = TimeSeriesFrame(
+        records=[_record("A", "202401", "1.50"), _record("A", "202402", "1E+3")],
+        meta=_meta(),
+    )
+
+    assert [row["value"] for row in frame.to_long(numeric_mode="string")] == ["1.50", "1000"]
+
+
+def test_to_pandas_matches_long_records() -> None:
+    pd = pytest.importorskip("pandas")
+    frame = TimeSeriesFrame(
+        records=[_record("A", "202401", "1.5"), _record("B", "202401", None)],
+        meta=_meta(),
+    )
+
+    empty = TimeSeriesFrame(records=[], meta=_meta())
+
+    for mode in ("float64", "decimal", "string"):
+        pd.testing.assert_frame_equal(
+            frame.to_pandas(numeric_mode=mode),
+            pd.DataFrame(frame.to_long(numeric_mode=mode)),
+        )
+        pd.testing.assert_frame_equal(
+            empty.to_pandas(numeric_mode=mode),
+            pd.DataFrame(empty.to_long(numeric_mode=mode)),
+        )
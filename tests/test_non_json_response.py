@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import httpx
+import pytest
 
 from bojstat import BojClient, BojGatewayError
 
@@ -80,3 +81,30 @@ def test_html_500_retries_and_then_succeeds() -> None:
 
     assert frame.meta.status == 200
     assert state["calls"] == 2
+
+
+def test_unparseable_excerpt_uses_response_charset() -> None:
+    """解析不能応答の抜粋が応答charsetでデコードされ、先頭2048文字に収まることを確認する。"""
+
+    html = "<html><body>" + "不正な要求です。" * 1000 + "</body></html>"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code=400,
+            content=html.encode("shift_jis"),
+            headers={"content-type": "text/html; charset=shift_jis"},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://example.invalid/api/v1")
+
+    with BojClient(
+        http_client=http_client,
+        base_url="https://example.invalid/api/v1",
+        cache_mode="off",
+        rate_limit_per_sec=1000.0,
+    ) as client, pytest.raises(BojGatewayError) as exc_info:
+        client.metadata.get(db="FM08")
+
+    assert exc_info.value.context.raw_response_excerpt == html[:2048]
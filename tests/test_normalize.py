@@ -0,0 +1,112 @@
+"""normalize モジュールのテスト。"""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+from bojstat.normalize import (
+    _decimal_or_none,
+    expand_timeseries_rows,
+    frequency_code_from_label,
+    normalize_key,
+    normalize_metadata_rows,
+)
+
+
+def test_normalize_key_absorbs_separator_and_case_variants() -> None:
+    assert normalize_key(" Series Code ") == "SERIES_CODE"
+    assert normalize_key("SERIESCODE") == "SERIES_CODE"
+    assert normalize_key("name_of time series j") == "NAME_OF_TIME_SERIES_J"
+    assert normalize_key("Survey Dates") == "SURVEY_DATES"
+    assert normalize_key("layer 1") == "LAYER_1"
+    assert normalize_key("Next Position") == "NEXT_POSITION"
+
+
+def test_frequency_code_from_label() -> None:
+    assert frequency_code_from_label("ANNUAL") == ("CY", None)
+    assert frequency_code_from_label("ANNUAL(MAR)") == ("FY", None)
+    assert frequency_code_from_label("Annual (Mar)") == ("FY", None)
+    assert frequency_code_from_label("SEMIANNUAL") == ("CH", None)
+    assert frequency_code_from_label("SEMIANNUAL(SEP)") == ("FH", None)
+    assert frequency_code_from_label("QUARTERLY") == ("Q", None)
+    assert frequency_code_from_label("WEEKLY(MONDAY)") == ("W", "MONDAY")
+    assert frequency_code_from_label("DAILY") == ("D", None)
+    assert frequency_code_from_label("") == (None, None)
+    assert frequency_code_from_label("UNKNOWN") == (None, None)
+
+
+def test_decimal_or_none_rejects_non_numeric_cells() -> None:
+    assert _decimal_or_none(" -1.50 ") == Decimal("-1.50")
+    assert _decimal_or_none("2.") == Decimal(2)
+    assert _decimal_or_none("1E+3") == Decimal("1E+3")
+    for cell in (None, "", "null", "NULL", "-", "N/A", "1,000"):
+        assert _decimal_or_none(cell) is None
+
+
+def test_expand_timeseries_rows_splits_fields_and_extras() -> None:
+    rows = [
+        {
+            "SERIES CODE": "AAA",
+            "NAME_OF_TIME_SERIES_J": None,
+            "NAME_OF_TIME_SERIES": "english",
+            "FREQUENCY": "MONTHLY",
+            "SURVEY_DATES": "202401",
+            "VALUES": "1.5",
+            "EXTRA_FIELD": "x",
+        }
+    ]
+
+    (record,) = expand_timeseries_rows(rows, source_page_index=0, code_order_map={"AAA": 3})
+
+    assert record.series_code == "AAA"
+    # _J キーが存在すれば値がNoneでも優先される。
+    assert record.series_name is None
+    assert record.frequency_code == "M"
+    assert record.survey_date == "202401"
+    assert str(record.value) == "1.5"
+    assert record.original_code_index == 3
+    assert record.extras == {"EXTRA_FIELD": "x"}
+
+
+def test_expand_timeseries_rows_nested_keeps_row_level_survey_dates_in_extras() -> None:
+    rows = [
+        {
+            "SERIES_CODE": "AAA",
+            "SURVEY_DATES": "ignored",
+            "VALUES": {"SURVEY DATES": ["202401", "202402"], "VALUES": ["1"]},
+            "EXTRA_FIELD": "x",
+        }
+    ]
+
+    records = expand_timeseries_rows(rows, source_page_index=1, code_order_map={})
+
+    assert [r.survey_date for r in records] == ["202401", "202402"]
+    assert records[1].value is None
+    assert records[0].extras == {"SURVEY_DATES": "ignored", "EXTRA_FIELD": "x"}
+    assert records[0].extras is not records[1].extras
+
+
+def test_normalize_metadata_rows_splits_fields_and_extras() -> None:
+    rows = [{"SERIES_CODE": " AAA ", "LAYER1": 1, "NOTES": "n", "OTHER": "o"}]
+
+    (record,) = normalize_metadata_rows(rows)
+
+    assert record.series_code == "AAA"
+    assert record.layer1 == "1"
+    assert record.layer2 is None
+    assert record.notes == "n"
+    assert record.extras == {"OTHER": "o"}
+
+
+def test_expand_timeseries_rows_shares_repeated_label_strings() -> None:
+    # JSON復元と同様に、行ごとに別の文字列オブジェクトを持たせる。
+    row = '{"SERIES_CODE": "AAA", "UNIT": "億円", "FREQUENCY": "MONTHLY", "VALUES": "1"'
+    rows = [json.loads(f'{row}, "SURVEY_DATES": "{date}"}}') for date in ("202401", "202402")]
+    assert rows[0]["UNIT"] is not rows[1]["UNIT"]
+
+    first, second = expand_timeseries_rows(rows, source_page_index=0, code_order_map={})
+
+    assert first.unit == "億円"
+    assert first.unit is second.unit
+    assert first.frequency is second.frequency
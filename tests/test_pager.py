@@ -0,0 +1,33 @@
+"""ページャのテスト。"""
+
+from __future__ import annotations
+
+import pytest
+
+from bojstat.errors import BojPaginationStalledError
+from bojstat.pager import (
+    CodePagerState,
+    LayerPagerState,
+    advance_code_position,
+    advance_layer_position,
+)
+
+
+def test_advance_code_position() -> None:
+    state = CodePagerState(chunk_index=3, start_position=1)
+    assert advance_code_position(state=state, next_position=None) is False
+    assert advance_code_position(state=state, next_position=251) is True
+    assert state.start_position == 251
+    with pytest.raises(BojPaginationStalledError) as exc_info:
+        advance_code_position(state=state, next_position=251)
+    assert exc_info.value.chunk_index == 3
+    assert state.start_position == 251
+
+
+def test_advance_layer_position() -> None:
+    state = LayerPagerState()
+    assert advance_layer_position(state=state, next_position=None) is False
+    assert advance_layer_position(state=state, next_position=2) is True
+    assert state.start_position == 2
+    with pytest.raises(BojPaginationStalledError):
+        advance_layer_position(state=state, next_position=1)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 
 from bojstat.enums import Format, Lang
-from bojstat.parsers import parse_response
+from bojstat.parsers import decode_response_bytes, parse_response
 from bojstat.parsers.csv_parser import parse_csv_response
 from bojstat.parsers.json_parser import parse_json_response
 
@@ -34,6 +34,29 @@ def test_parse_json_nested_values() -> None:
     assert len(parsed.rows) == 1
 
 
+def test_parse_json_resultset_keeps_only_objects() -> None:
+    payload = {"STATUS": 200, "RESULTSET": [{"SERIES CODE": "AAA"}, None, "x", [1], {"SERIES CODE": "BBB"}]}
+    parsed = parse_json_response(json.dumps(payload))
+    assert parsed.rows == [{"SERIES CODE": "AAA"}, {"SERIES CODE": "BBB"}]
+
+
+def test_parse_json_error_body_skips_date_and_parameters() -> None:
+    payload = {
+        "STATUS": 400,
+        "MESSAGEID": "M181005E",
+        "MESSAGE": "DB名が正しくありません。",
+        "DATE": "2025-12-02T14:00:36.836+09:00",
+        "PARAMETER": {"DB": "XX"},
+    }
+    parsed = parse_json_response(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    assert parsed.status == 400
+    assert parsed.message_id == "M181005E"
+    assert parsed.date_raw == "2025-12-02T14:00:36.836+09:00"
+    assert parsed.date_parsed is None
+    assert parsed.parameters == {}
+    assert parsed.rows == []
+
+
 def test_parse_csv_blank_next_position() -> None:
     csv_text = "\n".join(
         [
@@ -52,6 +75,57 @@ def test_parse_csv_blank_next_position() -> None:
     assert parsed.rows[0]["SERIES_CODE"] == "AAA"
 
 
+def test_parse_csv_header_rows_dispatch() -> None:
+    csv_text = (
+        "STATUS,200\n"
+        "MESSAGEID,M181000I\n"
+        "MESSAGE,ok\n"
+        "DATE,2025-12-02T13:13:14.587+09:00\n"
+        "PARAMETER,DB,CO\n"
+        "PARAMETER,CODE,\n"
+        "NEXTPOSITION,2\n"
+        "DB,CO\n"
+        "SERIES_CODE,SURVEY_DATES,VALUES\n"
+        "AAA,202401,1.0\n"
+    )
+    parsed = parse_csv_response(csv_text)
+    assert parsed.status == 200
+    assert parsed.message_id == "M181000I"
+    assert parsed.message == "ok"
+    assert parsed.date_parsed is not None
+    assert parsed.parameters == {"DB": "CO", "CODE": None}
+    assert parsed.next_position == 2
+    assert parsed.db == "CO"
+    assert parsed.rows == [{"SERIES_CODE": "AAA", "SURVEY_DATES": "202401", "VALUES": "1.0"}]
+
+
+def test_parse_csv_data_rows_pad_truncate_and_skip_blank_header() -> None:
+    csv_text = (
+        "STATUS,200\n"
+        "SERIES_CODE,,SURVEY_DATES,VALUES\n"
+        "AAA,x,202401\n"
+        "BBB,y,202402,2.0,extra\n"
+    )
+    parsed = parse_csv_response(csv_text)
+    assert parsed.rows == [
+        {"SERIES_CODE": "AAA", "SURVEY_DATES": "202401", "VALUES": ""},
+        {"SERIES_CODE": "BBB", "SURVEY_DATES": "202402", "VALUES": "2.0"},
+    ]
+
+
+def test_parse_csv_skips_blank_rows_but_keeps_quoted_newlines() -> None:
+    csv_text = (
+        "STATUS,200\n"
+        "\n"
+        " , ,\n"
+        "SERIES_CODE,NAME_OF_TIME_SERIES_J\n"
+        '"AAA"," 系列\n\n続き "\n'
+        "\r\n"
+    )
+    parsed = parse_csv_response(csv_text)
+    assert parsed.rows == [{"SERIES_CODE": "AAA", "NAME_OF_TIME_SERIES_J": "系列\n\n続き"}]
+
+
 def test_parse_response_prefers_json_error_even_if_csv_requested() -> None:
     payload = {
         "STATUS": 400,
@@ -66,3 +140,38 @@ def test_parse_response_prefers_json_error_even_if_csv_requested() -> None:
     )
     assert parsed.format == Format.JSON
     assert parsed.status == 400
+
+
+def test_parse_response_sniffs_json_after_leading_whitespace_and_bad_utf8() -> None:
+    body = b'\r\n  {"STATUS": 200, "MESSAGEID": "M181000I", "MESSAGE": "ok\xff"}\n'
+
+    parsed = parse_response(body, requested_format=Format.CSV, lang=Lang.JP)
+
+    assert parsed.format == Format.JSON
+    assert parsed.status == 200
+    assert parsed.message == "ok\ufffd"
+    assert parsed.raw_response_excerpt.startswith("{")
+
+
+def test_parse_json_response_accepts_bytes() -> None:
+    payload = {
+        "STATUS": 200,
+        "MESSAGEID": "M181000I",
+        "MESSAGE": "正常に終了しました。",
+        "DATE": "2025-12-02T13:13:14.587+09:00",
+        "PARAMETER": {"DB": "CO"},
+        "NEXTPOSITION": None,
+        "RESULTSET": [],
+    }
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    parsed = parse_json_response(body)
+
+    assert parsed.message == "正常に終了しました。"
+    assert parsed.raw_response_excerpt == body.decode("utf-8")
+
+
+def test_decode_response_bytes_handles_ascii_and_shift_jis() -> None:
+    assert decode_response_bytes(b"STATUS,200\r\n", lang=Lang.JP) == "STATUS,200\r\n"
+    assert decode_response_bytes("短観".encode("shift_jis"), lang=Lang.JP) == "短観"
+    assert decode_response_bytes("短観".encode(), lang=Lang.EN) == "短観"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import json
 
 import httpx
@@ -10,10 +11,12 @@ import pytest
 from bojstat import BojClient
 from bojstat.config import NORMALIZER_VERSION, PARSER_VERSION, SCHEMA_VERSION
 from bojstat.errors import BojResumeTokenMismatchError
-from bojstat.resume import create_resume_token
+from bojstat.resume import create_resume_token, decode_resume_token
 
 
 def test_resume_token_mismatch_detected_before_request() -> None:
+    """不整合な resume_token は要求送信前に検出されること。"""
+
     called = {"n": 0}
 
     def handler(request: httpx.Request) -> httpx.Response:
@@ -60,3 +63,29 @@ def test_resume_token_mismatch_detected_before_request() -> None:
             client.data.get_by_code(db="CO", code=["AAA"], resume_token=token)
 
     assert called["n"] == 0
+
+
+def test_resume_token_is_urlsafe_base64_compatible() -> None:
+    """resume_token がURL安全なbase64で、従来形式のトークンも復元できること。"""
+
+    token = create_resume_token(
+        api="code",
+        api_origin="https://example.invalid/api/v1",
+        request_fingerprint="dummy",
+        chunk_index=1,
+        next_position=2,
+        lang="JP",
+        format="JSON",
+        parser_version=PARSER_VERSION,
+        normalizer_version=NORMALIZER_VERSION,
+        schema_version=SCHEMA_VERSION,
+        code_order_map={"系列?>": 0},
+    )
+    assert "+" not in token
+    assert "/" not in token
+    assert json.loads(base64.urlsafe_b64decode(token))["code_order_map"] == {"系列?>": 0}
+
+    legacy = base64.urlsafe_b64encode(base64.urlsafe_b64decode(token)).decode("ascii")
+    state = decode_resume_token(legacy)
+    assert state.chunk_index == 1
+    assert state.code_order_map == {"系列?>": 0}
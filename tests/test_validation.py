@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import pytest
 
-from bojstat.enums import DB
+from bojstat.enums import DB, Frequency
 from bojstat.errors import BojValidationError
 from bojstat.validation import (
     normalize_code_periods,
     normalize_db,
+    normalize_frequency,
     normalize_lang,
     split_codes_by_frequency_and_size,
     validate_outbound_text,
@@ -21,6 +22,13 @@ def test_normalize_lang_case_insensitive() -> None:
     assert normalize_lang("En").value == "EN"
 
 
+def test_normalize_frequency_lookup_and_invalid() -> None:
+    assert normalize_frequency(" m ", required=True) is Frequency.M
+    with pytest.raises(BojValidationError) as exc_info:
+        normalize_frequency("X", required=True)
+    assert exc_info.value.validation_code == "invalid_frequency"
+
+
 def test_validate_outbound_text_rejects_full_width() -> None:
     with pytest.raises(BojValidationError):
         validate_outbound_text("テスト", param_name="DB")